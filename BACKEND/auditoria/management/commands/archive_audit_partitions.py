@@ -0,0 +1,102 @@
+# auditoria/management/commands/archive_audit_partitions.py
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from auditoria import partitions
+from auditoria.models import LogAuditoria
+
+
+class Command(BaseCommand):
+    help = (
+        'Archiva las particiones de LogAuditoria más antiguas que la retención en archivos '
+        'JSONL comprimidos (los detalles siguen cifrados) y luego las desacopla.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retention-months', type=int, default=settings.AUDIT_RETENTION_MONTHS,
+                            help='Meses completos que se conservan en la base de datos.')
+        parser.add_argument('--output-dir', default=settings.AUDIT_ARCHIVE_DIR,
+                            help='Directorio de destino de los archivos .jsonl.gz.')
+        parser.add_argument('--drop', action='store_true',
+                            help='Elimina la tabla tras desacoplarla (por defecto queda como tabla suelta).')
+        parser.add_argument('--dry-run', action='store_true', help='Solo lista las particiones a archivar.')
+
+    def handle(self, *args, **options):
+        if not partitions.is_partitioned():
+            raise CommandError('LogAuditoria no está particionada (requiere PostgreSQL y la migración auditoria 0005).')
+
+        cutoff = partitions.add_months(partitions.month_start(timezone.now()), -options['retention_months'])
+        candidates = [p for p in partitions.list_partitions() if p[2] <= cutoff]
+        if not candidates:
+            self.stdout.write('No hay particiones anteriores a la retención.')
+            return
+
+        output_dir = Path(options['output_dir'])
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for name, start, end in candidates:
+            if options['dry_run']:
+                self.stdout.write(f'[dry-run] {name} ({start:%Y-%m})')
+                continue
+            rows, digest, path = self.archive_partition(name, output_dir)
+            self.write_manifest(path, name, start, end, rows, digest)
+            partitions.detach_partition(name, drop=options['drop'])
+            action = 'eliminada' if options['drop'] else 'desacoplada'
+            self.stdout.write(self.style.SUCCESS(f'{name}: {rows} filas -> {path.name} ({action})'))
+
+    def archive_partition(self, name, output_dir):
+        """Vuelca la partición con un cursor de servidor; escribe a un .part y renombra al terminar."""
+        qn = connection.ops.quote_name
+        columns = [field.column for field in LogAuditoria._meta.concrete_fields]
+        path = output_dir / f'{name}.jsonl.gz'
+        tmp_path = output_dir / f'{name}.jsonl.gz.part'
+
+        rows = 0
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(f'SELECT count(*) FROM {qn(name)}')
+                expected = cursor.fetchone()[0]
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as out, connection.chunked_cursor() as cursor:
+                cursor.execute(
+                    f"SELECT {', '.join(qn(c) for c in columns)} FROM {qn(name)} ORDER BY fecha_accion, id"
+                )
+                while True:
+                    batch = cursor.fetchmany(2000)
+                    if not batch:
+                        break
+                    for row in batch:
+                        out.write(json.dumps(dict(zip(columns, row)), default=str, ensure_ascii=False))
+                        out.write('\n')
+                    rows += len(batch)
+
+        if rows != expected:
+            tmp_path.unlink(missing_ok=True)
+            raise CommandError(f'{name}: se archivaron {rows} filas de {expected}; no se desacopla.')
+
+        digest = hashlib.sha256()
+        with open(tmp_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return rows, digest.hexdigest(), path
+
+    def write_manifest(self, path, name, start, end, rows, digest):
+        manifest = {
+            'particion': name,
+            'desde': start.isoformat(),
+            'hasta': end.isoformat(),
+            'filas': rows,
+            'archivo': path.name,
+            'sha256': digest,
+            'archivado_en': timezone.now().isoformat(),
+        }
+        with open(path.with_name(f'{name}.manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
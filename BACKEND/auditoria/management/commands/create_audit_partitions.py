@@ -0,0 +1,27 @@
+# auditoria/management/commands/create_audit_partitions.py
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from auditoria import partitions
+
+
+class Command(BaseCommand):
+    help = 'Crea las particiones mensuales de LogAuditoria del mes actual y los siguientes (ejecutar periódicamente).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=settings.AUDIT_PARTITION_MONTHS_AHEAD,
+                            help='Meses futuros a preparar además del actual.')
+
+    def handle(self, *args, **options):
+        if not partitions.is_partitioned():
+            raise CommandError('LogAuditoria no está particionada (requiere PostgreSQL y la migración auditoria 0005).')
+
+        current = partitions.month_start(timezone.now())
+        for offset in range(options['months_ahead'] + 1):
+            start = partitions.add_months(current, offset)
+            name = partitions.partition_name(start)
+            if partitions.ensure_partition(start):
+                self.stdout.write(self.style.SUCCESS(f'Creada {name}'))
+            else:
+                self.stdout.write(f'{name} ya existe')
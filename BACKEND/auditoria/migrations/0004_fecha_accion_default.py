@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auditoria', '0003_logauditoria_log_fecha_accion_id_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='logauditoria',
+            name='fecha_accion',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:02
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auditoria', '0005_partition_logauditoria'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='logauditoria',
+            name='accion',
+            field=models.CharField(max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='logauditoria',
+            name='fecha_accion',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AlterField(
+            model_name='logauditoria',
+            name='registro_id_uuid',
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='logauditoria',
+            name='tabla_afectada',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='logauditoria',
+            name='usuario',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='logs_auditoria', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='logauditoria',
+            index=models.Index(fields=['usuario', 'fecha_accion'], name='log_usuario_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='logauditoria',
+            index=models.Index(fields=['accion', 'fecha_accion'], name='log_accion_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='logauditoria',
+            index=models.Index(fields=['tabla_afectada', 'registro_id_uuid', 'fecha_accion'], name='log_tabla_registro_fecha_idx'),
+        ),
+    ]
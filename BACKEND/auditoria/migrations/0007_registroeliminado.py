@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:07
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auditoria', '0006_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegistroEliminado',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tabla', models.CharField(max_length=100)),
+                ('registro_id', models.UUIDField()),
+                ('fecha_eliminacion', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Registro Eliminado',
+                'verbose_name_plural': 'Registros Eliminados',
+                'db_table': 'RegistroEliminado',
+                'indexes': [models.Index(fields=['tabla', 'fecha_eliminacion'], name='eliminado_tabla_fecha_idx')],
+            },
+        ),
+    ]
@@ -1,18 +1,21 @@
 # auditoria/models.py
 from django.db import models
+from django.utils import timezone
 import uuid
 from core.utils.security_utils import encrypt_data, decrypt_data
 from usuarios.models import Usuario # Importar de la app 'usuarios'
 
 class LogAuditoria(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    usuario = models.ForeignKey(Usuario, on_delete=models.SET_NULL, related_name='logs_auditoria', null=True, blank=True)
-    accion = models.CharField(max_length=255, db_index=True)
-    tabla_afectada = models.CharField(max_length=100, blank=True, null=True, db_index=True)
-    registro_id_uuid = models.UUIDField(blank=True, null=True, db_index=True)
+    # Sin índices de una sola columna: los cubren los índices compuestos de Meta.
+    usuario = models.ForeignKey(Usuario, on_delete=models.SET_NULL, related_name='logs_auditoria', null=True, blank=True, db_index=False)
+    accion = models.CharField(max_length=255)
+    tabla_afectada = models.CharField(max_length=100, blank=True, null=True)
+    registro_id_uuid = models.UUIDField(blank=True, null=True)
     detalles = models.TextField(blank=True, null=True) # Cifrado
     ip_usuario = models.CharField(max_length=45, blank=True, null=True)
-    fecha_accion = models.DateTimeField(auto_now_add=True, db_index=True)
+    # default (no auto_now_add): el escritor en lote conserva la hora de la acción
+    fecha_accion = models.DateTimeField(default=timezone.now)
 
     _plain_detalles = None
 
@@ -21,6 +24,14 @@ class LogAuditoria(models.Model):
         verbose_name = 'Log de Auditoría'
         verbose_name_plural = 'Logs de Auditoría'
         ordering = ['-fecha_accion']
+        indexes = [
+            # Paginación keyset (fecha_accion, id)
+            models.Index(fields=['fecha_accion', 'id'], name='log_fecha_accion_id_idx'),
+            # Filtros del API de auditoría (igualdad + rango de fechas)
+            models.Index(fields=['usuario', 'fecha_accion'], name='log_usuario_fecha_idx'),
+            models.Index(fields=['accion', 'fecha_accion'], name='log_accion_fecha_idx'),
+            models.Index(fields=['tabla_afectada', 'registro_id_uuid', 'fecha_accion'], name='log_tabla_registro_fecha_idx'),
+        ]
 
     def set_detalles(self, value): self._plain_detalles = value
 
@@ -35,4 +46,23 @@ class LogAuditoria(models.Model):
 
     def __str__(self):
         user_str = self.usuario.username if self.usuario else "Usuario Desconocido"
-        return f"{user_str} - {self.accion} - {self.fecha_accion.strftime('%Y-%m-%d %H:%M')}"
\ No newline at end of file
+        return f"{user_str} - {self.accion} - {self.fecha_accion.strftime('%Y-%m-%d %H:%M')}"
+
+class RegistroEliminado(models.Model):
+    """
+    Lápida de un registro clínico borrado, para la sincronización incremental
+    (?updated_since=). La crea core.sync en post_delete.
+    """
+    tabla = models.CharField(max_length=100)
+    registro_id = models.UUIDField()
+    fecha_eliminacion = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'RegistroEliminado'
+        verbose_name = 'Registro Eliminado'
+        verbose_name_plural = 'Registros Eliminados'
+        indexes = [
+            models.Index(fields=['tabla', 'fecha_eliminacion'], name='eliminado_tabla_fecha_idx'),
+        ]
+
+    def __str__(self): return f"{self.tabla} {self.registro_id} eliminado {self.fecha_eliminacion:%Y-%m-%d %H:%M}"
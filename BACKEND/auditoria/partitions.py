@@ -0,0 +1,123 @@
+# auditoria/partitions.py
+"""
+Particionado mensual por rango de LogAuditoria.fecha_accion (solo PostgreSQL).
+
+Cada mes vive en una tabla "LogAuditoria_pAAAA_MM" con límites
+[día 1 00:00 UTC, día 1 del mes siguiente). "LogAuditoria_default" recibe
+filas fuera de los rangos creados para que un INSERT nunca falle.
+"""
+import datetime
+import re
+
+from django.db import connection, transaction
+
+from .models import LogAuditoria
+
+PARENT_TABLE = LogAuditoria._meta.db_table
+DEFAULT_PARTITION = f'{PARENT_TABLE}_default'
+_PARTITION_RE = re.compile(rf'^{PARENT_TABLE}_p(\d{{4}})_(\d{{2}})$')
+
+
+def month_start(value):
+    value = value.astimezone(datetime.timezone.utc) if value.tzinfo else value.replace(tzinfo=datetime.timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(value, months):
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1, day=1)
+
+
+def partition_name(start):
+    return f'{PARENT_TABLE}_p{start.year:04d}_{start.month:02d}'
+
+
+def is_supported():
+    return connection.vendor == 'postgresql'
+
+
+def is_partitioned():
+    if not is_supported():
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+            [connection.ops.quote_name(PARENT_TABLE)],
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions():
+    """Particiones mensuales adjuntas: [(nombre, inicio, fin)] ordenadas por inicio."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass(%s)
+            """,
+            [connection.ops.quote_name(PARENT_TABLE)],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = []
+    for name in names:
+        match = _PARTITION_RE.match(name)
+        if not match:
+            continue
+        start = datetime.datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=datetime.timezone.utc)
+        partitions.append((name, start, add_months(start, 1)))
+    return sorted(partitions, key=lambda p: p[1])
+
+
+def ensure_partition(start):
+    """
+    Crea y adjunta la partición del mes que empieza en 'start'.
+    Las filas de ese mes que hubieran caído en la partición por defecto se
+    mueven antes de adjuntar. Devuelve False si ya existía.
+
+    La partición por defecto queda bloqueada (SHARE ROW EXCLUSIVE) desde antes
+    de mover las filas hasta el ATTACH: un INSERT concurrente de ese mes en
+    ella haría fallar el ATTACH, así que espera y entra ya en la partición
+    nueva. El bloqueo también serializa llamadas concurrentes.
+    """
+    start = month_start(start)
+    end = add_months(start, 1)
+    qn = connection.ops.quote_name
+    name = partition_name(start)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", [qn(name)])
+        if cursor.fetchone()[0] is not None:
+            return False
+        cursor.execute(f"LOCK TABLE {qn(DEFAULT_PARTITION)} IN SHARE ROW EXCLUSIVE MODE")
+        # Otra llamada pudo crearla mientras se esperaba el bloqueo.
+        cursor.execute("SELECT to_regclass(%s)", [qn(name)])
+        if cursor.fetchone()[0] is not None:
+            return False
+        cursor.execute(
+            f"CREATE TABLE {qn(name)} (LIKE {qn(PARENT_TABLE)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+        cursor.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {qn(DEFAULT_PARTITION)}
+                WHERE fecha_accion >= %s AND fecha_accion < %s
+                RETURNING *
+            )
+            INSERT INTO {qn(name)} SELECT * FROM moved
+            """,
+            [start, end],
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(PARENT_TABLE)} ATTACH PARTITION {qn(name)} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    return True
+
+
+def detach_partition(name, drop=False):
+    qn = connection.ops.quote_name
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {qn(PARENT_TABLE)} DETACH PARTITION {qn(name)}")
+        if drop:
+            cursor.execute(f"DROP TABLE {qn(name)}")
@@ -1,14 +1,16 @@
 # auditoria/serializers.py
 from rest_framework import serializers
 from .models import LogAuditoria
+from core.serializers import EncryptedField, BatchDecryptListSerializer
 
 class LogAuditoriaSerializer(serializers.ModelSerializer):
     usuario_username = serializers.CharField(source='usuario.username', read_only=True, allow_null=True)
-    detalles = serializers.CharField(source='decrypted_detalles', read_only=True)
+    detalles = EncryptedField()
 
     class Meta:
         model = LogAuditoria
         fields = [
             'id', 'usuario', 'usuario_username', 'accion', 'tabla_afectada',
             'registro_id_uuid', 'detalles', 'ip_usuario', 'fecha_accion'
-        ]
\ No newline at end of file
+        ]
+        list_serializer_class = BatchDecryptListSerializer
\ No newline at end of file
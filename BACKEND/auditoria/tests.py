@@ -1,3 +1,36 @@
+import os
+import threading
+
 from django.test import TestCase
+from django.utils import timezone
+
+from core.pruebas import PresupuestoConsultasMixin
+from . import urls
+from .models import LogAuditoria
+from .writer import AuditWriter
+
+
+class PresupuestoConsultasTests(PresupuestoConsultasMixin, TestCase):
+    router = urls.router
+    presupuestos = {
+        # ruta: (máx. consultas, máx. descifrados por fila)
+        'logauditoria-list': (2, 1),
+        'logauditoria-detail': (1, 1),
+        'logauditoria-actividad': (1, 0),
+    }
+
+
+class AuditWriterTests(TestCase):
+    def test_flush_escribe_la_cola_si_el_hilo_murio(self):
+        writer = AuditWriter(batch_size=2)
+        writer._pid = os.getpid()
+        writer._thread = threading.Thread(target=lambda: None)
+        writer._thread.start()
+        writer._thread.join()
+        for i in range(3):
+            writer._queue.put({'accion': 'PRUEBA_FLUSH', 'fecha_accion': timezone.now(), 'detalles': f'entrada {i}'})
+
+        writer.flush()
 
-# Create your tests here.
+        self.assertEqual(LogAuditoria.objects.filter(accion='PRUEBA_FLUSH').count(), 3)
+        self.assertEqual(writer._queue.unfinished_tasks, 0)
@@ -1,8 +1,21 @@
 # auditoria/utils.py
+from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
 from .models import LogAuditoria
 
-def log_audit(user, request, action_code, instance=None, details=""):
+def log_audit(user, request, action_code, instance=None, details="", durable=False):
+    """
+    Registra una acción en LogAuditoria.
+
+    Por defecto la entrada se encola al confirmarse la transacción
+    (transaction.on_commit) y la escribe en lote el hilo de auditoria.writer,
+    fuera del camino crítico de la petición. Con durable=True (o si
+    AUDIT_ASYNC_ENABLED es False) se escribe de forma síncrona, dentro de la
+    transacción actual: usarlo para los eventos de seguridad (gestión de
+    usuarios), que no pueden perderse si el proceso muere antes de que el
+    hilo escriba su lote.
+    """
     if not user or not user.is_authenticated:
         return
 
@@ -11,6 +24,24 @@ def log_audit(user, request, action_code, instance=None, details=""):
     if x_forwarded_for:
         ip_address = x_forwarded_for.split(',')[0]
 
+    if durable or not settings.AUDIT_ASYNC_ENABLED:
+        _log_audit_sync(user, action_code, instance, details, ip_address)
+        return
+
+    from .writer import audit_writer
+
+    entry = {
+        'usuario_id': user.pk,
+        'accion': action_code,
+        'tabla_afectada': instance._meta.db_table if instance else None,
+        'registro_id_uuid': instance.id if instance and hasattr(instance, 'id') else None,
+        'ip_usuario': ip_address,
+        'fecha_accion': timezone.now(),
+        'detalles': details,
+    }
+    transaction.on_commit(lambda: audit_writer.submit(entry))
+
+def _log_audit_sync(user, action_code, instance, details, ip_address):
     try:
         log_entry = LogAuditoria(
             usuario=user,
@@ -20,7 +51,7 @@ def log_audit(user, request, action_code, instance=None, details=""):
             ip_usuario=ip_address
         )
         # Usar el setter para cifrar los detalles
-        log_entry.set_detalles(details) 
+        log_entry.set_detalles(details)
         log_entry.save()
     except Exception as e:
-        print(f"ERROR al guardar log de auditoría para {user.username} - Acción {action_code}: {e}")
\ No newline at end of file
+        print(f"ERROR al guardar log de auditoría para {user.username} - Acción {action_code}: {e}")
@@ -1,13 +1,83 @@
 # auditoria/views.py
+import datetime
+
+from django.db.models import Count
+from django.db.models.functions import TruncDay, TruncHour
+from django.utils import timezone
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 from . import models # <--- LÍNEA FALTANTE
 from . import serializers # <--- LÍNEA FALTANTE
 from usuarios import permissions as custom_permissions
+from core.pagination import EstimatedCountKeysetPagination
+from core.utils.query_params import parse_fecha_param, parse_uuid_param
 
 class LogAuditoriaViewSet(viewsets.ReadOnlyModelViewSet):
     """
     API endpoint para ver Logs de Auditoría (Solo Admin Sistema).
+
+    Filtros: ?usuario=, ?accion=, ?tabla_afectada=, ?registro_id_uuid=,
+    ?desde= / ?hasta= (fecha_accion). Cada combinación usa un índice
+    compuesto que termina en fecha_accion, y el rango de fechas hace que
+    PostgreSQL descarte las particiones mensuales que no se solapan.
+    'total_estimado' viene del planificador, no de un COUNT(*).
     """
     queryset = models.LogAuditoria.objects.select_related('usuario').order_by('-fecha_accion')
     serializer_class = serializers.LogAuditoriaSerializer
-    permission_classes = [custom_permissions.CanReadLogs]
\ No newline at end of file
+    permission_classes = [custom_permissions.CanReadLogs]
+    pagination_class = EstimatedCountKeysetPagination
+    ordering = ('-fecha_accion', '-id')
+
+    BUCKETS = {'hora': TruncHour, 'dia': TruncDay}
+    VENTANA_ACTIVIDAD_DEFECTO = datetime.timedelta(days=7)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        params = self.request.query_params
+        if params.get('usuario'):
+            queryset = queryset.filter(usuario_id=parse_uuid_param(params['usuario'], 'usuario'))
+        if params.get('accion'):
+            queryset = queryset.filter(accion=params['accion'])
+        if params.get('tabla_afectada'):
+            queryset = queryset.filter(tabla_afectada=params['tabla_afectada'])
+        if params.get('registro_id_uuid'):
+            queryset = queryset.filter(registro_id_uuid=parse_uuid_param(params['registro_id_uuid'], 'registro_id_uuid'))
+        if params.get('desde'):
+            queryset = queryset.filter(fecha_accion__gte=parse_fecha_param(params['desde'], 'desde'))
+        if params.get('hasta'):
+            queryset = queryset.filter(fecha_accion__lt=parse_fecha_param(params['hasta'], 'hasta', end=True))
+        return queryset
+
+    @action(detail=False, methods=['get'])
+    def actividad(self, request):
+        """
+        Conteo de acciones por usuario y por bucket (?bucket=hora|dia), calculado
+        con GROUP BY en SQL. Acepta los mismos filtros que el listado; sin ?desde=
+        se limita a los últimos 7 días.
+        """
+        bucket = request.query_params.get('bucket', 'dia')
+        if bucket not in self.BUCKETS:
+            raise ValidationError({'bucket': f"Valores permitidos: {', '.join(self.BUCKETS)}."})
+
+        queryset = self.get_queryset()
+        if not request.query_params.get('desde'):
+            queryset = queryset.filter(fecha_accion__gte=timezone.now() - self.VENTANA_ACTIVIDAD_DEFECTO)
+
+        filas = (
+            queryset.order_by()
+            .annotate(bucket=self.BUCKETS[bucket]('fecha_accion'))
+            .values('bucket', 'usuario', 'usuario__username')
+            .annotate(total=Count('id'))
+            .order_by('bucket', 'usuario__username')
+        )
+        return Response([
+            {
+                'bucket': fila['bucket'],
+                'usuario': fila['usuario'],
+                'usuario_username': fila['usuario__username'],
+                'total': fila['total'],
+            }
+            for fila in filas
+        ])
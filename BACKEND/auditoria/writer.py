@@ -0,0 +1,138 @@
+# auditoria/writer.py
+import atexit
+import logging
+import os
+import queue
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+from core.utils.security_utils import encrypt_data
+
+logger = logging.getLogger(__name__)
+
+
+class AuditWriter:
+    """
+    Escritor de auditoría en segundo plano.
+
+    Las entradas se encolan en memoria y un hilo las cifra e inserta con
+    bulk_create en lotes. La cola es acotada: si está llena, quien registra
+    escribe su entrada de forma síncrona (contrapresión, nunca se pierde un log).
+    """
+
+    def __init__(self, batch_size=200, max_queue=10000, flush_interval=1.0, enqueue_timeout=0.05):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._stopping = threading.Event()
+
+    def submit(self, entry):
+        """Encola un dict con los campos de LogAuditoria (+ 'detalles' en texto plano)."""
+        self._ensure_started()
+        try:
+            self._queue.put(entry, timeout=self.enqueue_timeout)
+        except queue.Full:
+            logger.warning("Cola de auditoría llena; escribiendo log de forma síncrona.")
+            self.write_batch([entry])
+
+    def flush(self):
+        """
+        Bloquea hasta que todas las entradas encoladas estén escritas. Si el
+        hilo escritor murió, lo que quede en la cola se escribe aquí mismo.
+        """
+        if self._pid != os.getpid():
+            # Nada encolado en este proceso: lo heredado de un fork lo escribe el padre.
+            return
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+        self._drain()
+
+    def shutdown(self):
+        self.flush()
+        self._stopping.set()
+
+    def _drain(self):
+        pendientes = []
+        while True:
+            try:
+                pendientes.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        for inicio in range(0, len(pendientes), self.batch_size):
+            lote = pendientes[inicio:inicio + self.batch_size]
+            try:
+                self.write_batch(lote)
+            finally:
+                for _ in lote:
+                    self._queue.task_done()
+
+    def write_batch(self, entries):
+        from .models import LogAuditoria
+
+        logs = []
+        for entry in entries:
+            entry = dict(entry)
+            detalles = entry.pop('detalles', None)
+            log = LogAuditoria(**entry)
+            log.detalles = encrypt_data(str(detalles)) if detalles else None
+            logs.append(log)
+        try:
+            LogAuditoria.objects.bulk_create(logs, batch_size=self.batch_size)
+        except Exception as e:
+            logger.error("Fallo bulk_create de %s logs de auditoría, reintentando uno a uno: %s", len(logs), e)
+            for log in logs:
+                try:
+                    log.save(force_insert=True)
+                except Exception as e:
+                    logger.error("ERROR al guardar log de auditoría - Acción %s: %s", log.accion, e)
+
+    # --- Hilo escritor ---
+
+    def _ensure_started(self):
+        # Tras un fork (ej. workers de gunicorn) el hilo del padre no existe.
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name='audit-writer', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        try:
+            while not self._stopping.is_set():
+                try:
+                    first = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    continue
+                batch = [first]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                try:
+                    close_old_connections()
+                    self.write_batch(batch)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            connection.close()
+
+
+audit_writer = AuditWriter(
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    max_queue=settings.AUDIT_QUEUE_MAX,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL,
+    enqueue_timeout=settings.AUDIT_ENQUEUE_TIMEOUT,
+)
+atexit.register(audit_writer.shutdown)
@@ -2,4 +2,7 @@ from django.apps import AppConfig
 
 class CatalogosConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'catalogos'
\ No newline at end of file
+    name = 'catalogos'
+
+    def ready(self):
+        from . import signals  # noqa: F401 (versión del catálogo CIE-10)
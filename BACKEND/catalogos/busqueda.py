@@ -0,0 +1,134 @@
+# catalogos/busqueda.py
+"""
+Índice en memoria para autocompletar diagnósticos CIE-10.
+
+- Códigos: arreglo ordenado de códigos normalizados ('O14.1' -> 'O141');
+  un prefijo se resuelve con bisect y los resultados salen ya en orden.
+- Descripciones: índice invertido token -> ids, sin tildes ni mayúsculas.
+  Primero van las filas donde todos los términos coinciden como palabra
+  completa; luego las que coinciden tratando cada término como prefijo
+  (sobre el vocabulario ordenado). Dentro de cada grupo, las descripciones
+  más cortas primero.
+
+Se construye una vez por versión del catálogo (catalogos.version).
+"""
+import bisect
+import functools
+import heapq
+import itertools
+import re
+import unicodedata
+from collections import defaultdict
+
+from . import models
+from .version import CachePorVersion
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_CODIGO_RE = re.compile(r'^[A-Z][0-9][0-9A-Z]*$')
+PREFIJO_MIN = 2
+STOPWORDS = frozenset({'a', 'al', 'con', 'de', 'del', 'el', 'en', 'la', 'las', 'lo', 'los', 'o', 'por', 'sin', 'u', 'un', 'una', 'y'})
+
+
+def normalizar_texto(texto):
+    sin_tildes = unicodedata.normalize('NFKD', texto).encode('ascii', 'ignore').decode('ascii')
+    return sin_tildes.lower()
+
+
+def tokens(texto):
+    return [t for t in _TOKEN_RE.findall(normalizar_texto(texto)) if t not in STOPWORDS]
+
+
+def normalizar_codigo(codigo):
+    return re.sub(r'[^0-9A-Z]', '', normalizar_texto(codigo).upper())
+
+
+class IndiceCIE10:
+    def __init__(self, filas):
+        """filas: iterable de (id, codigo, descripcion)."""
+        # Los ids internos siguen el orden de relevancia: descripciones más
+        # cortas primero, luego por código. Ordenar ids == ordenar resultados.
+        filas = sorted(filas, key=lambda fila: (len(fila[2]), normalizar_codigo(fila[1])))
+        self._resultados = [{'id': str(id_), 'codigo': codigo, 'descripcion': descripcion} for id_, codigo, descripcion in filas]
+
+        por_codigo = sorted((normalizar_codigo(codigo), i) for i, (_, codigo, _) in enumerate(filas))
+        self._codigos = [codigo for codigo, _ in por_codigo]
+        self._codigo_ids = [i for _, i in por_codigo]
+
+        postings = defaultdict(list)
+        for i, (_, _, descripcion) in enumerate(filas):
+            for token in dict.fromkeys(tokens(descripcion)):
+                postings[token].append(i)  # i crece: listas ya ordenadas
+        self._orden = {token: tuple(ids) for token, ids in postings.items()}
+        self._postings = {token: frozenset(ids) for token, ids in postings.items()}
+        self._vocabulario = sorted(self._postings)
+        self._con_prefijo = functools.lru_cache(maxsize=1024)(self._union_prefijo)
+
+    @classmethod
+    def desde_bd(cls):
+        return cls(models.DiagnosticoCIE10.objects.values_list('id', 'codigo', 'descripcion').iterator())
+
+    def __len__(self):
+        return len(self._resultados)
+
+    def buscar(self, consulta, limite=20):
+        consulta = consulta.strip()
+        if not consulta or limite <= 0:
+            return []
+        codigo = normalizar_codigo(consulta)
+        if ' ' not in consulta and _CODIGO_RE.match(codigo):
+            ids = self._por_codigo(codigo, limite)
+            if ids:
+                return [self._resultados[i] for i in ids]
+        return [self._resultados[i] for i in self._por_descripcion(consulta, limite)]
+
+    def _por_codigo(self, prefijo, limite):
+        inicio = bisect.bisect_left(self._codigos, prefijo)
+        ids = []
+        for pos in range(inicio, min(inicio + limite, len(self._codigos))):
+            if not self._codigos[pos].startswith(prefijo):
+                break
+            ids.append(self._codigo_ids[pos])
+        return ids
+
+    def _union_prefijo(self, prefijo):
+        """(conjunto, ids ordenados) de las filas con algún token que empieza con 'prefijo'."""
+        # Un término de una letra solo coincide como palabra completa.
+        if len(prefijo) < PREFIJO_MIN:
+            return self._postings.get(prefijo, frozenset()), self._orden.get(prefijo, ())
+        inicio = bisect.bisect_left(self._vocabulario, prefijo)
+        fin = bisect.bisect_left(self._vocabulario, prefijo + '\x7f', inicio)
+        if fin - inicio == 1:
+            token = self._vocabulario[inicio]
+            return self._postings[token], self._orden[token]
+        conjunto = frozenset().union(*(self._postings[t] for t in self._vocabulario[inicio:fin]))
+        return conjunto, tuple(sorted(conjunto))
+
+    def _por_descripcion(self, consulta, limite):
+        terminos = list(dict.fromkeys(tokens(consulta)))
+        if not terminos:
+            return []
+
+        # 1) Todos los términos como palabra completa. Con un solo término la
+        #    lista de ids ya está en orden de relevancia.
+        ids = []
+        if all(t in self._postings for t in terminos):
+            if len(terminos) == 1:
+                ids = list(self._orden[terminos[0]][:limite])
+            else:
+                conjuntos = sorted((self._postings[t] for t in terminos), key=len)
+                ids = heapq.nsmallest(limite, conjuntos[0].intersection(*conjuntos[1:]))
+            if len(ids) == limite:
+                return ids
+
+        # 2) Completar con coincidencias por prefijo (autocompletado).
+        faltan = limite - len(ids)
+        vistos = set(ids)
+        if len(terminos) == 1:
+            _, ordenados = self._con_prefijo(terminos[0])
+            return ids + list(itertools.islice((i for i in ordenados if i not in vistos), faltan))
+        conjuntos = sorted((self._con_prefijo(t)[0] for t in terminos), key=len)
+        candidatos = conjuntos[0].intersection(*conjuntos[1:]).difference(vistos)
+        return ids + heapq.nsmallest(faltan, candidatos)
+
+
+indice_cie10 = CachePorVersion(lambda version: IndiceCIE10.desde_bd())
@@ -0,0 +1,156 @@
+# catalogos/carga.py
+"""
+Carga masiva del catálogo CIE-10 desde CSV o XLSX, en memoria constante.
+
+En PostgreSQL las filas se envían con COPY a una tabla temporal y se
+integran a DiagnosticoCIE10 con un único INSERT ... ON CONFLICT (codigo).
+En otros motores (desarrollo) se usa el ORM por lotes.
+"""
+import csv
+import itertools
+from pathlib import Path
+
+from django.db import connection, transaction
+
+from .models import DiagnosticoCIE10
+from .version import incrementar_version
+
+COLUMNAS_CODIGO = {'codigo', 'código', 'code', 'cod', 'cie10', 'cie-10'}
+COLUMNAS_DESCRIPCION = {'descripcion', 'descripción', 'description', 'glosa', 'nombre'}
+CODIGO_MAX = DiagnosticoCIE10._meta.get_field('codigo').max_length
+
+
+class ErrorCarga(Exception):
+    pass
+
+
+def _filas_csv(path, encoding):
+    with open(path, newline='', encoding=encoding) as archivo:
+        muestra = archivo.read(4096)
+        archivo.seek(0)
+        try:
+            dialecto = csv.Sniffer().sniff(muestra, delimiters=',;\t|')
+        except csv.Error:
+            dialecto = csv.excel
+        yield from csv.reader(archivo, dialecto)
+
+
+def _filas_xlsx(path, hoja):
+    from openpyxl import load_workbook
+
+    libro = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = libro[hoja] if hoja else libro.worksheets[0]
+        yield from ws.iter_rows(values_only=True)
+    finally:
+        libro.close()
+
+
+def leer_filas(path, hoja=None, encoding='utf-8-sig', contador=None):
+    """
+    Genera (codigo, descripcion) desde un .csv/.txt o .xlsx/.xlsm.
+    Si la primera fila trae encabezados conocidos se usan esas columnas; si
+    no, se asume codigo en la 1ª columna y descripcion en la 2ª.
+    'contador' (dict) acumula las filas omitidas en 'omitidas'.
+    """
+    path = Path(path)
+    sufijo = path.suffix.lower()
+    if sufijo in ('.xlsx', '.xlsm'):
+        filas = _filas_xlsx(path, hoja)
+    elif sufijo in ('.csv', '.txt'):
+        filas = _filas_csv(path, encoding)
+    else:
+        raise ErrorCarga(f'Formato no soportado: {path.suffix} (use .csv o .xlsx).')
+
+    contador = contador if contador is not None else {}
+    contador.setdefault('omitidas', 0)
+    primera = next(filas, None)
+    if primera is None:
+        return
+    encabezado = [str(v).strip().lower() if v is not None else '' for v in primera]
+    col_codigo = next((i for i, v in enumerate(encabezado) if v in COLUMNAS_CODIGO), None)
+    col_descripcion = next((i for i, v in enumerate(encabezado) if v in COLUMNAS_DESCRIPCION), None)
+    if col_codigo is None or col_descripcion is None:
+        col_codigo, col_descripcion = 0, 1
+        filas = itertools.chain([primera], filas)
+
+    for fila in filas:
+        if len(fila) <= max(col_codigo, col_descripcion):
+            contador['omitidas'] += 1
+            continue
+        codigo = str(fila[col_codigo] or '').strip().upper()
+        descripcion = str(fila[col_descripcion] or '').strip()
+        if not codigo or not descripcion or len(codigo) > CODIGO_MAX:
+            contador['omitidas'] += 1
+            continue
+        yield codigo, descripcion
+
+
+def cargar(filas, batch_size=5000):
+    """
+    Integra las filas (codigo, descripcion) a DiagnosticoCIE10; ante códigos
+    repetidos gana la última. Devuelve {'insertados', 'actualizados', 'sin_cambios'}
+    y, si hubo cambios, incrementa la versión del catálogo.
+    """
+    with transaction.atomic():
+        if connection.vendor == 'postgresql':
+            resultado = _cargar_postgresql(filas)
+        else:
+            resultado = _cargar_orm(filas, batch_size)
+        if resultado['insertados'] or resultado['actualizados']:
+            incrementar_version()
+    return resultado
+
+
+def _cargar_postgresql(filas):
+    tabla = connection.ops.quote_name(DiagnosticoCIE10._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE TEMP TABLE cie10_staging (orden bigserial, codigo text, descripcion text) ON COMMIT DROP"
+        )
+        with cursor.copy("COPY cie10_staging (codigo, descripcion) FROM STDIN") as copy:
+            for fila in filas:
+                copy.write_row(fila)
+        cursor.execute(
+            f"""
+            WITH fuente AS (
+                SELECT DISTINCT ON (codigo) codigo, descripcion
+                FROM cie10_staging ORDER BY codigo, orden DESC
+            ), cambios AS (
+                INSERT INTO {tabla} (id, codigo, descripcion)
+                SELECT gen_random_uuid(), codigo, descripcion FROM fuente
+                ON CONFLICT (codigo) DO UPDATE SET descripcion = EXCLUDED.descripcion
+                WHERE {tabla}.descripcion IS DISTINCT FROM EXCLUDED.descripcion
+                RETURNING (xmax = 0) AS insertado
+            )
+            SELECT
+                (SELECT count(*) FROM fuente),
+                count(*) FILTER (WHERE insertado),
+                count(*) FILTER (WHERE NOT insertado)
+            FROM cambios
+            """
+        )
+        total, insertados, actualizados = cursor.fetchone()
+    return {'insertados': insertados, 'actualizados': actualizados, 'sin_cambios': total - insertados - actualizados}
+
+
+def _cargar_orm(filas, batch_size):
+    resultado = {'insertados': 0, 'actualizados': 0, 'sin_cambios': 0}
+    filas = iter(filas)
+    while lote := dict(itertools.islice(filas, batch_size)):
+        existentes = DiagnosticoCIE10.objects.in_bulk(lote.keys(), field_name='codigo')
+        nuevos, modificados = [], []
+        for codigo, descripcion in lote.items():
+            actual = existentes.get(codigo)
+            if actual is None:
+                nuevos.append(DiagnosticoCIE10(codigo=codigo, descripcion=descripcion))
+            elif actual.descripcion != descripcion:
+                actual.descripcion = descripcion
+                modificados.append(actual)
+            else:
+                resultado['sin_cambios'] += 1
+        DiagnosticoCIE10.objects.bulk_create(nuevos)
+        DiagnosticoCIE10.objects.bulk_update(modificados, ['descripcion'])
+        resultado['insertados'] += len(nuevos)
+        resultado['actualizados'] += len(modificados)
+    return resultado
@@ -0,0 +1,42 @@
+# catalogos/management/commands/load_cie10.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from catalogos import carga
+
+
+class Command(BaseCommand):
+    help = (
+        'Carga o actualiza el catálogo CIE-10 desde un CSV o XLSX (columnas codigo y descripcion). '
+        'En PostgreSQL usa COPY a una tabla temporal y un upsert por codigo.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('archivo', help='Ruta al .csv/.txt o .xlsx/.xlsm.')
+        parser.add_argument('--hoja', help='Hoja del XLSX (por defecto, la primera).')
+        parser.add_argument('--encoding', default='utf-8-sig', help='Codificación del CSV.')
+        parser.add_argument('--batch-size', type=int, default=5000,
+                            help='Filas por lote fuera de PostgreSQL.')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Calcula los conteos y revierte la transacción.')
+
+    def handle(self, *args, **options):
+        contador = {}
+        filas = carga.leer_filas(options['archivo'], hoja=options['hoja'], encoding=options['encoding'], contador=contador)
+        inicio = time.perf_counter()
+        try:
+            with transaction.atomic():
+                resultado = carga.cargar(filas, batch_size=options['batch_size'])
+                if options['dry_run']:
+                    transaction.set_rollback(True)
+        except (carga.ErrorCarga, OSError, KeyError) as e:
+            raise CommandError(str(e))
+
+        prefijo = '[dry-run] ' if options['dry_run'] else ''
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefijo}CIE-10: {resultado['insertados']} insertados, {resultado['actualizados']} actualizados, "
+            f"{resultado['sin_cambios']} sin cambios, {contador.get('omitidas', 0)} filas omitidas "
+            f"({time.perf_counter() - inicio:.1f} s)."
+        ))
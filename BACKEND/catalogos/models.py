@@ -11,4 +11,20 @@ class DiagnosticoCIE10(models.Model):
         verbose_name = 'Diagnóstico CIE-10'
         verbose_name_plural = 'Diagnósticos CIE-10'
         ordering = ['codigo']
-    def __str__(self): return f"{self.codigo}: {self.descripcion}"
\ No newline at end of file
+    def __str__(self): return f"{self.codigo}: {self.descripcion}"
+
+class VersionCatalogo(models.Model):
+    """
+    Contador por catálogo que se incrementa en cada escritura (catalogos/signals.py
+    y cargas masivas). Versiona los ETag y las cachés en memoria de catalogos.version.
+    """
+    catalogo = models.CharField(max_length=50, primary_key=True)
+    version = models.BigIntegerField(default=0)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'VersionCatalogo'
+        verbose_name = 'Versión de Catálogo'
+        verbose_name_plural = 'Versiones de Catálogos'
+
+    def __str__(self): return f"{self.catalogo} v{self.version}"
@@ -0,0 +1,14 @@
+# catalogos/signals.py
+"""Cada escritura ORM sobre el catálogo CIE-10 incrementa su versión."""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import DiagnosticoCIE10
+from .version import incrementar_version
+
+
+@receiver(post_save, sender=DiagnosticoCIE10)
+@receiver(post_delete, sender=DiagnosticoCIE10)
+def diagnostico_modificado(sender, raw=False, **kwargs):
+    if not raw:
+        incrementar_version()
@@ -1,3 +1,16 @@
 from django.test import TestCase
 
-# Create your tests here.
+from core.pruebas import PresupuestoConsultasMixin
+from . import urls
+
+
+class PresupuestoConsultasTests(PresupuestoConsultasMixin, TestCase):
+    router = urls.router
+    presupuestos = {
+        # ruta: (máx. consultas, máx. descifrados por fila)
+        # Lista y búsqueda salen del payload/índice en memoria (la primera petición los carga).
+        'diagnosticocie10-list': (0, 0),
+        'diagnosticocie10-buscar': (0, 0),
+        'diagnosticocie10-detail': (1, 0),
+    }
+    parametros = {'diagnosticocie10-buscar': 'q=Z'}
@@ -2,10 +2,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from . import views
+from core.asincrono import rutas_lectura_async
 
 router = DefaultRouter()
 router.register(r'diagnosticos-cie10', views.DiagnosticoCIE10ViewSet, basename='diagnosticocie10')
 
 urlpatterns = [
+    # GET de lista/detalle asíncronos (core.asincrono); el resto sigue en el router.
+    *rutas_lectura_async(r'diagnosticos-cie10', views.DiagnosticoCIE10ViewSet, basename='diagnosticocie10'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
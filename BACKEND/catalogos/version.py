@@ -0,0 +1,61 @@
+# catalogos/version.py
+"""
+Versión de cada catálogo y valores derivados cacheados por versión.
+
+La versión leída de VersionCatalogo se recuerda CATALOGO_VERSION_TTL segundos
+por proceso, así que en el camino feliz no se consulta la base de datos; el
+proceso que escribe la olvida al confirmar y los demás la ven al vencer el TTL.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from .models import VersionCatalogo
+
+CIE10 = 'cie10'
+
+_versiones = {}  # catalogo -> (version, leida_en)
+
+
+def version_actual(catalogo=CIE10):
+    leida = _versiones.get(catalogo)
+    ahora = time.monotonic()
+    if leida is not None and ahora - leida[1] < settings.CATALOGO_VERSION_TTL:
+        return leida[0]
+    version = VersionCatalogo.objects.filter(catalogo=catalogo).values_list('version', flat=True).first() or 0
+    _versiones[catalogo] = (version, ahora)
+    return version
+
+
+def incrementar_version(catalogo=CIE10):
+    VersionCatalogo.objects.get_or_create(catalogo=catalogo)
+    VersionCatalogo.objects.filter(catalogo=catalogo).update(version=F('version') + 1)
+    transaction.on_commit(lambda: _versiones.pop(catalogo, None))
+
+
+class CachePorVersion:
+    """Valor construido una vez por versión del catálogo (por proceso): construir(version)."""
+
+    def __init__(self, construir, catalogo=CIE10):
+        self._construir = construir
+        self._catalogo = catalogo
+        self._lock = threading.Lock()
+        self._actual = (None, None)  # (version, valor)
+
+    def get(self):
+        version = version_actual(self._catalogo)
+        actual = self._actual
+        if actual[0] != version:
+            with self._lock:
+                actual = self._actual
+                if actual[0] != version:
+                    actual = (version, self._construir(version))
+                    self._actual = actual
+        return actual[1]
+
+    def clear(self):
+        with self._lock:
+            self._actual = (None, None)
@@ -1,9 +1,66 @@
 # catalogos/views.py
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse
 from rest_framework import viewsets, permissions
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
 from . import models # <--- LÍNEA FALTANTE
 from . import serializers # <--- LÍNEA FALTANTE
+from .busqueda import indice_cie10
+from .version import CachePorVersion
+from core.asincrono import LecturaAsyncMixin
+from core.utils.http import etag_coincide
+
+BUSQUEDA_LIMITE = 20
+BUSQUEDA_LIMITE_MAX = 100
+
+def _payload_cie10(version):
+    """JSON ya serializado del catálogo completo y su ETag fuerte (versión + hash del contenido)."""
+    diagnosticos = models.DiagnosticoCIE10.objects.order_by('codigo')
+    cuerpo = JSONRenderer().render(serializers.DiagnosticoCIE10Serializer(diagnosticos, many=True).data)
+    etag = f'"cie10-v{version}-{hashlib.blake2b(cuerpo, digest_size=8).hexdigest()}"'
+    return cuerpo, etag
+
+payload_cie10 = CachePorVersion(_payload_cie10)
 
-class DiagnosticoCIE10ViewSet(viewsets.ReadOnlyModelViewSet):
+class DiagnosticoCIE10ViewSet(LecturaAsyncMixin, viewsets.ReadOnlyModelViewSet):
     queryset = models.DiagnosticoCIE10.objects.all().order_by('codigo')
     serializer_class = serializers.DiagnosticoCIE10Serializer
-    permission_classes = [permissions.IsAuthenticated] # Cualquiera autenticado puede verlos
\ No newline at end of file
+    permission_classes = [permissions.IsAuthenticated] # Cualquiera autenticado puede verlos
+
+    def list(self, request, *args, **kwargs):
+        """
+        El catálogo completo se sirve desde memoria (un payload por versión)
+        con ETag fuerte; If-None-Match con el ETag vigente responde 304.
+        """
+        return self._respuesta_catalogo(request, *payload_cie10.get())
+
+    async def alist(self, request, *args, **kwargs):
+        # payload_cie10 consulta la versión (y arma el payload) solo al vencer su caché.
+        return self._respuesta_catalogo(request, *await sync_to_async(payload_cie10.get)())
+
+    def _respuesta_catalogo(self, request, cuerpo, etag):
+        if etag_coincide(request.headers.get('If-None-Match'), etag):
+            response = HttpResponse(status=304)
+        else:
+            response = HttpResponse(cuerpo, content_type='application/json')
+        response['ETag'] = etag
+        response['Cache-Control'] = f'private, max-age={settings.CIE10_CACHE_MAX_AGE}'
+        return response
+
+    @action(detail=False, methods=['get'])
+    def buscar(self, request):
+        """
+        GET /api/catalogos/diagnosticos-cie10/buscar/?q=O14 | ?q=preeclampsia&limite=10
+        Autocompletado por prefijo de código o palabras de la descripción (sin tildes).
+        """
+        try:
+            limite = min(int(request.query_params.get('limite', BUSQUEDA_LIMITE)), BUSQUEDA_LIMITE_MAX)
+        except ValueError:
+            raise ValidationError({'limite': 'Debe ser un entero.'})
+        return Response(indice_cie10.get().buscar(request.query_params.get('q', ''), limite))
@@ -0,0 +1,133 @@
+# core/asincrono.py
+"""
+Lectura asíncrona (ASGI) para los ViewSets de DRF.
+
+DRF solo tiene vistas síncronas: bajo ASGI cada petición ocupa un hilo
+mientras espera a la base de datos. rutas_lectura_async() publica, en las
+mismas URLs que el router, una vista async que atiende los GET de lista y
+detalle del ViewSet con el ORM asíncrono (aiterator/aget), y delega todo lo
+demás (POST, PUT, PATCH, DELETE, API navegable) a la vista síncrona de
+siempre. Autenticación, permisos, get_queryset (filtro por turno) y
+paginación son los del propio ViewSet; el descifrado del lote corre en el
+pool de hilos de descifrado.
+
+Bajo WSGI las vistas siguen funcionando (Django ejecuta la corrutina en un
+event loop por petición), sin ventaja.
+"""
+import re
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import Http404
+from django.urls import re_path
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.response import Response
+
+from core.serializers import collect_ciphertexts
+from core.utils.security_utils import adecrypt_many
+
+ACCIONES_LISTA = {'get': 'list', 'post': 'create'}
+ACCIONES_DETALLE = {'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'}
+
+
+class LecturaAsyncMixin:
+    """
+    Versiones async de list/retrieve para un ViewSet de DRF. Las sobrescrituras
+    de list() en el ViewSet deben tener su equivalente alist().
+    """
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(await self.aserializar(page, many=True))
+        return Response(await self.aserializar([obj async for obj in queryset], many=True))
+
+    async def aretrieve(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        return Response(await self.aserializar(instance))
+
+    async def apaginate_queryset(self, queryset):
+        if self.paginator is None:
+            return None
+        if hasattr(self.paginator, 'apaginate_queryset'):
+            return await self.paginator.apaginate_queryset(queryset, self.request, view=self)
+        return await sync_to_async(self.paginator.paginate_queryset)(queryset, self.request, view=self)
+
+    async def aget_object(self):
+        """get_object() con aget(): mismo 404 y mismos permisos de objeto."""
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            obj = await queryset.aget(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        except (queryset.model.DoesNotExist, TypeError, ValueError, DjangoValidationError):
+            raise Http404
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    async def aserializar(self, instancias, many=False):
+        serializer = self.get_serializer(instancias, many=many)
+        campos = serializer.child if many else serializer
+        cifrados = list(collect_ciphertexts(campos, instancias if many else [instancias]))
+        if cifrados:
+            # EncryptedField / BatchDecryptListSerializer usan el lote ya descifrado.
+            serializer._plaintexts = await adecrypt_many(cifrados)
+        return serializer.data
+
+
+def vista_lectura_async(viewset, acciones, **initkwargs):
+    """Vista async para una ruta del ViewSet: GET async, el resto por la vista síncrona."""
+    vista_sync = viewset.as_view(acciones, **initkwargs)
+    delegar = sync_to_async(vista_sync)
+
+    async def vista(request, *args, **kwargs):
+        if request.method != 'GET':
+            return await delegar(request, *args, **kwargs)
+
+        self = viewset(**initkwargs)
+        self.action_map = acciones
+        self.action = acciones['get']
+        self.args, self.kwargs = args, kwargs
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+        drf_request = self.initialize_request(request, *args, **kwargs)
+        self.request = drf_request
+        self.headers = self.default_response_headers
+        try:
+            # Autenticación y permisos: sin consultas con el token de claims,
+            # salvo al recargar las cachés de rol/revocación.
+            await sync_to_async(self.initial)(drf_request, *args, **kwargs)
+            if drf_request.accepted_renderer.format != 'json':
+                # La API navegable renderiza formularios con consultas síncronas.
+                return await delegar(request, *args, **kwargs)
+            handler = self.alist if self.action == 'list' else self.aretrieve
+            response = await handler(drf_request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(drf_request, response, *args, **kwargs)
+        if hasattr(self.response, 'render'):
+            self.response.render()
+        return self.response
+
+    # Como en ViewSet.as_view(): identifican vista y acción (core.metricas).
+    vista.cls, vista.actions = viewset, acciones
+    return csrf_exempt(vista)
+
+
+def rutas_lectura_async(prefijo, viewset, basename):
+    """
+    Rutas de lista y detalle con los mismos patrones y nombres que DefaultRouter.
+    Van antes de include(router.urls); las acciones extra siguen en el router.
+    """
+    lista = {metodo: accion for metodo, accion in ACCIONES_LISTA.items() if hasattr(viewset, accion)}
+    detalle = {metodo: accion for metodo, accion in ACCIONES_DETALLE.items() if hasattr(viewset, accion)}
+    lookup = viewset.lookup_url_kwarg or viewset.lookup_field
+    valor = getattr(viewset, 'lookup_value_regex', '[^/.]+')
+    # Las acciones extra de lista (ej. buscar/) no deben tomarse como un pk.
+    extras = ''.join(
+        rf'(?!{re.escape(accion.url_path)}/$)' for accion in viewset.get_extra_actions() if not accion.detail
+    )
+    return [
+        re_path(rf'^{prefijo}/$', vista_lectura_async(viewset, lista, basename=basename, detail=False), name=f'{basename}-list'),
+        re_path(rf'^{prefijo}/{extras}(?P<{lookup}>{valor})/$', vista_lectura_async(viewset, detalle, basename=basename, detail=True), name=f'{basename}-detail'),
+    ]
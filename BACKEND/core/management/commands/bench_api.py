@@ -0,0 +1,233 @@
+# core/management/commands/bench_api.py
+import importlib
+import json
+import platform
+import re
+import statistics
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.urls import reverse
+from django.utils import timezone
+
+from core.pruebas import rutas_get
+from usuarios import permissions as roles
+from usuarios.models import Usuario
+
+# Apps cuyas rutas GET del router se miden (más las de RUTAS_EXTRA).
+APPS = ('pacientes', 'partos', 'catalogos', 'auditoria', 'usuarios')
+RUTAS_EXTRA = ('current_user',)
+PARAMETROS = {'diagnosticocie10-buscar': 'q=O'}
+
+ROLES = {
+    'matrona': roles.ROL_MATRONA,
+    'enfermera': roles.ROL_ENFERMERA,
+    'medico': roles.ROL_MEDICO,
+    'administrativo': roles.ROL_ADMINISTRATIVO,
+    'admin_ti': roles.ROL_ADMIN_SISTEMA,
+}
+
+CONSULTAS_SERVER_TIMING = re.compile(r'db;dur=[\d.]+;desc="(\d+) consultas"')
+
+
+class Command(BaseCommand):
+    help = (
+        'Mide las rutas GET de la API de punta a punta (middleware, JWT, permisos, serialización) con el '
+        'cliente de pruebas de Django y un token por rol. Informa p50/p95/p99, throughput y consultas '
+        'por petición, y guarda un JSON comparable entre corridas (ver seed_synthetic).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=50, help='Peticiones medidas por ruta y rol.')
+        parser.add_argument('--warmup', type=int, default=5, help='Peticiones previas no medidas.')
+        parser.add_argument('--concurrencia', type=int, default=1, help='Hilos con su propio cliente.')
+        parser.add_argument('--roles', nargs='+', choices=list(ROLES), default=list(ROLES))
+        parser.add_argument('--usuario', action='append', default=[], metavar='ROL=USERNAME',
+                            help='Usuario a usar para un rol (por defecto, el primero activo con turno).')
+        parser.add_argument('--rutas', nargs='+', help='Solo rutas cuyo nombre contenga alguno de estos textos.')
+        parser.add_argument('--page-size', type=int, help='page_size de las listas (por defecto, el de la API).')
+        parser.add_argument('--salida', help='Archivo JSON de resultados (por defecto bench_api-<fecha>.json).')
+        parser.add_argument('--comparar', help='JSON de una corrida anterior para mostrar la diferencia de p95.')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 2 or options['concurrencia'] < 1:
+            raise CommandError('--requests debe ser al menos 2 y --concurrencia al menos 1.')
+        anterior = self.leer_resultados(options['comparar']) if options['comparar'] else None
+        usuarios = self.usuarios(options['roles'], options['usuario'])
+
+        # Igual que el runner de tests: 'testserver' en ALLOWED_HOSTS y DEBUG=False (sin registro de consultas).
+        setup_test_environment(debug=False)
+        try:
+            resultados = []
+            for nombre, es_detalle, viewset in self.rutas(options['rutas']):
+                for clave, usuario in usuarios.items():
+                    url = self.url(nombre, es_detalle, viewset, usuario, options['page_size'])
+                    if url is None:
+                        continue
+                    resultado = self.medir(usuario, url, options)
+                    resultados.append({'ruta': nombre, 'rol': clave, 'url': url, **resultado})
+                    self.escribir(resultado, nombre, clave, anterior)
+        finally:
+            teardown_test_environment()
+
+        salida = Path(options['salida'] or f"bench_api-{timezone.now():%Y%m%d-%H%M%S}.json")
+        salida.write_text(json.dumps({
+            'fecha': timezone.now().isoformat(),
+            'entorno': {
+                'python': platform.python_version(),
+                'base_datos': connection.vendor,
+                'filas': self.conteos(),
+            },
+            'opciones': {k: options[k] for k in ('requests', 'warmup', 'concurrencia', 'page_size')},
+            'resultados': resultados,
+        }, indent=2, ensure_ascii=False))
+        self.stdout.write(self.style.SUCCESS(f'\nResultados en {salida}'))
+
+    # --- Preparación ---
+
+    def usuarios(self, claves, explicitos):
+        elegidos = {}
+        for valor in explicitos:
+            clave, _, username = valor.partition('=')
+            if clave not in ROLES or not username:
+                raise CommandError(f'--usuario {valor}: use ROL=USERNAME con ROL en {", ".join(ROLES)}.')
+            elegidos[clave] = username
+
+        usuarios = {}
+        for clave in claves:
+            candidatos = Usuario.objects.filter(is_active=True).select_related('rol')
+            if clave in elegidos:
+                usuario = candidatos.filter(username=elegidos[clave]).first()
+            else:
+                # Con turno primero: Matrona/Enfermera sin turno no ven datos clínicos.
+                usuario = (candidatos.filter(rol__nombre=ROLES[clave])
+                           .exclude(turno__in=['', Usuario.TURNO_NINGUNO]).order_by('username').first()
+                           or candidatos.filter(rol__nombre=ROLES[clave]).order_by('username').first())
+            if usuario is None:
+                raise CommandError(f'No hay un usuario activo para el rol {clave} (ejecute seed_synthetic).')
+            usuarios[clave] = usuario
+        return usuarios
+
+    @staticmethod
+    def rutas(filtros):
+        rutas = []
+        for app in APPS:
+            rutas.extend(rutas_get(importlib.import_module(f'{app}.urls').router))
+        rutas.extend((nombre, False, None) for nombre in RUTAS_EXTRA)
+        if filtros:
+            rutas = [ruta for ruta in rutas if any(f in ruta[0] for f in filtros)]
+        return rutas
+
+    def url(self, nombre, es_detalle, viewset, usuario, page_size):
+        """URL a medir; para el detalle, el primer objeto de la lista que ve el propio rol."""
+        if not es_detalle:
+            parametros = [p for p in (PARAMETROS.get(nombre), page_size and f'page_size={page_size}') if p]
+            return reverse(nombre) + (f"?{'&'.join(parametros)}" if parametros else '')
+        lista = self.cliente(usuario).get(reverse(nombre.replace('-detail', '-list')))
+        datos = lista.json() if lista.status_code == 200 else None
+        filas = datos.get('results', []) if isinstance(datos, dict) else datos or []
+        if not filas or 'id' not in filas[0]:
+            return None
+        lookup = viewset.lookup_url_kwarg or viewset.lookup_field
+        return reverse(nombre, kwargs={lookup: filas[0]['id']})
+
+    @staticmethod
+    def cliente(usuario):
+        from usuarios.serializers import TokenObtainPairSerializer
+
+        token = TokenObtainPairSerializer.get_token(usuario).access_token
+        return Client(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    @staticmethod
+    def conteos():
+        from auditoria.models import LogAuditoria
+        from pacientes.models import Madre
+        from partos.models import Defuncion, Parto, RecienNacido
+
+        return {modelo.__name__: modelo.objects.count() for modelo in (Madre, Parto, RecienNacido, Defuncion, LogAuditoria)}
+
+    # --- Medición ---
+
+    def medir(self, usuario, url, options):
+        concurrencia = options['concurrencia']
+        por_hilo = [options['requests'] // concurrencia + (i < options['requests'] % concurrencia)
+                    for i in range(concurrencia)]
+        latencias, estados, consultas, errores = [], Counter(), [], []
+        lock = threading.Lock()
+        barrera = threading.Barrier(concurrencia + 1)
+
+        def trabajar(cantidad):
+            cliente = self.cliente(usuario)
+            try:
+                for _ in range(options['warmup']):
+                    cliente.get(url)
+                barrera.wait()
+                propias = []
+                for _ in range(cantidad):
+                    inicio = time.perf_counter()
+                    response = cliente.get(url)
+                    propias.append((time.perf_counter() - inicio, response.status_code, response.get('Server-Timing', '')))
+                with lock:
+                    for segundos, estado, timing in propias:
+                        latencias.append(segundos)
+                        estados[estado] += 1
+                        encontrado = CONSULTAS_SERVER_TIMING.search(timing)
+                        consultas.append(int(encontrado.group(1)) if encontrado else 0)
+            except Exception as e:
+                errores.append(e)
+                barrera.abort()
+            finally:
+                connections.close_all()
+
+        hilos = [threading.Thread(target=trabajar, args=(cantidad,)) for cantidad in por_hilo]
+        for hilo in hilos:
+            hilo.start()
+        try:
+            barrera.wait()
+        except threading.BrokenBarrierError:
+            pass
+        inicio = time.perf_counter()
+        for hilo in hilos:
+            hilo.join()
+        duracion = time.perf_counter() - inicio
+        if errores:
+            raise CommandError(f'{url}: {errores[0]!r}')
+
+        cortes = statistics.quantiles(latencias, n=100, method='inclusive')
+        return {
+            'estados': {str(k): v for k, v in sorted(estados.items())},
+            'peticiones': len(latencias),
+            'p50_ms': round(cortes[49] * 1000, 3),
+            'p95_ms': round(cortes[94] * 1000, 3),
+            'p99_ms': round(cortes[98] * 1000, 3),
+            'media_ms': round(statistics.fmean(latencias) * 1000, 3),
+            'rps': round(len(latencias) / duracion, 1),
+            'consultas': round(statistics.fmean(consultas), 1),
+        }
+
+    # --- Salida ---
+
+    def escribir(self, resultado, nombre, clave, anterior):
+        estados = ','.join(resultado['estados'])
+        linea = (f"{nombre:<30} {clave:<15} {estados:<8} p50 {resultado['p50_ms']:8.2f}  p95 {resultado['p95_ms']:8.2f}  "
+                 f"p99 {resultado['p99_ms']:8.2f} ms  {resultado['rps']:8.1f} req/s  {resultado['consultas']:5.1f} SQL")
+        previo = anterior.get((nombre, clave)) if anterior else None
+        if previo:
+            cambio = (resultado['p95_ms'] - previo['p95_ms']) / previo['p95_ms'] * 100 if previo['p95_ms'] else 0.0
+            estilo = self.style.ERROR if cambio > 10 else self.style.SUCCESS if cambio < -10 else str
+            linea += estilo(f'  p95 {cambio:+.0f}%')
+        self.stdout.write(linea)
+
+    @staticmethod
+    def leer_resultados(path):
+        try:
+            datos = json.loads(Path(path).read_text())
+        except (OSError, ValueError) as e:
+            raise CommandError(f'No se pudo leer {path}: {e}')
+        return {(r['ruta'], r['rol']): r for r in datos.get('resultados', [])}
@@ -0,0 +1,82 @@
+# core/management/commands/microbench.py
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from core import microbench
+from core.microbench import casos  # noqa: F401 (registra los casos)
+
+
+class Command(BaseCommand):
+    help = (
+        'Microbenchmarks de cifrado, hashes, Argon2, serializers y Madre.save con calentamiento y '
+        'resumen estadístico. Compara la mediana con la línea base (core/microbench/baseline.json) '
+        'y falla si algún caso empeora más que el umbral.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--casos', nargs='+', choices=list(microbench.CASOS), help='Solo estos casos.')
+        parser.add_argument('--muestras', type=int, default=20, help='Muestras medidas por caso.')
+        parser.add_argument('--calentamiento', type=int, default=3, help='Muestras descartadas por caso.')
+        parser.add_argument('--instancias', type=int, default=100, help='Objetos por lote en los casos de serializers.')
+        parser.add_argument('--umbral', type=float, default=settings.MICROBENCH_UMBRAL,
+                            help='Alza máxima de la mediana frente a la línea base (0.25 = +25 %%).')
+        parser.add_argument('--baseline', default=str(microbench.BASELINE), help='Archivo de la línea base.')
+        parser.add_argument('--guardar-baseline', action='store_true',
+                            help='Escribe los resultados como nueva línea base (no compara).')
+        parser.add_argument('--json', help='Guarda también los resultados en este archivo.')
+
+    def handle(self, *args, **options):
+        if options['muestras'] < 2 or options['instancias'] < 1:
+            raise CommandError('--muestras debe ser al menos 2 y --instancias al menos 1.')
+        baseline = None if options['guardar_baseline'] else microbench.leer_baseline(options['baseline'])
+        if baseline and baseline.get('entorno') != microbench.entorno():
+            self.stderr.write(self.style.WARNING(
+                f"La línea base es de otro entorno ({baseline.get('entorno')}); las diferencias pueden no ser regresiones."
+            ))
+
+        resultados = {}
+        for nombre in options['casos'] or microbench.CASOS:
+            definicion = microbench.CASOS[nombre]
+            operaciones = options['instancias'] if definicion['por_instancia'] else 1
+            with transaction.atomic():
+                # Madre.save escribe; nada de lo medido queda en la base.
+                funcion = definicion['preparar'](options['instancias'])
+                resultados[nombre] = microbench.medir(
+                    funcion, operaciones, muestras=options['muestras'], calentamiento=options['calentamiento'],
+                )
+                transaction.set_rollback(True)
+            self.escribir(nombre, resultados[nombre], baseline)
+
+        if options['json']:
+            with open(options['json'], 'w', encoding='utf-8') as f:
+                json.dump({'entorno': microbench.entorno(), 'resultados': resultados}, f, indent=2)
+
+        if options['guardar_baseline']:
+            microbench.guardar_baseline(resultados, options['instancias'], options['baseline'])
+            self.stdout.write(self.style.SUCCESS(f"Línea base guardada en {options['baseline']}."))
+            return
+        if baseline is None:
+            self.stdout.write(self.style.WARNING('Sin línea base: use --guardar-baseline para crearla.'))
+            return
+
+        regresiones = microbench.regresiones(resultados, baseline, options['umbral'])
+        if regresiones:
+            detalle = '; '.join(f'{nombre} {base:.2f} -> {actual:.2f} µs ({cambio:+.0%})'
+                                for nombre, base, actual, cambio in regresiones)
+            raise CommandError(f"Regresiones sobre el umbral de {options['umbral']:+.0%}: {detalle}")
+        self.stdout.write(self.style.SUCCESS(f"Sin regresiones sobre el umbral de {options['umbral']:+.0%}."))
+
+    def escribir(self, nombre, resultado, baseline):
+        linea = (f"{nombre:<20} mediana {resultado['mediana_us']:10.2f} µs  p95 {resultado['p95_us']:10.2f}  "
+                 f"min {resultado['minimo_us']:10.2f}  ±{resultado['desviacion_us']:8.2f}")
+        base = microbench.base_comparable(nombre, baseline)
+        if base:
+            cambio = resultado['mediana_us'] / base['mediana_us'] - 1
+            estilo = self.style.ERROR if cambio > 0.1 else self.style.SUCCESS if cambio < -0.1 else str
+            linea += estilo(f'  {cambio:+.0%} vs base')
+        elif baseline and nombre in baseline['casos']:
+            linea += '  (línea base de otra base de datos, sin comparar)'
+        self.stdout.write(linea)
@@ -0,0 +1,171 @@
+# core/management/commands/rotate_keys.py
+"""
+Re-cifra con la clave primaria todas las columnas cifradas.
+
+Uso típico: mover la clave actual a FERNET_PREVIOUS_KEYS, poner la nueva en
+FERNET_ENCRYPTION_KEY, reiniciar los procesos (que ya descifran con ambas)
+y correr este comando. Se puede interrumpir y reanudar; cuando termina, la
+clave anterior puede retirarse de FERNET_PREVIOUS_KEYS.
+"""
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from cryptography.fernet import InvalidToken
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from core.utils import security_utils
+
+# modelo -> columnas cifradas con Fernet
+COLUMNAS_CIFRADAS = {
+    'pacientes.Madre': ['rut_encrypted', 'nombre_encrypted', 'telefono_encrypted', 'antecedentes_medicos'],
+    'partos.RecienNacido': ['rut_provisorio'],
+    'partos.DocumentoReferencia': ['nombre_archivo'],
+    'usuarios.Usuario': ['rut', 'nombre_completo', 'email'],
+    'auditoria.LogAuditoria': ['detalles'],
+}
+
+
+def _rotar_fila(fila):
+    """(pk, *valores) -> (pk, valores_nuevos | None si no cambia, columnas ilegibles)."""
+    pk, *valores = fila
+    nuevos, cambio, ilegibles = [], False, 0
+    for valor in valores:
+        try:
+            rotado = security_utils.rotate_token(valor) if valor else None
+        except InvalidToken:
+            rotado, ilegibles = None, ilegibles + 1
+        nuevos.append(valor if rotado is None else rotado)
+        cambio = cambio or rotado is not None
+    return pk, (nuevos if cambio else None), ilegibles
+
+
+class Command(BaseCommand):
+    help = (
+        'Re-cifra con FERNET_ENCRYPTION_KEY los datos cifrados con claves de FERNET_PREVIOUS_KEYS. '
+        'Recorre cada tabla por bloques de PK (cursor de servidor), re-cifra en un pool de hilos, '
+        'escribe con bulk_update y guarda un checkpoint para reanudar.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--modelos', nargs='+', choices=sorted(COLUMNAS_CIFRADAS),
+                            help='Limita la rotación a estos modelos (por defecto, todos).')
+        parser.add_argument('--chunk-size', type=int, default=500,
+                            help='Filas por bloque (y por transacción de escritura).')
+        parser.add_argument('--workers', type=int, default=settings.DECRYPT_BATCH_WORKERS,
+                            help='Hilos de re-cifrado (cryptography libera el GIL).')
+        parser.add_argument('--pausa', type=float, default=0.0,
+                            help='Segundos de espera entre bloques, para no competir con el tráfico.')
+        parser.add_argument('--checkpoint', default=str(settings.BASE_DIR / 'rotate_keys.checkpoint.json'),
+                            help='Archivo de avance.')
+        parser.add_argument('--reiniciar', action='store_true', help='Ignora el checkpoint existente.')
+        parser.add_argument('--dry-run', action='store_true', help='Cuenta lo que se rotaría sin escribir.')
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size debe ser mayor que 0.')
+        # Claves frescas del entorno (y caché de descifrado vacía).
+        security_utils.reload_encryption_keys()
+        if security_utils.get_fernet() is None:
+            raise CommandError('No se pudo inicializar Fernet; revise FERNET_ENCRYPTION_KEY / FERNET_PREVIOUS_KEYS.')
+
+        checkpoint_path = Path(options['checkpoint'])
+        estado = self.leer_checkpoint(checkpoint_path, options['reiniciar'] or options['dry_run'])
+        modelos = options['modelos'] or list(COLUMNAS_CIFRADAS)
+
+        with ThreadPoolExecutor(max_workers=max(options['workers'], 1), thread_name_prefix='rotate') as pool:
+            for etiqueta in modelos:
+                if etiqueta in estado['completados']:
+                    self.stdout.write(f'{etiqueta}: ya completado según el checkpoint.')
+                    continue
+                totales = self.rotar_modelo(etiqueta, estado, checkpoint_path, pool, options)
+                self.stdout.write(self.style.SUCCESS(
+                    f"{etiqueta}: {totales['revisadas']} revisadas, {totales['rotadas']} rotadas, "
+                    f"{totales['modificadas']} omitidas por escritura concurrente, "
+                    f"{totales['ilegibles']} valores ilegibles."
+                ))
+                if not options['dry_run']:
+                    estado['completados'].append(etiqueta)
+                    estado['ultimo_pk'].pop(etiqueta, None)
+                    self.escribir_checkpoint(checkpoint_path, estado)
+
+        if not options['dry_run'] and set(COLUMNAS_CIFRADAS) <= set(estado['completados']):
+            checkpoint_path.unlink(missing_ok=True)
+            self.stdout.write(self.style.SUCCESS('Rotación completa: ya se puede retirar la clave anterior.'))
+
+    def rotar_modelo(self, etiqueta, estado, checkpoint_path, pool, options):
+        modelo = apps.get_model(etiqueta)
+        columnas = COLUMNAS_CIFRADAS[etiqueta]
+        totales = dict.fromkeys(('revisadas', 'rotadas', 'modificadas', 'ilegibles'), 0)
+
+        queryset = modelo._base_manager.order_by('pk')
+        ultimo_pk = estado['ultimo_pk'].get(etiqueta)
+        if ultimo_pk is not None:
+            queryset = queryset.filter(pk__gt=ultimo_pk)
+        # iterator() usa un cursor de servidor en PostgreSQL (WITH HOLD en
+        # autocommit), así la lectura sobrevive a las transacciones de cada bloque.
+        filas = queryset.values_list('pk', *columnas).iterator(chunk_size=options['chunk_size'])
+
+        while bloque := list(itertools.islice(filas, options['chunk_size'])):
+            resultados = list(pool.map(_rotar_fila, bloque))
+            cambios = {pk: (valores, nuevos) for (pk, *valores), (_, nuevos, _) in zip(bloque, resultados) if nuevos}
+            totales['revisadas'] += len(bloque)
+            totales['ilegibles'] += sum(ilegibles for _, _, ilegibles in resultados)
+
+            if cambios and not options['dry_run']:
+                escritas = self.escribir_bloque(modelo, columnas, cambios)
+                totales['rotadas'] += escritas
+                totales['modificadas'] += len(cambios) - escritas
+            else:
+                totales['rotadas'] += len(cambios)
+
+            if not options['dry_run']:
+                estado['ultimo_pk'][etiqueta] = str(bloque[-1][0])
+                self.escribir_checkpoint(checkpoint_path, estado)
+            if options['pausa']:
+                time.sleep(options['pausa'])
+        return totales
+
+    @staticmethod
+    def escribir_bloque(modelo, columnas, cambios):
+        """
+        Bloquea solo las filas del bloque y escribe las que no cambiaron desde
+        la lectura; las que sí cambiaron ya se cifraron con la clave primaria
+        o se revisan en la próxima corrida.
+        """
+        with transaction.atomic():
+            actuales = {
+                fila[0]: list(fila[1:])
+                for fila in modelo._base_manager.filter(pk__in=list(cambios))
+                .select_for_update().values_list('pk', *columnas)
+            }
+            objetos = [
+                modelo(pk=pk, **dict(zip(columnas, nuevos)))
+                for pk, (leidos, nuevos) in cambios.items()
+                if actuales.get(pk) == leidos
+            ]
+            modelo._base_manager.bulk_update(objetos, columnas)
+        return len(objetos)
+
+    @staticmethod
+    def leer_checkpoint(path, reiniciar):
+        huella = security_utils.encryption_key_fingerprint()
+        vacio = {'clave': huella, 'completados': [], 'ultimo_pk': {}}
+        if reiniciar or not path.exists():
+            return vacio
+        estado = json.loads(path.read_text())
+        if estado.get('clave') != huella:
+            raise CommandError(f'El checkpoint {path} es de otra clave primaria; use --reiniciar.')
+        return {**vacio, **estado}
+
+    @staticmethod
+    def escribir_checkpoint(path, estado):
+        tmp = path.with_name(path.name + '.tmp')
+        tmp.write_text(json.dumps(estado))
+        os.replace(tmp, path)
@@ -0,0 +1,138 @@
+# core/management/commands/seed_synthetic.py
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from auditoria.models import LogAuditoria
+from catalogos import carga
+from catalogos.models import DiagnosticoCIE10
+from core import sintetico
+from pacientes.importacion import iniciar_worker
+from pacientes.models import Madre
+from partos import rollups
+from partos.models import Defuncion, Parto, PartoDiagnostico, RecienNacido, turno_de
+from usuarios import permissions as roles
+from usuarios.models import Rol, Usuario
+
+# (modelo, clave en el lote de core.sintetico), en orden de inserción por las FK.
+MODELOS = (
+    (Madre, 'madres'),
+    (Parto, 'partos'),
+    (RecienNacido, 'recien_nacidos'),
+    (PartoDiagnostico, 'parto_diagnosticos'),
+    (Defuncion, 'defunciones'),
+    (LogAuditoria, 'logs'),
+)
+
+# Personal sintético: (username, rol, turno).
+PERSONAL = [
+    *((f'sintetico_matrona_{t.lower().replace("ñ", "n")}', roles.ROL_MATRONA, t)
+      for t in (Usuario.TURNO_MANANA, Usuario.TURNO_TARDE, Usuario.TURNO_NOCHE)),
+    *((f'sintetico_enfermera_{t.lower().replace("ñ", "n")}', roles.ROL_ENFERMERA, t)
+      for t in (Usuario.TURNO_MANANA, Usuario.TURNO_TARDE, Usuario.TURNO_NOCHE)),
+    ('sintetico_medico', roles.ROL_MEDICO, Usuario.TURNO_NINGUNO),
+    ('sintetico_administrativo', roles.ROL_ADMINISTRATIVO, Usuario.TURNO_NINGUNO),
+    ('sintetico_admin_ti', roles.ROL_ADMIN_SISTEMA, Usuario.TURNO_NINGUNO),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Genera datos clínicos sintéticos ya cifrados (Madre, Parto, RecienNacido, PartoDiagnostico, '
+        'Defuncion, LogAuditoria) para pruebas de carga. Cifrado en un pool de procesos y bulk_create '
+        'por lotes; crea personal sintético por rol y turno (sin contraseña) y recalcula los rollups.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--madres', type=int, required=True, help='Cantidad de madres a generar.')
+        parser.add_argument('--semilla', type=int, default=1, help='Semilla de la generación (reproducible).')
+        parser.add_argument('--dias', type=int, default=365, help='Antigüedad máxima de partos y registros.')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='Procesos para hashes y cifrado (0 = en el mismo proceso).')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Madres por lote (y filas por INSERT).')
+        parser.add_argument('--sin-rollups', action='store_true', help='No recalcula IndicadorDiario al terminar.')
+
+    def handle(self, *args, **options):
+        if options['madres'] < 1 or options['batch_size'] < 1:
+            raise CommandError('--madres y --batch-size deben ser mayores que 0.')
+        if options['dias'] < 1:
+            raise CommandError('--dias debe ser mayor que 0.')
+
+        registradores = self.asegurar_personal()
+        diagnosticos = self.asegurar_diagnosticos()
+        # Continúa la numeración de corridas anteriores: RUT y ficha son únicos.
+        desde = Madre.objects.filter(ficha_clinica_id__startswith=sintetico.PREFIJO_FICHA).count()
+        lotes = [
+            (options['semilla'], inicio, min(options['batch_size'], desde + options['madres'] - inicio),
+             registradores, diagnosticos, options['dias'])
+            for inicio in range(desde, desde + options['madres'], options['batch_size'])
+        ]
+
+        inicio = time.perf_counter()
+        totales = dict.fromkeys((clave for _, clave in MODELOS), 0)
+        for filas in self.preparar(lotes, options['workers']):
+            with transaction.atomic():
+                for modelo, clave in MODELOS:
+                    modelo.objects.bulk_create((modelo(**campos) for campos in filas[clave]),
+                                               batch_size=options['batch_size'])
+                    totales[clave] += len(filas[clave])
+            self.stdout.write(f"  {totales['madres']} / {options['madres']} madres", ending='\r')
+        self.stdout.write('')
+
+        resumen = ', '.join(f'{cantidad} {clave}' for clave, cantidad in totales.items())
+        self.stdout.write(self.style.SUCCESS(f'Generado: {resumen} en {time.perf_counter() - inicio:.1f} s.'))
+        if not options['sin_rollups']:
+            filas = rollups.reconstruir()
+            self.stdout.write(self.style.SUCCESS(f'IndicadorDiario recalculado: {filas} filas.'))
+
+    def preparar(self, lotes, workers):
+        """Entrega los lotes generados en orden, con a lo más 2 lotes en vuelo por worker."""
+        if workers <= 0:
+            yield from (sintetico.preparar_lote(*lote) for lote in lotes)
+            return
+        with ProcessPoolExecutor(max_workers=workers, initializer=iniciar_worker) as pool:
+            en_vuelo = deque()
+            for lote in lotes:
+                en_vuelo.append(pool.submit(sintetico.preparar_lote, *lote))
+                if len(en_vuelo) >= workers * 2:
+                    yield en_vuelo.popleft().result()
+            while en_vuelo:
+                yield en_vuelo.popleft().result()
+
+    def asegurar_personal(self):
+        """Crea (si faltan) los usuarios sintéticos y devuelve sus ids por función (y el turno de cada uno)."""
+        existentes = {u.username: u for u in Usuario.objects.filter(username__in=[p[0] for p in PERSONAL])}
+        for numero, (username, rol, turno) in enumerate(PERSONAL, start=1):
+            if username not in existentes:
+                existentes[username] = Usuario.objects.create_user(
+                    username, password=None, rol=Rol.objects.get_or_create(nombre=rol)[0], turno=turno,
+                    rut=sintetico.rut(sintetico.RUT_BASE - numero), nombre_completo=f'Personal sintético {numero}',
+                )
+                self.stdout.write(f'Usuario {username} creado ({rol}, {turno}).')
+
+        def ids(*nombres_rol):
+            return [str(existentes[username].pk) for username, rol, _ in PERSONAL if rol in nombres_rol]
+
+        return {
+            'admision': ids(roles.ROL_ADMINISTRATIVO),
+            'partos': ids(roles.ROL_MATRONA, roles.ROL_ENFERMERA),
+            'medicos': ids(roles.ROL_MEDICO),
+            'turnos': {str(usuario.pk): turno_de(usuario) for usuario in existentes.values()},
+        }
+
+    def asegurar_diagnosticos(self):
+        """Carga los códigos de CIE10_BASE que falten y devuelve {codigo: id}."""
+        codigos = [codigo for codigo, _ in sintetico.CIE10_BASE]
+        presentes = set(DiagnosticoCIE10.objects.filter(codigo__in=codigos).values_list('codigo', flat=True))
+        faltantes = [(codigo, descripcion) for codigo, descripcion in sintetico.CIE10_BASE if codigo not in presentes]
+        if faltantes:
+            carga.cargar(faltantes)
+            self.stdout.write(f'CIE-10: {len(faltantes)} códigos cargados.')
+        return {
+            codigo: str(pk)
+            for codigo, pk in DiagnosticoCIE10.objects.filter(codigo__in=codigos).values_list('codigo', 'pk')
+        }
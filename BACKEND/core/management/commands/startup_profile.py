@@ -0,0 +1,95 @@
+# core/management/commands/startup_profile.py
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Se ejecuta en un proceso limpio con 'python -X importtime' para medir un
+# arranque en frío real (este proceso ya tiene todo importado).
+PROBE = """
+import json, time
+t0 = time.perf_counter()
+import django
+t1 = time.perf_counter()
+django.setup()
+t2 = time.perf_counter()
+from django.urls import get_resolver
+get_resolver().url_patterns
+t3 = time.perf_counter()
+phases = {'import django': t1 - t0, 'django.setup()': t2 - t1, 'URLconf': t3 - t2}
+if %(crypto)r:
+    from core.utils.security_utils import encrypt_data
+    encrypt_data('startup_profile')
+    phases['primer cifrado (carga de clave)'] = time.perf_counter() - t3
+print(json.dumps(phases))
+"""
+
+
+class Command(BaseCommand):
+    help = 'Mide el arranque en frío del proceso Django y muestra en qué imports se va el tiempo.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=20, help='Cantidad de módulos a mostrar.')
+        parser.add_argument('--budget-ms', type=float, default=None,
+                            help='Falla si el arranque (sin cifrado) supera este tiempo en ms.')
+        parser.add_argument('--include-crypto', action='store_true',
+                            help='Mide también el primer cifrado (carga/derivación de la clave Fernet).')
+
+    def handle(self, *args, **options):
+        env = os.environ.copy()
+        env.setdefault('DJANGO_SETTINGS_MODULE', settings.SETTINGS_MODULE)
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', PROBE % {'crypto': options['include_crypto']}],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            raise CommandError(f"El proceso de medición falló:\n{proc.stderr[-2000:]}")
+
+        phases = json.loads(proc.stdout.strip().splitlines()[-1])
+        modules, packages = self._parse_importtime(proc.stderr)
+
+        self.stdout.write(self.style.MIGRATE_HEADING('Fases de arranque'))
+        startup_ms = 0.0
+        for name, seconds in phases.items():
+            ms = seconds * 1000
+            if not name.startswith('primer cifrado'):
+                startup_ms += ms
+            self.stdout.write(f"  {name:<34} {ms:9.1f} ms")
+        self.stdout.write(f"  {'TOTAL arranque':<34} {startup_ms:9.1f} ms")
+
+        top = options['top']
+        self.stdout.write(self.style.MIGRATE_HEADING(f'\nPaquetes raíz por tiempo propio (top {top})'))
+        for name, us in sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+            self.stdout.write(f"  {name:<40} {us / 1000:9.1f} ms")
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'\nMódulos por tiempo acumulado (top {top})'))
+        for name, self_us, cumulative_us in sorted(modules, key=lambda m: m[2], reverse=True)[:top]:
+            self.stdout.write(f"  {name:<50} {cumulative_us / 1000:9.1f} ms  (propio {self_us / 1000:.1f} ms)")
+
+        budget = options['budget_ms']
+        if budget is not None:
+            if startup_ms > budget:
+                raise CommandError(f"Arranque de {startup_ms:.1f} ms supera el presupuesto de {budget:.1f} ms.")
+            self.stdout.write(self.style.SUCCESS(f"\nArranque dentro del presupuesto ({startup_ms:.1f} / {budget:.1f} ms)."))
+
+    @staticmethod
+    def _parse_importtime(stderr):
+        """Devuelve [(módulo, propio_us, acumulado_us)] y {paquete_raíz: propio_us}."""
+        modules = []
+        packages = defaultdict(int)
+        for line in stderr.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            try:
+                self_us, cumulative_us, name = line[len('import time:'):].split('|')
+                self_us, cumulative_us = int(self_us), int(cumulative_us)
+            except ValueError:
+                continue  # Cabecera
+            name = name.strip()
+            modules.append((name, self_us, cumulative_us))
+            packages[name.split('.')[0]] += self_us
+        return modules, packages
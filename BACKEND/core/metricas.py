@@ -0,0 +1,278 @@
+# core/metricas.py
+"""
+Métricas por vista y acción: latencia (histograma), consultas SQL (cantidad y
+tiempo) y operaciones Fernet (cantidad y tiempo de cifrado/descifrado).
+
+MetricasMiddleware abre una medición por petición en una ContextVar; el
+wrapper de SQL (instalado en cada conexión) y security_utils suman en ella.
+Al terminar, la medición se acumula en el registro del proceso y se resume
+en la cabecera Server-Timing. /api/metrics (core.views) exporta el registro
+en formato de texto de Prometheus.
+
+El registro es por proceso: con varios workers, Prometheus debe raspar cada
+uno (o agregarse aguas arriba). Costo por petición: unos pocos
+perf_counter() y un lock sin contención.
+"""
+import bisect
+import contextvars
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_medicion_actual = contextvars.ContextVar('medicion_peticion', default=None)
+
+
+class Medicion:
+    """Acumulados de una petición. Los hilos del pool de descifrado suman en paralelo."""
+    __slots__ = ('inicio', 'consultas', 'segundos_sql', 'descifrados', 'segundos_descifrado',
+                 'cifrados', 'segundos_cifrado', '_lock')
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.consultas = 0
+        self.segundos_sql = 0.0
+        self.descifrados = 0
+        self.segundos_descifrado = 0.0
+        self.cifrados = 0
+        self.segundos_cifrado = 0.0
+        self._lock = threading.Lock()
+
+    def sumar_sql(self, segundos):
+        with self._lock:
+            self.consultas += 1
+            self.segundos_sql += segundos
+
+    def sumar_fernet(self, operacion, segundos):
+        with self._lock:
+            if operacion == 'decrypt':
+                self.descifrados += 1
+                self.segundos_descifrado += segundos
+            else:
+                self.cifrados += 1
+                self.segundos_cifrado += segundos
+
+
+def registrar_fernet(operacion, segundos):
+    """Llamado por security_utils en cada encrypt/decrypt real ('encrypt' | 'decrypt')."""
+    medicion = _medicion_actual.get()
+    if medicion is not None:
+        medicion.sumar_fernet(operacion, segundos)
+
+
+def en_contexto_actual(funcion):
+    """
+    'funcion' lista para ejecutarse en un pool de hilos sumando a la medición
+    de la petición actual (ThreadPoolExecutor no propaga ContextVars).
+    """
+    contexto = contextvars.copy_context()
+    return lambda *args: contexto.copy().run(funcion, *args)
+
+
+def medir_sql(execute, sql, params, many, context):
+    medicion = _medicion_actual.get()
+    if medicion is None:
+        return execute(sql, params, many, context)
+    inicio = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        medicion.sumar_sql(time.perf_counter() - inicio)
+
+
+@receiver(connection_created)
+def instalar_medicion_sql(sender, connection, **kwargs):
+    if medir_sql not in connection.execute_wrappers:
+        connection.execute_wrappers.append(medir_sql)
+
+
+class RegistroMetricas:
+    """Series acumuladas del proceso, por (vista, acción, método)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series = {}
+        self._respuestas = {}
+
+    def observar(self, etiquetas, estado, duracion, medicion):
+        with self._lock:
+            serie = self._series.get(etiquetas)
+            if serie is None:
+                serie = self._series[etiquetas] = {
+                    'buckets': [0] * len(BUCKETS), 'suma': 0.0, 'total': 0,
+                    'consultas': 0, 'segundos_sql': 0.0,
+                    'descifrados': 0, 'segundos_descifrado': 0.0,
+                    'cifrados': 0, 'segundos_cifrado': 0.0,
+                }
+            indice = bisect.bisect_left(BUCKETS, duracion)
+            if indice < len(BUCKETS):
+                serie['buckets'][indice] += 1
+            serie['suma'] += duracion
+            serie['total'] += 1
+            serie['consultas'] += medicion.consultas
+            serie['segundos_sql'] += medicion.segundos_sql
+            serie['descifrados'] += medicion.descifrados
+            serie['segundos_descifrado'] += medicion.segundos_descifrado
+            serie['cifrados'] += medicion.cifrados
+            serie['segundos_cifrado'] += medicion.segundos_cifrado
+            clave = etiquetas + (f'{estado // 100}xx',)
+            self._respuestas[clave] = self._respuestas.get(clave, 0) + 1
+
+    def copiar(self):
+        with self._lock:
+            series = {k: {**v, 'buckets': list(v['buckets'])} for k, v in self._series.items()}
+            return series, dict(self._respuestas)
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+            self._respuestas.clear()
+
+
+registro_metricas = RegistroMetricas()
+
+
+def _etiquetas(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return ('sin_ruta', '', request.method)
+    func = match.func
+    clase = getattr(func, 'cls', None) or getattr(func, 'view_class', None)
+    vista = clase.__name__ if clase else (match.view_name or getattr(func, '__name__', ''))
+    acciones = getattr(func, 'actions', None) or {}
+    return (vista, acciones.get(request.method.lower(), ''), request.method)
+
+
+def _server_timing(duracion, medicion):
+    partes = [f'total;dur={duracion * 1000:.1f}']
+    if medicion.consultas:
+        partes.append(f'db;dur={medicion.segundos_sql * 1000:.1f};desc="{medicion.consultas} consultas"')
+    operaciones = medicion.descifrados + medicion.cifrados
+    if operaciones:
+        segundos = medicion.segundos_descifrado + medicion.segundos_cifrado
+        partes.append(f'fernet;dur={segundos * 1000:.1f};desc="{operaciones} operaciones"')
+    return ', '.join(partes)
+
+
+class MetricasMiddleware:
+    """Mide cada petición (síncrona o ASGI). Va primero en MIDDLEWARE."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        for connection in connections.all(initialized_only=True):
+            instalar_medicion_sql(None, connection)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not settings.METRICAS_HABILITADAS:
+            return self.get_response(request)
+        medicion = Medicion()
+        token = _medicion_actual.set(medicion)
+        try:
+            response = self.get_response(request)
+        finally:
+            _medicion_actual.reset(token)
+        return self._terminar(request, response, medicion)
+
+    async def __acall__(self, request):
+        if not settings.METRICAS_HABILITADAS:
+            return await self.get_response(request)
+        medicion = Medicion()
+        token = _medicion_actual.set(medicion)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _medicion_actual.reset(token)
+        return self._terminar(request, response, medicion)
+
+    def _terminar(self, request, response, medicion):
+        duracion = time.perf_counter() - medicion.inicio
+        registro_metricas.observar(_etiquetas(request), response.status_code, duracion, medicion)
+        if settings.METRICAS_SERVER_TIMING:
+            response['Server-Timing'] = _server_timing(duracion, medicion)
+        return response
+
+
+# --- Exportación (texto de Prometheus) ---
+
+def _escapar(valor):
+    return str(valor).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(**etiquetas):
+    if not etiquetas:
+        return ''
+    return '{' + ','.join(f'{k}="{_escapar(v)}"' for k, v in etiquetas.items()) + '}'
+
+
+def _numero(valor):
+    return repr(float(valor)) if isinstance(valor, float) else str(valor)
+
+
+def exportar():
+    from core.utils.security_utils import decrypt_cache_stats
+    from usuarios.login import costo_verificacion
+
+    series, respuestas = registro_metricas.copiar()
+    lineas = []
+
+    def metrica(nombre, tipo, ayuda, muestras):
+        lineas.append(f'# HELP {nombre} {ayuda}')
+        lineas.append(f'# TYPE {nombre} {tipo}')
+        for sufijo, etiquetas, valor in muestras:
+            lineas.append(f'{nombre}{sufijo}{_labels(**etiquetas)} {_numero(valor)}')
+
+    def por_serie(campo):
+        return [('', dict(view=v, action=a, method=m), serie[campo]) for (v, a, m), serie in sorted(series.items())]
+
+    histograma = []
+    for (vista, accion, metodo), serie in sorted(series.items()):
+        base = dict(view=vista, action=accion, method=metodo)
+        acumulado = 0
+        for limite, cantidad in zip(BUCKETS, serie['buckets']):
+            acumulado += cantidad
+            histograma.append(('_bucket', {**base, 'le': _numero(limite)}, acumulado))
+        histograma.append(('_bucket', {**base, 'le': '+Inf'}, serie['total']))
+        histograma.append(('_sum', base, serie['suma']))
+        histograma.append(('_count', base, serie['total']))
+    metrica('http_request_duration_seconds', 'histogram', 'Latencia de la petición por vista y acción.', histograma)
+    metrica('http_responses_total', 'counter', 'Respuestas por vista, acción y clase de estado.', [
+        ('', dict(view=v, action=a, method=m, status=e), n) for (v, a, m, e), n in sorted(respuestas.items())
+    ])
+    metrica('db_queries_total', 'counter', 'Consultas SQL ejecutadas.', por_serie('consultas'))
+    metrica('db_query_seconds_total', 'counter', 'Tiempo en consultas SQL.', por_serie('segundos_sql'))
+    metrica('fernet_operations_total', 'counter', 'Operaciones Fernet (cifrado/descifrado).', [
+        ('', dict(view=v, action=a, method=m, op=op), serie[campo])
+        for (v, a, m), serie in sorted(series.items())
+        for op, campo in (('decrypt', 'descifrados'), ('encrypt', 'cifrados'))
+    ])
+    metrica('fernet_seconds_total', 'counter', 'Tiempo en operaciones Fernet.', [
+        ('', dict(view=v, action=a, method=m, op=op), serie[campo])
+        for (v, a, m), serie in sorted(series.items())
+        for op, campo in (('decrypt', 'segundos_descifrado'), ('encrypt', 'segundos_cifrado'))
+    ])
+
+    cache = decrypt_cache_stats()
+    metrica('decrypt_cache_hits_total', 'counter', 'Aciertos de la caché de descifrado.', [('', {}, cache['hits'])])
+    metrica('decrypt_cache_misses_total', 'counter', 'Fallos de la caché de descifrado.', [('', {}, cache['misses'])])
+    metrica('decrypt_cache_entries', 'gauge', 'Entradas en la caché de descifrado.', [('', {}, cache['entries'])])
+
+    login = costo_verificacion.stats()
+    metrica('login_password_verifications_total', 'counter', 'Verificaciones de contraseña.', [('', {}, login['verificaciones'])])
+    metrica('login_password_verification_seconds_total', 'counter', 'Tiempo en verificaciones de contraseña.', [
+        ('', {}, login['promedio_ms'] * login['verificaciones'] / 1000)
+    ])
+    metrica('login_password_rehash_total', 'counter', 'Hashes recalculados con los parámetros vigentes.', [('', {}, login['rehashes'])])
+    return '\n'.join(lineas) + '\n'
@@ -0,0 +1,133 @@
+# core/microbench/__init__.py
+"""
+Microbenchmarks de los caminos calientes de CPU (cifrado, hashes,
+serialización) con una línea base versionada (baseline.json).
+
+Cada caso (casos.py) se registra con @caso y devuelve la función a medir.
+medir() calibra cuántas llamadas caben en una muestra de al menos
+MUESTRA_MINIMA segundos (como timeit.autorange), descarta las muestras de
+calentamiento y resume el resto en tiempo por operación. Se compara la
+mediana: es estable frente a pausas ocasionales del sistema.
+
+La línea base es por máquina: regenerarla (manage.py microbench
+--guardar-baseline) al cambiar el equipo o el intérprete con el que se
+compara. Los casos con base_datos=True tampoco se comparan contra una línea
+base tomada con otro motor de base de datos.
+"""
+import gc
+import json
+import platform
+import statistics
+import time
+from pathlib import Path
+
+from django.db import connection
+
+BASELINE = Path(__file__).with_name('baseline.json')
+MUESTRA_MINIMA = 0.02
+
+CASOS = {}
+
+
+def caso(nombre, por_instancia=False, base_datos=False):
+    """
+    Registra un caso. La función decorada recibe 'instancias' (tamaño de
+    los casos por lote) y devuelve la función sin argumentos a medir. Con
+    por_instancia=True cada llamada procesa 'instancias' objetos y el tiempo
+    se informa por objeto.
+    """
+    def registrar(preparar):
+        CASOS[nombre] = {'preparar': preparar, 'por_instancia': por_instancia, 'base_datos': base_datos}
+        return preparar
+    return registrar
+
+
+def _cronometrar(funcion, llamadas):
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        inicio = time.perf_counter()
+        for _ in range(llamadas):
+            funcion()
+        return time.perf_counter() - inicio
+    finally:
+        if gc_activo:
+            gc.enable()
+
+
+def calibrar(funcion):
+    """Llamadas por muestra para que cada una dure al menos MUESTRA_MINIMA."""
+    llamadas = 1
+    while True:
+        if _cronometrar(funcion, llamadas) >= MUESTRA_MINIMA or llamadas >= 1 << 20:
+            return llamadas
+        llamadas *= 2
+
+
+def medir(funcion, operaciones=1, muestras=20, calentamiento=3):
+    """Resumen en microsegundos por operación."""
+    llamadas = calibrar(funcion)
+    for _ in range(calentamiento):
+        _cronometrar(funcion, llamadas)
+    tiempos = sorted(
+        _cronometrar(funcion, llamadas) / (llamadas * operaciones) * 1e6 for _ in range(muestras)
+    )
+    return {
+        'mediana_us': statistics.median(tiempos),
+        'media_us': statistics.fmean(tiempos),
+        'desviacion_us': statistics.stdev(tiempos) if len(tiempos) > 1 else 0.0,
+        'minimo_us': tiempos[0],
+        'p95_us': tiempos[min(len(tiempos) - 1, round(0.95 * (len(tiempos) - 1)))],
+        'muestras': muestras,
+        'llamadas_por_muestra': llamadas,
+    }
+
+
+def entorno():
+    return {
+        'python': platform.python_version(),
+        'implementacion': platform.python_implementation(),
+        'maquina': platform.machine(),
+        'sistema': platform.system(),
+        'procesador': platform.processor() or None,
+        'base_datos': connection.vendor,
+    }
+
+
+def leer_baseline(path=BASELINE):
+    path = Path(path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def guardar_baseline(resultados, instancias, path=BASELINE):
+    Path(path).write_text(json.dumps({
+        'entorno': entorno(),
+        'instancias': instancias,
+        'casos': {nombre: {k: round(v, 3) if isinstance(v, float) else v for k, v in r.items()}
+                  for nombre, r in sorted(resultados.items())},
+    }, indent=2, ensure_ascii=False) + '\n')
+
+
+def base_comparable(nombre, baseline):
+    """Resultado de la línea base para 'nombre', o None si no se puede comparar."""
+    base = baseline['casos'].get(nombre) if baseline else None
+    if not base or not base['mediana_us']:
+        return None
+    if CASOS.get(nombre, {}).get('base_datos') and baseline['entorno'].get('base_datos') != connection.vendor:
+        return None
+    return base
+
+
+def regresiones(resultados, baseline, umbral):
+    """[(caso, mediana_base, mediana_actual, cambio)] de los casos que superan 'umbral' (0.2 = +20 %)."""
+    encontradas = []
+    for nombre, resultado in resultados.items():
+        base = base_comparable(nombre, baseline)
+        if base is None:
+            continue
+        cambio = resultado['mediana_us'] / base['mediana_us'] - 1
+        if cambio > umbral:
+            encontradas.append((nombre, base['mediana_us'], resultado['mediana_us'], cambio))
+    return encontradas
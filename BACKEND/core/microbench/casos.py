@@ -0,0 +1,128 @@
+# core/microbench/casos.py
+"""
+Casos de core.microbench. Los datos se arman en memoria (instancias sin
+guardar con los FK ya asignados): los serializers no tocan la base de datos.
+Madre.save sí escribe; el comando lo ejecuta dentro de una transacción que
+se revierte.
+"""
+import itertools
+import uuid
+
+from django.utils import timezone
+
+from core.utils import security_utils
+from core.utils.security_utils import create_search_hash, decrypt_data, encrypt_data
+from . import caso
+
+TEXTO = 'María José González Soto'
+CONTRASENA = 'Benchmark-2024!'
+
+
+def _madres(instancias):
+    from pacientes.models import Madre
+
+    return [
+        Madre(
+            id=uuid.uuid4(), ficha_clinica_id=f'MB-{i}',
+            rut_encrypted=encrypt_data(f'{10_000_000 + i}-{i % 10}'), nombre_encrypted=encrypt_data(f'{TEXTO} {i}'),
+            telefono_encrypted=encrypt_data(f'+5691234{i:04d}'), antecedentes_medicos=encrypt_data('Sin antecedentes mórbidos.'),
+            fecha_registro=timezone.now(), fecha_modificacion=timezone.now(),
+        )
+        for i in range(instancias)
+    ]
+
+
+@caso('encrypt_data')
+def cifrar(instancias):
+    return lambda: encrypt_data(TEXTO)
+
+
+@caso('decrypt_data')
+def descifrar(instancias):
+    """Descifrado real: se vacía la caché de descifrado antes de cada llamada."""
+    cifrado = encrypt_data(TEXTO)
+
+    def funcion():
+        security_utils.clear_decrypt_cache()
+        decrypt_data(cifrado)
+    return funcion
+
+
+@caso('decrypt_data_cache')
+def descifrar_cache(instancias):
+    cifrado = encrypt_data(TEXTO)
+    decrypt_data(cifrado)
+    return lambda: decrypt_data(cifrado)
+
+
+@caso('create_search_hash')
+def hash_busqueda(instancias):
+    return lambda: create_search_hash('12.345.678-9')
+
+
+@caso('argon2_hash')
+def argon2_hash(instancias):
+    """El hasher de producción (PASSWORD_HASHERS[0]), con los parámetros ARGON2_* vigentes."""
+    from usuarios.hashers import Argon2PasswordHasher
+
+    hasher = Argon2PasswordHasher()
+    return lambda: hasher.encode(CONTRASENA, hasher.salt())
+
+
+@caso('argon2_verify')
+def argon2_verify(instancias):
+    from usuarios.hashers import Argon2PasswordHasher
+
+    hasher = Argon2PasswordHasher()
+    encoded = hasher.encode(CONTRASENA, hasher.salt())
+    return lambda: hasher.verify(CONTRASENA, encoded)
+
+
+def _serializar(serializer_class, instancias):
+    def funcion():
+        # En frío: cada lote descifra todo, como la primera lectura de una página.
+        security_utils.clear_decrypt_cache()
+        serializer_class(instancias, many=True).data
+    return funcion
+
+
+@caso('MadreSerializer', por_instancia=True)
+def madre_serializer(instancias):
+    from pacientes.serializers import MadreSerializer
+
+    return _serializar(MadreSerializer, _madres(instancias))
+
+
+@caso('PartoSerializer', por_instancia=True)
+def parto_serializer(instancias):
+    from partos.models import Parto
+    from partos.serializers import PartoSerializer
+    from usuarios.models import Usuario
+
+    usuario = Usuario(id=uuid.uuid4(), username='microbench', turno=Usuario.TURNO_MANANA)
+    partos = [
+        Parto(
+            id=uuid.uuid4(), madre=madre, usuario_registro=usuario, fecha_parto=timezone.now(), edad_gestacional=39,
+            tipo_parto='Eutócico', anestesia='Epidural', fecha_registro=timezone.now(), fecha_modificacion=timezone.now(),
+        )
+        for madre in _madres(instancias)
+    ]
+    return _serializar(PartoSerializer, partos)
+
+
+@caso('Madre.save', base_datos=True)
+def madre_save(instancias):
+    """Alta con datos en texto plano: 3 hashes, 4 cifrados y el INSERT."""
+    from pacientes.models import Madre
+
+    contador = itertools.count()
+
+    def funcion():
+        i = next(contador)
+        madre = Madre(ficha_clinica_id=f'MB-SAVE-{i}')
+        madre.set_rut(f'{20_000_000 + i}-K')
+        madre.set_nombre(f'{TEXTO} {i}')
+        madre.set_telefono(f'+5698765{i % 10000:04d}')
+        madre.set_antecedentes('Sin antecedentes mórbidos.')
+        madre.save()
+    return funcion
@@ -0,0 +1,211 @@
+# core/pagination.py
+import base64
+import json
+
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginación por cursor (keyset) sobre la clave de orden de la vista + 'id'.
+
+    El cursor es opaco (base64) y guarda los valores de la última fila vista,
+    así que la página N se resuelve con un WHERE sobre el índice compuesto en
+    lugar de un OFFSET. Nunca se ejecuta COUNT(*).
+
+    La vista declara su orden con el atributo 'ordering', ej.:
+        ordering = ('-fecha_parto', '-id')
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 50
+    max_page_size = 500
+    ordering = ('-fecha_registro', '-id')
+    invalid_cursor_message = 'Cursor inválido.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self._paginar(list(self._consulta_pagina(queryset, request, view)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Igual que paginate_queryset, con el ORM asíncrono (vistas de core.asincrono)."""
+        return self._paginar([row async for row in self._consulta_pagina(queryset, request, view)])
+
+    def _consulta_pagina(self, queryset, request, view):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(view)
+        self.page_size = self.get_page_size(request)
+
+        cursor = self.decode_cursor(request, queryset.model)
+        self.reverse = bool(cursor and cursor['reverse'])
+        self.has_cursor = cursor is not None
+
+        if cursor is not None:
+            queryset = queryset.filter(self._keyset_filter(cursor['position'], self.reverse))
+
+        order = [self._invert(field) for field in self.ordering] if self.reverse else list(self.ordering)
+        # Se pide una fila extra solo para saber si existe otra página.
+        return queryset.order_by(*order)[:self.page_size + 1]
+
+    def _paginar(self, rows):
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if self.reverse:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.has_cursor
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    # --- Configuración ---
+
+    def get_ordering(self, view):
+        ordering = tuple(getattr(view, 'ordering', None) or self.ordering)
+        if ordering[-1].lstrip('-') not in ('id', 'pk'):
+            # 'id' desempata filas con la misma fecha.
+            ordering += ('-id' if ordering[0].startswith('-') else 'id',)
+        return ordering
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    # --- Cursores ---
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self._position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self._position(self.page[0]), reverse=True)
+
+    def encode_cursor(self, position, reverse):
+        # str() conserva los microsegundos de las fechas (DjangoJSONEncoder los trunca
+        # a milisegundos y el filtro de igualdad dejaría de coincidir).
+        payload = json.dumps({'p': position, 'r': int(reverse)}, default=str, separators=(',', ':'))
+        token = base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request, model):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode('ascii')).decode('utf-8'))
+            values = payload['p']
+            if len(values) != len(self.ordering):
+                raise ValueError
+            position = [
+                model._meta.get_field(self._field_name(field)).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+            return {'position': position, 'reverse': bool(payload.get('r'))}
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+    # --- Auxiliares ---
+
+    def _position(self, instance):
+        return [getattr(instance, self._field_name(field)) for field in self.ordering]
+
+    def _keyset_filter(self, position, reverse):
+        """
+        Comparación lexicográfica (a, b) < (x, y) expresada como
+        (a < x) OR (a = x AND b < y), respetando la dirección de cada campo.
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            name = self._field_name(field)
+            descending = field.startswith('-') != reverse
+            lookup = f'{name}__lt' if descending else f'{name}__gt'
+            condition |= equal & Q(**{lookup: value})
+            equal &= Q(**{name: value})
+        return condition
+
+    @staticmethod
+    def _field_name(field):
+        name = field.lstrip('-')
+        return 'id' if name == 'pk' else name
+
+    @staticmethod
+    def _invert(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+
+def estimate_count(queryset):
+    """
+    Filas estimadas por el planificador (EXPLAIN) en lugar de un COUNT(*) exacto.
+    En motores distintos de PostgreSQL (desarrollo) cae a count().
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountKeysetPagination(KeysetPagination):
+    """KeysetPagination que además informa 'total_estimado' (estimación del planificador)."""
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.estimated_total = estimate_count(queryset)
+        return super().paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        self.estimated_total = await sync_to_async(estimate_count)(queryset)
+        return await super().apaginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data = {'total_estimado': self.estimated_total, **response.data}
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['total_estimado'] = {'type': 'integer'}
+        return response_schema
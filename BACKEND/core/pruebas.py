@@ -0,0 +1,257 @@
+# core/pruebas.py
+"""
+Presupuesto de consultas SQL y descifrados por ruta del router (tests).
+
+Cada app declara en su tests.py, para cada ruta GET de su router, cuántas
+consultas SQL puede ejecutar y cuántos descifrados Fernet puede hacer por
+fila devuelta:
+
+    class PresupuestoConsultasTests(PresupuestoConsultasMixin, TestCase):
+        router = urls.router
+        presupuestos = {
+            # nombre de ruta: (máx. consultas, máx. descifrados por fila)
+            'madre-list': (1, 4),
+            'madre-detail': (1, 4),
+        }
+
+El mixin siembra un conjunto fijo de datos y usuarios (uno por rol) y
+verifica:
+  - que toda ruta GET del router tenga presupuesto (y que no sobren);
+  - el presupuesto de cada ruta con cada rol (también si responde 403);
+  - que las consultas de las listas no crezcan con las filas (10 vs 1000):
+    un N+1 en un serializer o un permiso falla aquí aunque el presupuesto
+    absoluto sea holgado.
+
+Se mide la segunda petición a cada URL (la primera calienta las cachés de
+proceso: roles, versiones de sesión, catálogo). La caché de descifrado se
+vacía antes de medir.
+"""
+import threading
+import uuid
+from datetime import timedelta
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.utils.security_utils import clear_decrypt_cache, create_search_hash, encrypt_data
+
+FILAS_BASE = 10
+FILAS_ESCALA = 1000
+
+
+class ContadorDescifrados:
+    """Reemplaza a security_utils.registrar_fernet y cuenta los decrypt (también desde el pool)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = 0
+
+    def __call__(self, operacion, segundos):
+        if operacion == 'decrypt':
+            with self._lock:
+                self.total += 1
+
+
+def crear_usuarios():
+    """Un usuario por rol; Matrona y Enfermera con turno (vista restringida)."""
+    from usuarios import permissions as p
+    from usuarios.models import Rol, Usuario
+
+    definiciones = {
+        'matrona': (p.ROL_MATRONA, Usuario.TURNO_MANANA),
+        'enfermera': (p.ROL_ENFERMERA, Usuario.TURNO_NOCHE),
+        'medico': (p.ROL_MEDICO, Usuario.TURNO_NINGUNO),
+        'administrativo': (p.ROL_ADMINISTRATIVO, Usuario.TURNO_NINGUNO),
+        'admin_ti': (p.ROL_ADMIN_SISTEMA, Usuario.TURNO_NINGUNO),
+    }
+    usuarios = {}
+    for i, (clave, (rol, turno)) in enumerate(definiciones.items()):
+        usuarios[clave] = Usuario.objects.create_user(
+            f'presupuesto_{clave}', password=None,
+            rol=Rol.objects.get_or_create(nombre=rol)[0], turno=turno,
+            rut=f'{i + 1}-{i}', nombre_completo=f'Usuario {clave}', email=f'{clave}@presupuesto.test',
+        )
+    return usuarios
+
+
+def sembrar(cantidad, usuarios):
+    """
+    'cantidad' filas de cada modelo clínico (madres, partos, RN, defunciones,
+    documentos, diagnósticos, logs), repartidas entre los usuarios. Se usa
+    bulk_create con los valores ya cifrados: no dispara señales (rollups) ni
+    save(), así que el turno se asigna aquí.
+    """
+    from auditoria.models import LogAuditoria
+    from catalogos.models import DiagnosticoCIE10
+    from pacientes.models import Madre
+    from partos.models import DocumentoReferencia, Defuncion, Parto, PartoDiagnostico, RecienNacido, turno_de
+
+    lote = uuid.uuid4().hex[:8]
+    ahora = timezone.now()
+    registradores = list(usuarios.values())
+
+    def cifrado(campo, i):
+        # Un texto cifrado distinto por fila: la caché de descifrado no debe ocultar un descifrado por fila.
+        return encrypt_data(f'{campo}-{lote}-{i}')
+
+    diagnosticos = DiagnosticoCIE10.objects.bulk_create(
+        DiagnosticoCIE10(codigo=f'Z{lote[:4]}.{i}', descripcion=f'Diagnóstico {lote} {i}')
+        for i in range(cantidad)
+    )
+    madres = Madre.objects.bulk_create(
+        Madre(
+            rut_hash=create_search_hash(f'{lote}-{i}'), rut_encrypted=cifrado('rut', i),
+            nombre_encrypted=cifrado('nombre', i), telefono_encrypted=cifrado('telefono', i),
+            antecedentes_medicos=cifrado('antecedentes', i), ficha_clinica_id=f'{lote}-{i}',
+        )
+        for i in range(cantidad)
+    )
+    partos = Parto.objects.bulk_create(
+        Parto(
+            madre=madre, fecha_parto=ahora - timedelta(hours=i), tipo_parto='Eutócico',
+            usuario_registro=registradores[i % len(registradores)],
+            turno=turno_de(registradores[i % len(registradores)]),
+        )
+        for i, madre in enumerate(madres)
+    )
+    recien_nacidos = RecienNacido.objects.bulk_create(
+        RecienNacido(
+            parto=parto, rut_provisorio=cifrado('rut_provisorio', i), estado_al_nacer='Vivo', sexo='Femenino',
+            peso_gramos=3200, usuario_registro=parto.usuario_registro, turno=parto.turno,
+        )
+        for i, parto in enumerate(partos)
+    )
+    PartoDiagnostico.objects.bulk_create(
+        PartoDiagnostico(parto=parto, diagnostico=diagnostico) for parto, diagnostico in zip(partos, diagnosticos)
+    )
+    # Defunciones alternando madre / recién nacido (nunca ambos).
+    Defuncion.objects.bulk_create(
+        Defuncion(
+            madre=madres[i] if i % 2 else None, recien_nacido=None if i % 2 else recien_nacidos[i],
+            fecha_defuncion=ahora, causa_defuncion=diagnosticos[i], usuario_registro=partos[i].usuario_registro,
+            turno=partos[i].turno,
+        )
+        for i in range(cantidad)
+    )
+    DocumentoReferencia.objects.bulk_create(
+        DocumentoReferencia(
+            parto=parto, mongodb_object_id=f'{lote}-{i}', nombre_archivo=cifrado('archivo', i), tipo_documento='OTRO',
+            usuario_generacion=parto.usuario_registro, turno=parto.turno,
+        )
+        for i, parto in enumerate(partos)
+    )
+    LogAuditoria.objects.bulk_create(
+        LogAuditoria(
+            usuario=registradores[i % len(registradores)], accion='PRUEBA', detalles=cifrado('detalles', i),
+            fecha_accion=ahora,
+        )
+        for i in range(cantidad)
+    )
+
+
+def rutas_get(router):
+    """[(nombre, es_detalle, viewset)] de las rutas GET de un router de DRF."""
+    rutas = []
+    for prefijo, viewset, basename in router.registry:
+        for ruta in router.get_routes(viewset):
+            if 'get' in ruta.mapping and hasattr(viewset, ruta.mapping['get']):
+                rutas.append((ruta.name.format(basename=basename), ruta.detail, viewset))
+    return rutas
+
+
+class PresupuestoConsultasMixin:
+    router = None
+    presupuestos = {}
+    # Query string adicional por ruta (ej. {'diagnosticocie10-buscar': 'q=Z'}).
+    parametros = {}
+    # Listas que no se paginan ni crecen con los datos sembrados (ej. agregados).
+    sin_escala = ()
+    page_size = 50
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.usuarios = crear_usuarios()
+        sembrar(FILAS_BASE, cls.usuarios)
+
+    # --- Rutas ---
+
+    def rutas_get(self):
+        return rutas_get(self.router)
+
+    def url(self, nombre, es_detalle, viewset):
+        if not es_detalle:
+            extra = self.parametros.get(nombre)
+            return f'{reverse(nombre)}?page_size={self.page_size}' + (f'&{extra}' if extra else '')
+        objeto = viewset.queryset.model.objects.order_by('pk').first()
+        lookup = viewset.lookup_url_kwarg or viewset.lookup_field
+        return reverse(nombre, kwargs={lookup: objeto.pk})
+
+    # --- Medición ---
+
+    def cliente(self, clave):
+        from usuarios.serializers import TokenObtainPairSerializer
+
+        client = APIClient()
+        token = TokenObtainPairSerializer.get_token(self.usuarios[clave]).access_token
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        return client
+
+    def medir(self, client, url):
+        """(respuesta, consultas, descifrados) de la segunda petición a 'url'."""
+        client.get(url)
+        clear_decrypt_cache()
+        contador = ContadorDescifrados()
+        with mock.patch('core.utils.security_utils.registrar_fernet', contador), \
+                CaptureQueriesContext(connection) as consultas:
+            response = client.get(url)
+        return response, len(consultas), contador.total
+
+    @staticmethod
+    def filas(response):
+        datos = getattr(response, 'data', None)
+        if isinstance(datos, dict) and 'results' in datos:
+            return len(datos['results'])
+        if isinstance(datos, list):
+            return len(datos)
+        return 1
+
+    # --- Tests ---
+
+    def test_rutas_con_presupuesto(self):
+        nombres = {nombre for nombre, _, _ in self.rutas_get()}
+        self.assertEqual(set(), nombres - set(self.presupuestos), 'Rutas GET sin presupuesto declarado.')
+        self.assertEqual(set(), set(self.presupuestos) - nombres, 'Presupuestos de rutas que ya no existen.')
+
+    def test_presupuesto_por_rol(self):
+        for nombre, es_detalle, viewset in self.rutas_get():
+            max_consultas, max_por_fila = self.presupuestos[nombre]
+            url = self.url(nombre, es_detalle, viewset)
+            for clave in self.usuarios:
+                with self.subTest(ruta=nombre, rol=clave):
+                    response, consultas, descifrados = self.medir(self.cliente(clave), url)
+                    self.assertLess(response.status_code, 500)
+                    self.assertLessEqual(consultas, max_consultas, f'{nombre} ({clave}): {consultas} consultas')
+                    max_descifrados = max_por_fila * max(self.filas(response), 1)
+                    self.assertLessEqual(descifrados, max_descifrados, f'{nombre} ({clave}): {descifrados} descifrados')
+
+    def test_consultas_no_crecen_con_filas(self):
+        listas = [(n, d, v) for n, d, v in self.rutas_get() if not d and n not in self.sin_escala]
+        base = {}
+        for nombre, es_detalle, viewset in listas:
+            for clave in self.usuarios:
+                base[nombre, clave] = self.medir(self.cliente(clave), self.url(nombre, es_detalle, viewset))[1]
+
+        sembrar(FILAS_ESCALA - FILAS_BASE, self.usuarios)
+        for nombre, es_detalle, viewset in listas:
+            for clave in self.usuarios:
+                with self.subTest(ruta=nombre, rol=clave):
+                    consultas = self.medir(self.cliente(clave), self.url(nombre, es_detalle, viewset))[1]
+                    self.assertEqual(
+                        base[nombre, clave], consultas,
+                        f'{nombre} ({clave}): {base[nombre, clave]} consultas con {FILAS_BASE} filas, '
+                        f'{consultas} con {FILAS_ESCALA}',
+                    )
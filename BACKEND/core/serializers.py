@@ -0,0 +1,57 @@
+# core/serializers.py
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+
+from core.utils.security_utils import decrypt_data, decrypt_many
+
+
+class EncryptedField(serializers.Field):
+    """
+    Campo de solo lectura que expone el texto plano de una columna cifrada.
+    'source' apunta al atributo cifrado (ej. 'madre.nombre_encrypted').
+
+    Dentro de un BatchDecryptListSerializer el valor sale del lote ya
+    descifrado; serializando un solo objeto se descifra directamente.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        kwargs.setdefault('allow_null', True)
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        plaintexts = getattr(self.root, '_plaintexts', None)
+        if plaintexts is not None and value in plaintexts:
+            return plaintexts[value]
+        return decrypt_data(value)
+
+
+class BatchDecryptListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer que reúne todos los cifrados de la página y los descifra
+    en un solo lote (decrypt_many) antes de serializar cada fila.
+    Se activa con Meta.list_serializer_class en el serializer hijo.
+    """
+
+    def to_representation(self, data):
+        instances = list(data.all() if hasattr(data, 'all') else data)
+        # Las vistas async (core.asincrono) entregan el lote ya descifrado.
+        if getattr(self, '_plaintexts', None) is None:
+            self._plaintexts = decrypt_many(collect_ciphertexts(self.child, instances))
+        try:
+            return super().to_representation(instances)
+        finally:
+            self._plaintexts = None
+
+
+def collect_ciphertexts(serializer, instances):
+    """Valores cifrados que los EncryptedField de 'serializer' leerán de 'instances'."""
+    fields = [field for field in serializer._readable_fields if isinstance(field, EncryptedField)]
+    for instance in instances:
+        for field in fields:
+            try:
+                value = field.get_attribute(instance)
+            except SkipField:
+                continue
+            if value is not None:
+                yield value
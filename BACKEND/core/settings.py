@@ -40,6 +40,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.metricas.MetricasMiddleware', # Primero: mide la petición completa
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware', 
@@ -52,13 +53,59 @@ MIDDLEWARE = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'usuarios.authentication.JWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     )
 }
 
+# Descifrado por lotes en serializers de listas (core.serializers)
+DECRYPT_BATCH_WORKERS = int(os.getenv("DECRYPT_BATCH_WORKERS", "4"))
+DECRYPT_BATCH_PARALLEL_MIN = int(os.getenv("DECRYPT_BATCH_PARALLEL_MIN", "64"))
+
+# Caché LRU+TTL en memoria de valores descifrados (core.utils.decrypt_cache)
+DECRYPT_CACHE_MAX_ENTRIES = int(os.getenv("DECRYPT_CACHE_MAX_ENTRIES", "10000"))
+DECRYPT_CACHE_MAX_BYTES = int(os.getenv("DECRYPT_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+DECRYPT_CACHE_TTL = int(os.getenv("DECRYPT_CACHE_TTL", "300"))
+
+# Escritor asíncrono de auditoría (auditoria.writer)
+AUDIT_ASYNC_ENABLED = os.getenv("AUDIT_ASYNC_ENABLED", "True").lower() in ('true', '1', 't', 'yes', 'on')
+AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "200"))
+AUDIT_QUEUE_MAX = int(os.getenv("AUDIT_QUEUE_MAX", "10000"))
+AUDIT_FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL", "1.0"))
+AUDIT_ENQUEUE_TIMEOUT = float(os.getenv("AUDIT_ENQUEUE_TIMEOUT", "0.05"))
+
+# Métricas por vista (core.metricas): /api/metrics y cabecera Server-Timing
+METRICAS_HABILITADAS = os.getenv("METRICAS_HABILITADAS", "True").lower() in ('true', '1', 't', 'yes', 'on')
+METRICAS_SERVER_TIMING = os.getenv("METRICAS_SERVER_TIMING", "True").lower() in ('true', '1', 't', 'yes', 'on')
+
+# Microbenchmarks (manage.py microbench): alza máxima de la mediana frente a la línea base (0.25 = +25 %)
+MICROBENCH_UMBRAL = float(os.getenv("MICROBENCH_UMBRAL", "0.25"))
+
+# Particionado mensual y archivo de LogAuditoria (auditoria.partitions)
+AUDIT_PARTITION_MONTHS_AHEAD = int(os.getenv("AUDIT_PARTITION_MONTHS_AHEAD", "3"))
+AUDIT_RETENTION_MONTHS = int(os.getenv("AUDIT_RETENTION_MONTHS", "24"))
+AUDIT_ARCHIVE_DIR = os.getenv("AUDIT_ARCHIVE_DIR", str(BASE_DIR / 'archivo_auditoria'))
+
+# Sincronización incremental ?updated_since= (core.sync)
+SYNC_MAX_CAMBIOS = int(os.getenv("SYNC_MAX_CAMBIOS", "1000"))
+SYNC_WATERMARK_LAG_SECONDS = float(os.getenv("SYNC_WATERMARK_LAG_SECONDS", "5"))
+
+# Caché en proceso de roles (usuarios.roles)
+ROL_CACHE_TTL = float(os.getenv("ROL_CACHE_TTL", "60"))
+
+# Revocación de tokens: segundos que un proceso puede tardar en ver una
+# desactivación o cambio de rol/turno hecho en otro proceso (usuarios.sesiones)
+SESION_VERSION_TTL = float(os.getenv("SESION_VERSION_TTL", "5"))
+
+# Perfiles descifrados de /api/auth/user/me/ en memoria (usuarios.perfil)
+PERFIL_CACHE_MAX_ENTRIES = int(os.getenv("PERFIL_CACHE_MAX_ENTRIES", "1000"))
+
+# Versión de catálogos y caché HTTP del CIE-10 (catalogos.version)
+CATALOGO_VERSION_TTL = float(os.getenv("CATALOGO_VERSION_TTL", "5"))
+CIE10_CACHE_MAX_AGE = int(os.getenv("CIE10_CACHE_MAX_AGE", "3600"))
+
 # Configuración de CORS
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000", 
@@ -68,22 +115,36 @@ CORS_ALLOWED_ORIGINS = [
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=15), 
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
+    # Tokens con claims de usuario/rol/turno (usuarios.authentication)
+    "TOKEN_OBTAIN_SERIALIZER": "usuarios.serializers.TokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "usuarios.serializers.TokenRefreshSerializer",
 }
 
 # Hashers de Contraseña
 PASSWORD_HASHERS = [
-    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'usuarios.hashers.Argon2PasswordHasher',
     'django.contrib.auth.hashers.PBKDF2PasswordHasher',
     'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
     'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
 ]
 
 # Backend de Autenticación Personalizado
+# (Solo el personalizado, que hereda de ModelBackend los permisos de modelo:
+# con ModelBackend detrás, un login fallido buscaba al usuario y verificaba
+# el hash dos veces.)
 AUTHENTICATION_BACKENDS = [
     'usuarios.backends.CustomUserModelBackend', 
-    'django.contrib.auth.backends.ModelBackend', 
 ]
 
+# Parámetros de Argon2 (usuarios.hashers). Al cambiarlos, cada hash se
+# recalcula en el siguiente login del usuario.
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "2"))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "102400"))
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "8"))
+
+# Hilos que verifican contraseñas en el login asíncrono (usuarios.login)
+LOGIN_HASH_WORKERS = int(os.getenv("LOGIN_HASH_WORKERS", "4"))
+
 ROOT_URLCONF = 'core.urls' 
 
 TEMPLATES = [
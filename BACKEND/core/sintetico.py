@@ -0,0 +1,204 @@
+# core/sintetico.py
+"""
+Datos clínicos sintéticos para pruebas de carga (seed_synthetic).
+
+preparar_lote() es una función pura (sin base de datos), como
+pacientes.importacion.preparar_lote: genera madres con sus partos, recién
+nacidos, diagnósticos, defunciones y entradas de auditoría, con los hashes
+y cifrados ya calculados, para que el comando solo haga bulk_create. Cada
+lote usa su propio random.Random(semilla, inicio): el resultado no depende
+del orden en que terminen los procesos del pool.
+
+Las proporciones (tipo de parto, gemelares, mortalidad...) son aproximadas;
+buscan una distribución de datos y de tamaños de fila parecida a la real,
+no estadística clínica.
+"""
+import random
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.utils import timezone
+
+from core.utils.security_utils import encrypt_data
+from pacientes.importacion import preparar_fila
+
+PREFIJO_FICHA = 'SIN-'
+# RUTs fuera del rango de las personas reales actuales.
+RUT_BASE = 30_000_000
+
+NOMBRES = (
+    'María', 'Camila', 'Valentina', 'Javiera', 'Constanza', 'Francisca', 'Catalina', 'Fernanda', 'Daniela',
+    'Antonia', 'Carolina', 'Paula', 'Macarena', 'Isidora', 'Josefa', 'Tamara', 'Katherine', 'Nicole',
+)
+APELLIDOS = (
+    'González', 'Muñoz', 'Rojas', 'Díaz', 'Pérez', 'Soto', 'Contreras', 'Silva', 'Martínez', 'Sepúlveda',
+    'Morales', 'Rodríguez', 'López', 'Fuentes', 'Hernández', 'Torres', 'Araya', 'Flores', 'Espinoza', 'Valenzuela',
+)
+ANTECEDENTES = (
+    None, None, None, 'Sin antecedentes mórbidos.', 'Hipertensión crónica en tratamiento.',
+    'Diabetes gestacional, manejo con dieta.', 'Cesárea anterior.', 'Hipotiroidismo, levotiroxina 50 mcg.',
+    'Alergia a penicilina.', 'Asma bronquial leve intermitente.',
+)
+NACIONALIDADES = (('Chilena', 85), ('Venezolana', 5), ('Peruana', 4), ('Haitiana', 3), ('Colombiana', 3))
+PREVISIONES = (('FONASA', 78), ('ISAPRE', 17), ('PARTICULAR', 3), ('NINGUNA', 2))
+TIPOS_PARTO = (('Eutócico', 60), ('Cesárea Electiva', 14), ('Cesárea Urgencia', 16), ('Fórceps', 4), ('Ventosa', 6))
+ANESTESIAS = (('Epidural', 55), ('Raquídea', 25), ('General', 3), ('Otra', 2), ('Ninguna', 15))
+SEXOS = (('Femenino', 49), ('Masculino', 50), ('Indeterminado', 1))
+
+# Diagnósticos usados si el catálogo no los tiene (seed_synthetic los carga con catalogos.carga).
+CIE10_BASE = (
+    ('O80', 'Parto único espontáneo'),
+    ('O82', 'Parto único por cesárea'),
+    ('O14.1', 'Preeclampsia severa'),
+    ('O24.4', 'Diabetes mellitus que se origina con el embarazo'),
+    ('O42.0', 'Ruptura prematura de las membranas, e inicio del trabajo de parto dentro de las 24 horas'),
+    ('O60.1', 'Parto prematuro espontáneo con parto prematuro'),
+    ('O72.1', 'Otras hemorragias postparto inmediatas'),
+    ('P07.3', 'Otros recién nacidos pretérmino'),
+    ('P21.0', 'Asfixia del nacimiento, severa'),
+    ('P22.0', 'Síndrome de dificultad respiratoria del recién nacido'),
+    ('P36.9', 'Sepsis bacteriana del recién nacido, no especificada'),
+    ('O95', 'Muerte obstétrica de causa no especificada'),
+)
+
+
+def digito_verificador(numero):
+    suma, factor = 0, 2
+    for digito in reversed(str(numero)):
+        suma += int(digito) * factor
+        factor = 2 if factor == 7 else factor + 1
+    resto = 11 - suma % 11
+    return {11: '0', 10: 'K'}.get(resto, str(resto))
+
+
+def rut(numero):
+    return f'{numero}-{digito_verificador(numero)}'
+
+
+def _elegir(rng, opciones):
+    valores, pesos = zip(*opciones)
+    return rng.choices(valores, weights=pesos)[0]
+
+
+def _uuid(rng):
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _recien_nacido(rng, parto, orden, registrador):
+    edad = parto['edad_gestacional']
+    # Peso según edad gestacional (aprox. 3.300 g a término), gemelares más livianos.
+    peso = rng.gauss(3300 - max(0, 39 - edad) * 220 - (350 if orden else 0), 420)
+    vivo = rng.random() > 0.005
+    return {
+        'id': _uuid(rng),
+        'parto_id': parto['id'],
+        'rut_provisorio': encrypt_data(f"RN{orden + 1}-{parto['id'].hex[:8]}"),
+        'estado_al_nacer': 'Vivo' if vivo else 'Nacido Muerto',
+        'sexo': _elegir(rng, SEXOS),
+        'peso_gramos': max(450, int(peso)),
+        'talla_cm': Decimal(f'{min(56.0, max(28.0, rng.gauss(49 - max(0, 39 - edad) * 1.2, 2))):.1f}'),
+        'apgar_1_min': min(10, max(0, int(rng.gauss(8, 1.5)))) if vivo else 0,
+        'apgar_5_min': min(10, max(0, int(rng.gauss(9, 1)))) if vivo else 0,
+        'profilaxis_vit_k': vivo,
+        'profilaxis_oftalmica': vivo,
+        'usuario_registro_id': registrador,
+        'turno': parto['turno'],
+    }
+
+
+def _log(accion, tabla, registro_id, usuario_id, fecha, detalle):
+    return {
+        'id': uuid.uuid4(),
+        'usuario_id': usuario_id,
+        'accion': accion,
+        'tabla_afectada': tabla,
+        'registro_id_uuid': registro_id,
+        'detalles': encrypt_data(detalle),
+        'ip_usuario': '10.0.0.1',
+        'fecha_accion': fecha,
+    }
+
+
+def preparar_lote(semilla, inicio, cantidad, registradores, diagnosticos, dias):
+    """
+    Genera las madres inicio..inicio+cantidad-1 y sus registros asociados.
+    'registradores' es {'admision': [ids], 'partos': [ids], 'medicos': [ids],
+    'turnos': {id: turno}} y 'diagnosticos' {'codigo': id}. Devuelve
+    {modelo: [campos]}; el turno va explícito porque bulk_create no llama a save().
+    """
+    rng = random.Random(f'{semilla}:{inicio}')
+    ahora = timezone.now()
+    filas = {'madres': [], 'partos': [], 'recien_nacidos': [], 'parto_diagnosticos': [], 'defunciones': [], 'logs': []}
+    codigos = list(diagnosticos)
+
+    for indice in range(inicio, inicio + cantidad):
+        nombre = f'{rng.choice(NOMBRES)} {rng.choice(APELLIDOS)} {rng.choice(APELLIDOS)}'
+        antecedentes = rng.choice(ANTECEDENTES)
+        campos, _ = preparar_fila({
+            'rut': rut(RUT_BASE + indice),
+            'nombre': nombre,
+            'telefono': f'+569{rng.randrange(10_000_000, 100_000_000)}',
+            'antecedentes': antecedentes or '',
+            'ficha_clinica_id': f'{PREFIJO_FICHA}{indice}',
+            'fecha_nacimiento': (ahora.date() - timedelta(days=rng.randint(15 * 365, 45 * 365))).isoformat(),
+            'nacionalidad': _elegir(rng, NACIONALIDADES),
+            'pertenece_pueblo_originario': 'si' if rng.random() < 0.12 else '',
+            'prevision': _elegir(rng, PREVISIONES),
+        })
+        madre_id = _uuid(rng)
+        filas['madres'].append({'id': madre_id, **campos})
+        admision = rng.choice(registradores['admision'])
+        ingreso = ahora - timedelta(days=rng.uniform(0, dias))
+        filas['logs'].append(_log('CREAR_PACIENTE', 'Madre', madre_id, admision, ingreso, f'Madre ID {madre_id} admitida.'))
+
+        cantidad_partos = _elegir(rng, ((0, 5), (1, 80), (2, 13), (3, 2)))
+        for _ in range(cantidad_partos):
+            matrona = rng.choice(registradores['partos'])
+            parto = {
+                'id': _uuid(rng),
+                'madre_id': madre_id,
+                'fecha_parto': ahora - timedelta(days=rng.uniform(0, dias)),
+                'edad_gestacional': min(42, max(24, round(rng.gauss(38.6, 1.8)))),
+                'tipo_parto': _elegir(rng, TIPOS_PARTO),
+                'anestesia': _elegir(rng, ANESTESIAS),
+                'usuario_registro_id': matrona,
+                'turno': registradores['turnos'][matrona],
+            }
+            filas['partos'].append(parto)
+            filas['logs'].append(_log('CREAR_PARTO', 'Parto', parto['id'], matrona, parto['fecha_parto'],
+                                      f"Parto ID {parto['id']} registrado."))
+
+            for codigo in rng.sample(codigos, k=min(len(codigos), _elegir(rng, ((0, 55), (1, 35), (2, 10))))):
+                filas['parto_diagnosticos'].append({'parto_id': parto['id'], 'diagnostico_id': diagnosticos[codigo]})
+
+            for orden in range(2 if rng.random() < 0.015 else 1):
+                rn = _recien_nacido(rng, parto, orden, matrona)
+                filas['recien_nacidos'].append(rn)
+                filas['logs'].append(_log('CREAR_RECIENNACIDO', 'RecienNacido', rn['id'], matrona, parto['fecha_parto'],
+                                          f"RN ID {rn['id']} registrado."))
+                if rn['estado_al_nacer'] == 'Vivo' and rng.random() < 0.003:
+                    filas['defunciones'].append(_defuncion(rng, registradores, diagnosticos, parto, recien_nacido_id=rn['id']))
+
+        if cantidad_partos and rng.random() < 0.0003:
+            filas['defunciones'].append(_defuncion(rng, registradores, diagnosticos, filas['partos'][-1], madre_id=madre_id))
+
+    for defuncion in filas['defunciones']:
+        filas['logs'].append(_log('REGISTRAR_DEFUNCION', 'Defuncion', defuncion['id'], defuncion['usuario_registro_id'],
+                                  defuncion['fecha_defuncion'], f"Defunción ID {defuncion['id']} registrada."))
+    return filas
+
+
+def _defuncion(rng, registradores, diagnosticos, parto, recien_nacido_id=None, madre_id=None):
+    causas = ('P21.0', 'P22.0', 'P36.9', 'P07.3') if recien_nacido_id else ('O72.1', 'O14.1', 'O95')
+    causa = rng.choice([c for c in causas if c in diagnosticos] or list(diagnosticos))
+    medico = rng.choice(registradores['medicos'])
+    return {
+        'id': _uuid(rng),
+        'recien_nacido_id': recien_nacido_id,
+        'madre_id': madre_id,
+        'fecha_defuncion': parto['fecha_parto'] + timedelta(hours=rng.uniform(1, 96)),
+        'causa_defuncion_id': diagnosticos[causa],
+        'usuario_registro_id': medico,
+        'turno': registradores['turnos'][medico],
+    }
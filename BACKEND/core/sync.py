@@ -0,0 +1,117 @@
+# core/sync.py
+"""
+Sincronización incremental de listas: GET <lista>/?updated_since=<marca>
+devuelve solo las filas con fecha_modificacion >= marca y los ids borrados
+desde entonces (lápidas en auditoria.RegistroEliminado), más una nueva marca
+del servidor para la siguiente petición:
+
+    {"cambios": [...], "eliminados": ["<uuid>", ...], "marca": "<ISO>", "hay_mas": false}
+
+Con hay_mas=true el cliente repite la petición con la nueva marca.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models.signals import post_delete
+from django.utils import timezone
+from rest_framework.response import Response
+
+from core.utils.query_params import parse_fecha_param
+
+
+def registrar_eliminacion(sender, instance, **kwargs):
+    from auditoria.models import RegistroEliminado
+    RegistroEliminado.objects.create(tabla=sender._meta.db_table, registro_id=instance.pk)
+
+
+def seguir_eliminaciones(*modelos):
+    """Conecta post_delete de cada modelo para que sus borrados (incluidos los en cascada) dejen lápida."""
+    for modelo in modelos:
+        post_delete.connect(registrar_eliminacion, sender=modelo, dispatch_uid=f'sync_eliminacion_{modelo._meta.label}')
+
+
+class DeltaSyncMixin:
+    """
+    Para ModelViewSet cuyo modelo tiene 'fecha_modificacion' (auto_now).
+    Sin ?updated_since= la lista se comporta como siempre.
+    """
+    sync_query_param = 'updated_since'
+    sync_field = 'fecha_modificacion'
+
+    def list(self, request, *args, **kwargs):
+        valor = request.query_params.get(self.sync_query_param)
+        if valor is None:
+            return super().list(request, *args, **kwargs)
+        return self.delta(parse_fecha_param(valor, self.sync_query_param))
+
+    async def alist(self, request, *args, **kwargs):
+        """Versión async de list() (core.asincrono.LecturaAsyncMixin)."""
+        valor = request.query_params.get(self.sync_query_param)
+        if valor is None:
+            return await super().alist(request, *args, **kwargs)
+        return await self.adelta(parse_fecha_param(valor, self.sync_query_param))
+
+    def delta(self, desde):
+        queryset, hasta = self._consulta_delta(desde)
+        filas = list(self._filas_delta(queryset, hasta))
+        filas, hasta, hay_mas, empate = self._cortar_delta(filas, hasta)
+        if empate:
+            filas = list(self._filas_empate(queryset, hasta))
+            hasta += timedelta(microseconds=1)
+        eliminados = list(self._eliminados_delta(queryset, desde, hasta))
+        return self._respuesta_delta(self.get_serializer(filas, many=True).data, eliminados, hasta, hay_mas)
+
+    async def adelta(self, desde):
+        queryset, hasta = self._consulta_delta(desde)
+        filas = [fila async for fila in self._filas_delta(queryset, hasta)]
+        filas, hasta, hay_mas, empate = self._cortar_delta(filas, hasta)
+        if empate:
+            filas = [fila async for fila in self._filas_empate(queryset, hasta)]
+            hasta += timedelta(microseconds=1)
+        eliminados = [registro_id async for registro_id in self._eliminados_delta(queryset, desde, hasta)]
+        return self._respuesta_delta(await self.aserializar(filas, many=True), eliminados, hasta, hay_mas)
+
+    def _consulta_delta(self, desde):
+        # La marca queda un poco atrás del reloj: una transacción que aún no
+        # confirma puede haber fijado fecha_modificacion antes de "ahora".
+        hasta = max(desde, timezone.now() - timedelta(seconds=settings.SYNC_WATERMARK_LAG_SECONDS))
+        queryset = self.filter_queryset(self.get_queryset()).filter(**{f'{self.sync_field}__gte': desde})
+        return queryset, hasta
+
+    def _filas_delta(self, queryset, hasta):
+        campo = self.sync_field
+        return queryset.filter(**{f'{campo}__lt': hasta}).order_by(campo, 'id')[:settings.SYNC_MAX_CAMBIOS + 1]
+
+    def _filas_empate(self, queryset, hasta):
+        return queryset.filter(**{self.sync_field: hasta}).order_by('id')
+
+    def _cortar_delta(self, filas, hasta):
+        """Devuelve (filas, hasta, hay_mas, empate); con empate=True hay que pedir las filas de 'hasta'."""
+        campo = self.sync_field
+        limite = settings.SYNC_MAX_CAMBIOS
+        hay_mas = len(filas) > limite
+        if not hay_mas:
+            return filas, hasta, False, False
+        # Se corta en la primera marca de tiempo no incluida completa.
+        hasta = getattr(filas[limite], campo)
+        filas = [fila for fila in filas[:limite] if getattr(fila, campo) < hasta]
+        # Sin filas: más de 'limite' filas con la misma marca, se envían juntas.
+        return filas, hasta, True, not filas
+
+    def _eliminados_delta(self, queryset, desde, hasta):
+        from auditoria.models import RegistroEliminado
+
+        # Las lápidas no se filtran por turno: solo exponen el id ya borrado.
+        return RegistroEliminado.objects.filter(
+            tabla=queryset.model._meta.db_table,
+            fecha_eliminacion__gte=desde,
+            fecha_eliminacion__lt=hasta,
+        ).values_list('registro_id', flat=True)
+
+    def _respuesta_delta(self, cambios, eliminados, hasta, hay_mas):
+        return Response({
+            'cambios': cambios,
+            'eliminados': [str(registro_id) for registro_id in eliminados],
+            'marca': hasta.isoformat(),
+            'hay_mas': hay_mas,
+        })
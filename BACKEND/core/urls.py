@@ -1,6 +1,7 @@
 # core/urls.py
 from django.contrib import admin
 from django.urls import path, include
+from .views import MetricasView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -9,8 +10,11 @@ urlpatterns = [
     path('api/auth/', include('usuarios.urls')), 
     
     # Endpoints de las otras apps
-    path('api/pacientes', include('pacientes.urls')),
-    path('api/partos', include('partos.urls')),
-    path('api/auditoria', include('auditoria.urls')),
-    path('api/catalogos', include('catalogos.urls')),
+    path('api/pacientes/', include('pacientes.urls')),
+    path('api/partos/', include('partos.urls')),
+    path('api/auditoria/', include('auditoria.urls')),
+    path('api/catalogos/', include('catalogos.urls')),
+
+    # Métricas de Prometheus (core.metricas)
+    path('api/metrics', MetricasView.as_view(), name='metricas'),
 ]
\ No newline at end of file
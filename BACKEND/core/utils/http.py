@@ -0,0 +1,7 @@
+# core/utils/http.py
+from django.utils.http import parse_etags
+
+def etag_coincide(if_none_match, etag):
+    """True si la cabecera If-None-Match incluye 'etag' (comparación débil) o '*'."""
+    etags = parse_etags(if_none_match or '')
+    return '*' in etags or any(e.removeprefix('W/') == etag for e in etags)
@@ -0,0 +1,33 @@
+# core/utils/query_params.py
+import datetime
+import uuid
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+def parse_uuid_param(value, param):
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        raise ValidationError({param: 'UUID inválido.'})
+
+def parse_fecha_param(value, param, end=False):
+    """
+    Acepta 'AAAA-MM-DD' o una fecha-hora ISO. Para una fecha sola, 'end=True'
+    devuelve el inicio del día siguiente (límite exclusivo).
+    """
+    try:
+        day = parse_date(value)
+        parsed = None if day else parse_datetime(value)
+    except ValueError:
+        day = parsed = None
+    if day is not None:
+        if end:
+            day += datetime.timedelta(days=1)
+        parsed = datetime.datetime.combine(day, datetime.time.min)
+    elif parsed is None:
+        raise ValidationError({param: 'Formato de fecha inválido (use AAAA-MM-DD o ISO 8601).'})
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
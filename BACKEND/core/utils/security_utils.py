@@ -1,67 +1,211 @@
 # core/utils/security_utils.py
 import os
+import asyncio
 import base64
 import hashlib
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from django.conf import settings
 from django.contrib.auth.hashers import make_password, check_password as django_check_password
+from core.metricas import en_contexto_actual, registrar_fernet
+from core.utils.decrypt_cache import DecryptCache
 
-FERNET_KEY_ENV = os.getenv('FERNET_ENCRYPTION_KEY')
+logger = logging.getLogger(__name__)
 
-if FERNET_KEY_ENV:
-    ENCRYPTION_KEY = FERNET_KEY_ENV.encode()
-    print("INFO: Usando FERNET_ENCRYPTION_KEY desde .env para cifrado.")
-else:
-    print("WARN: FERNET_ENCRYPTION_KEY no encontrada. Derivando clave desde SECRET_KEY (NO RECOMENDADO).")
-    password = settings.SECRET_KEY.encode()
-    salt = b'DjangoSalt' # Salt fijo para clave determinista
+# Las claves y la instancia de MultiFernet se cargan en el primer cifrado/descifrado,
+# no al importar: los modelos importan este módulo y así manage.py, las
+# migraciones y el arranque de workers no pagan la derivación PBKDF2.
+#
+# FERNET_ENCRYPTION_KEY es la clave primaria (cifra y descifra).
+# FERNET_PREVIOUS_KEYS (separadas por coma) solo descifran: durante una
+# rotación de claves conviven datos de ambas; 'manage.py rotate_keys'
+# re-cifra todo con la primaria.
+_fernet = None
+_primary_fernet = None
+_fernet_lock = threading.Lock()
+
+def _load_encryption_key():
+    key_env = os.getenv('FERNET_ENCRYPTION_KEY')
+    if key_env:
+        logger.info("Usando FERNET_ENCRYPTION_KEY desde .env para cifrado.")
+        return key_env.encode()
+
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+    logger.warning("FERNET_ENCRYPTION_KEY no encontrada. Derivando clave desde SECRET_KEY (NO RECOMENDADO).")
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=32,
-        salt=salt,
+        salt=b'DjangoSalt', # Salt fijo para clave determinista
         iterations=100000,
     )
-    ENCRYPTION_KEY = base64.urlsafe_b64encode(kdf.derive(password))
+    return base64.urlsafe_b64encode(kdf.derive(settings.SECRET_KEY.encode()))
+
+def _load_previous_keys():
+    return [key.strip().encode() for key in os.getenv('FERNET_PREVIOUS_KEYS', '').split(',') if key.strip()]
+
+def get_fernet():
+    """
+    Devuelve la instancia de MultiFernet del proceso (o None si no se pudo crear).
+    Cifra con la clave primaria y descifra con cualquiera de las claves.
+    Las claves se cargan una sola vez por proceso.
+    """
+    global _fernet, _primary_fernet
+    if _fernet is None:
+        with _fernet_lock:
+            if _fernet is None:
+                from cryptography.fernet import Fernet, MultiFernet
+                try:
+                    fernets = [Fernet(key) for key in [_load_encryption_key(), *_load_previous_keys()]]
+                    _primary_fernet = fernets[0]
+                    _fernet = MultiFernet(fernets)
+                    logger.info("Instancia de Fernet creada exitosamente (%d clave(s)).", len(fernets))
+                except Exception as e:
+                    logger.critical("No se pudo inicializar Fernet. Cifrado fallará. Error: %s", e)
+                    return None
+    return _fernet
+
+def reload_encryption_keys():
+    """Descarta las claves cargadas (se releen en el próximo uso) y vacía la caché de descifrado."""
+    global _fernet, _primary_fernet
+    with _fernet_lock:
+        _fernet = None
+        _primary_fernet = None
+    clear_decrypt_cache()
+
+def encryption_key_fingerprint():
+    """Huella corta de la clave primaria (para identificar rotaciones sin exponer la clave)."""
+    return hashlib.blake2b(_load_encryption_key(), digest_size=8).hexdigest()
+
+def rotate_token(token):
+    """
+    Re-cifra 'token' con la clave primaria conservando su marca de tiempo.
+    Devuelve None si ya está cifrado con la primaria (o es None). Lanza
+    cryptography.fernet.InvalidToken si ninguna clave lo descifra.
+    """
+    if token is None:
+        return None
+    fernet = get_fernet()
+    if fernet is None:
+        raise RuntimeError("Fernet no inicializado. No se puede rotar.")
+    from cryptography.fernet import InvalidToken
+    raw = token.encode('utf-8') if isinstance(token, str) else token
+    try:
+        _primary_fernet.extract_timestamp(raw)  # Solo verifica la firma con la clave primaria
+        return None
+    except InvalidToken:
+        return fernet.rotate(raw).decode('utf-8')
 
-try:
-    fernet = Fernet(ENCRYPTION_KEY)
-    print("INFO: Instancia de Fernet creada exitosamente.")
-except Exception as e:
-    print(f"ERROR CRÍTICO: No se pudo inicializar Fernet. Cifrado fallará. Error: {e}")
-    fernet = None
+# Caché en memoria de textos planos (nunca se escribe a disco).
+# Vaciar con clear_decrypt_cache() al rotar o recargar claves.
+decrypt_cache = DecryptCache(
+    max_entries=settings.DECRYPT_CACHE_MAX_ENTRIES,
+    max_bytes=settings.DECRYPT_CACHE_MAX_BYTES,
+    ttl=settings.DECRYPT_CACHE_TTL,
+)
+
+def clear_decrypt_cache():
+    decrypt_cache.clear()
+
+def decrypt_cache_stats():
+    return decrypt_cache.stats()
 
 def encrypt_data(data):
+    fernet = get_fernet()
     if fernet is None:
-        print("ERROR: Fernet no inicializado. No se puede cifrar.")
+        logger.error("Fernet no inicializado. No se puede cifrar.")
         return None
     if data is None:
         return None
     if isinstance(data, str):
         data = data.encode('utf-8')
     try:
+        inicio = time.perf_counter()
         encrypted_data = fernet.encrypt(data)
+        registrar_fernet('encrypt', time.perf_counter() - inicio)
         return encrypted_data.decode('utf-8')
     except Exception as e:
-        print(f"ERROR cifrando dato: {e}")
+        logger.error("Error cifrando dato: %s", e)
         return None
 
 def decrypt_data(encrypted_data):
-    if fernet is None:
-        print("ERROR: Fernet no inicializado. No se puede descifrar.")
-        return None
     if encrypted_data is None:
         return None
+    cache_key = None
+    if decrypt_cache.enabled:
+        cache_key = decrypt_cache.make_key(encrypted_data)
+        cached = decrypt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    fernet = get_fernet()
+    if fernet is None:
+        logger.error("Fernet no inicializado. No se puede descifrar.")
+        return None
     try:
         if isinstance(encrypted_data, str):
             encrypted_data = encrypted_data.encode('utf-8')
-        decrypted_data = fernet.decrypt(encrypted_data)
-        return decrypted_data.decode('utf-8')
+        inicio = time.perf_counter()
+        decrypted_data = fernet.decrypt(encrypted_data).decode('utf-8')
+        registrar_fernet('decrypt', time.perf_counter() - inicio)
+        if cache_key is not None:
+            decrypt_cache.set(cache_key, decrypted_data)
+        return decrypted_data
     except Exception as e:
-        print(f"ERROR descifrando dato: {e}")
+        logger.error("Error descifrando dato: %s", e)
         return "[Dato ilegible]"
 
+_decrypt_executor = None
+
+def _get_decrypt_executor():
+    global _decrypt_executor
+    if _decrypt_executor is None:
+        _decrypt_executor = ThreadPoolExecutor(
+            max_workers=settings.DECRYPT_BATCH_WORKERS,
+            thread_name_prefix='decrypt',
+        )
+    return _decrypt_executor
+
+def decrypt_many(encrypted_values):
+    """
+    Descifra un lote de valores y devuelve un dict {cifrado: plano}.
+    Los cifrados repetidos (ej. la misma madre en varios partos) se descifran
+    una sola vez. Lotes grandes se reparten en un pool de hilos: 'cryptography'
+    libera el GIL durante el descifrado.
+    """
+    unique = list({value for value in encrypted_values if value is not None})
+    if not unique:
+        return {}
+    if settings.DECRYPT_BATCH_WORKERS > 1 and len(unique) >= settings.DECRYPT_BATCH_PARALLEL_MIN:
+        plain = _get_decrypt_executor().map(en_contexto_actual(decrypt_data), unique)
+    else:
+        plain = map(decrypt_data, unique)
+    return dict(zip(unique, plain))
+
+def _decrypt_list(values):
+    return [decrypt_data(value) for value in values]
+
+async def adecrypt_many(encrypted_values):
+    """
+    decrypt_many para vistas async: el descifrado corre en el pool de hilos
+    de descifrado (en partes, una por hilo) y nunca en el event loop.
+    """
+    unique = list({value for value in encrypted_values if value is not None})
+    if not unique:
+        return {}
+    workers = max(settings.DECRYPT_BATCH_WORKERS, 1)
+    size = max(-(-len(unique) // workers), min(settings.DECRYPT_BATCH_PARALLEL_MIN, len(unique)))
+    loop = asyncio.get_running_loop()
+    executor = _get_decrypt_executor()
+    parts = await asyncio.gather(*(
+        loop.run_in_executor(executor, en_contexto_actual(_decrypt_list), unique[i:i + size])
+        for i in range(0, len(unique), size)
+    ))
+    return dict(zip(unique, itertools.chain.from_iterable(parts)))
+
 def hash_password(raw_password):
     if not raw_password:
         return None
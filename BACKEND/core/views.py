@@ -0,0 +1,13 @@
+# core/views.py
+from django.http import HttpResponse
+from rest_framework.views import APIView
+
+from usuarios import permissions as custom_permissions
+from .metricas import exportar
+
+class MetricasView(APIView):
+    """GET /api/metrics: métricas del proceso en formato de texto de Prometheus (solo Admin TI)."""
+    permission_classes = [custom_permissions.IsAdminSistema]
+
+    def get(self, request):
+        return HttpResponse(exportar(), content_type='text/plain; version=0.0.4; charset=utf-8')
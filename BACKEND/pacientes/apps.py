@@ -2,4 +2,8 @@ from django.apps import AppConfig
 
 class PacientesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'pacientes'
\ No newline at end of file
+    name = 'pacientes'
+
+    def ready(self):
+        from core.sync import seguir_eliminaciones
+        seguir_eliminaciones(self.get_model('Madre'))
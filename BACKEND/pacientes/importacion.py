@@ -0,0 +1,88 @@
+# pacientes/importacion.py
+"""
+Preparación de filas para la importación masiva de Madre (import_madres).
+
+preparar_lote() es una función pura (sin base de datos) que calcula los
+hashes de búsqueda y los cifrados de cada fila; corre en los procesos del
+pool, así el trabajo de CPU no compite con la escritura por lotes.
+"""
+import csv
+
+from django.utils.dateparse import parse_date
+
+from core.utils.security_utils import create_search_hash, encrypt_data
+from .models import Madre
+
+PREVISIONES = {valor for valor, _ in Madre._meta.get_field('prevision').choices}
+VERDADEROS = {'1', 'true', 't', 'si', 'sí', 's', 'x', 'yes', 'y'}
+
+
+def iniciar_worker():
+    """Inicializador del pool: con 'spawn' el proceso hijo no trae Django configurado."""
+    import django
+    django.setup()
+
+
+def leer_csv(path, encoding='utf-8-sig'):
+    """Genera (numero_fila, dict) con claves en minúsculas; numero_fila cuenta desde 1 sin el encabezado."""
+    with open(path, newline='', encoding=encoding) as archivo:
+        muestra = archivo.read(4096)
+        archivo.seek(0)
+        try:
+            dialecto = csv.Sniffer().sniff(muestra, delimiters=',;\t|')
+        except csv.Error:
+            dialecto = csv.excel
+        lector = csv.reader(archivo, dialecto)
+        encabezado = [columna.strip().lower() for columna in next(lector, [])]
+        for numero, valores in enumerate(lector, start=1):
+            yield numero, dict(zip(encabezado, valores))
+
+
+def _texto(fila, campo):
+    valor = (fila.get(campo) or '').strip()
+    return valor or None
+
+
+def preparar_fila(fila):
+    """Devuelve (campos_del_modelo, None) o (None, motivo_del_error)."""
+    rut = _texto(fila, 'rut')
+    nombre = _texto(fila, 'nombre')
+    if not rut or not nombre:
+        return None, 'rut y nombre son obligatorios'
+
+    fecha_nacimiento = _texto(fila, 'fecha_nacimiento')
+    if fecha_nacimiento:
+        try:
+            fecha_nacimiento = parse_date(fecha_nacimiento)
+        except ValueError:
+            fecha_nacimiento = None
+        if fecha_nacimiento is None:
+            return None, 'fecha_nacimiento inválida (use AAAA-MM-DD)'
+
+    prevision = _texto(fila, 'prevision')
+    if prevision:
+        prevision = prevision.upper()
+        if prevision not in PREVISIONES:
+            return None, f'prevision inválida: {prevision}'
+
+    telefono = _texto(fila, 'telefono')
+    antecedentes = _texto(fila, 'antecedentes')
+    return {
+        'rut_hash': create_search_hash(rut),
+        'rut_encrypted': encrypt_data(rut),
+        'nombre_hash': create_search_hash(nombre),
+        'nombre_encrypted': encrypt_data(nombre),
+        'telefono_hash': create_search_hash(telefono) if telefono else None,
+        'telefono_encrypted': encrypt_data(telefono) if telefono else None,
+        'antecedentes_medicos': encrypt_data(antecedentes) if antecedentes else None,
+        'ficha_clinica_id': _texto(fila, 'ficha_clinica_id'),
+        'fecha_nacimiento': fecha_nacimiento,
+        'nacionalidad': _texto(fila, 'nacionalidad'),
+        'pertenece_pueblo_originario': (_texto(fila, 'pertenece_pueblo_originario') or '').lower() in VERDADEROS,
+        'prevision': prevision,
+    }, None
+
+
+def preparar_lote(filas):
+    """[(numero_fila, dict)] -> [(numero_fila, campos | None, error | None)]."""
+    return [(numero, *preparar_fila(fila)) for numero, fila in filas]
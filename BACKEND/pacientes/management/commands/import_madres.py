@@ -0,0 +1,151 @@
+# pacientes/management/commands/import_madres.py
+import itertools
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from auditoria.models import LogAuditoria
+from pacientes import importacion
+from pacientes.models import Madre
+from usuarios.models import Usuario
+
+CONTADORES = ('creadas', 'duplicadas', 'invalidas')
+MAX_ERRORES_MOSTRADOS = 20
+
+
+class Command(BaseCommand):
+    help = (
+        'Importa madres desde un CSV (rut, nombre, telefono, antecedentes, ficha_clinica_id, '
+        'fecha_nacimiento, nacionalidad, pertenece_pueblo_originario, prevision). Hashes y cifrado '
+        'en un pool de procesos, deduplicación por rut_hash, bulk_create por lotes y checkpoint '
+        'para reanudar.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('archivo', help='Ruta al CSV (con encabezado).')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='Procesos para hashes y cifrado (0 = en el mismo proceso).')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Filas por lote y por INSERT.')
+        parser.add_argument('--checkpoint', help='Archivo de avance (por defecto <archivo>.checkpoint.json).')
+        parser.add_argument('--reiniciar', action='store_true', help='Ignora el checkpoint existente.')
+        parser.add_argument('--usuario', help='Username al que se atribuye la entrada de auditoría.')
+        parser.add_argument('--encoding', default='utf-8-sig', help='Codificación del CSV.')
+
+    def handle(self, *args, **options):
+        archivo = Path(options['archivo'])
+        if not archivo.is_file():
+            raise CommandError(f'No existe el archivo: {archivo}')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size debe ser mayor que 0.')
+        usuario = None
+        if options['usuario']:
+            usuario = Usuario.objects.filter(username=options['usuario']).first()
+            if usuario is None:
+                raise CommandError(f"No existe el usuario '{options['usuario']}'.")
+
+        checkpoint_path = Path(options['checkpoint'] or f'{archivo}.checkpoint.json')
+        estado = self.leer_checkpoint(checkpoint_path, archivo, options['reiniciar'])
+        if estado['fila']:
+            self.stdout.write(f"Reanudando desde la fila {estado['fila']}.")
+
+        inicio = time.perf_counter()
+        filas = itertools.dropwhile(lambda item: item[0] <= estado['fila'],
+                                    importacion.leer_csv(archivo, options['encoding']))
+        lotes = iter(lambda: list(itertools.islice(filas, options['batch_size'])), [])
+        errores = []
+
+        for preparadas in self.preparar(lotes, options['workers']):
+            resultado = self.guardar_lote(preparadas, options['batch_size'], errores)
+            for clave in CONTADORES:
+                estado[clave] += resultado[clave]
+            estado['fila'] = preparadas[-1][0]
+            self.escribir_checkpoint(checkpoint_path, estado)
+            self.stdout.write(f"  fila {estado['fila']}: {estado['creadas']} creadas", ending='\r')
+
+        self.stdout.write('')
+        for numero, motivo in errores[:MAX_ERRORES_MOSTRADOS]:
+            self.stderr.write(f'  fila {numero}: {motivo}')
+        if len(errores) > MAX_ERRORES_MOSTRADOS:
+            self.stderr.write(f'  ... y {len(errores) - MAX_ERRORES_MOSTRADOS} errores más.')
+
+        resumen = (f"{estado['creadas']} creadas, {estado['duplicadas']} duplicadas, "
+                   f"{estado['invalidas']} inválidas ({archivo.name}, hasta la fila {estado['fila']})")
+        self.registrar_auditoria(usuario, resumen)
+        checkpoint_path.unlink(missing_ok=True)
+        self.stdout.write(self.style.SUCCESS(f'Importación terminada: {resumen} en {time.perf_counter() - inicio:.1f} s.'))
+
+    def preparar(self, lotes, workers):
+        """Entrega los lotes preparados en orden, con a lo más 2 lotes en vuelo por worker."""
+        if workers <= 0:
+            yield from map(importacion.preparar_lote, lotes)
+            return
+        with ProcessPoolExecutor(max_workers=workers, initializer=importacion.iniciar_worker) as pool:
+            en_vuelo = deque()
+            for lote in lotes:
+                en_vuelo.append(pool.submit(importacion.preparar_lote, lote))
+                if len(en_vuelo) >= workers * 2:
+                    yield en_vuelo.popleft().result()
+            while en_vuelo:
+                yield en_vuelo.popleft().result()
+
+    def guardar_lote(self, preparadas, batch_size, errores):
+        resultado = dict.fromkeys(CONTADORES, 0)
+        validas = []
+        for numero, campos, error in preparadas:
+            if error:
+                resultado['invalidas'] += 1
+                errores.append((numero, error))
+            else:
+                validas.append(campos)
+
+        # Deduplicación en bloque contra la base y dentro del mismo lote.
+        ruts_existentes = set(Madre.objects.filter(
+            rut_hash__in=[c['rut_hash'] for c in validas]).values_list('rut_hash', flat=True))
+        fichas_existentes = set(Madre.objects.filter(
+            ficha_clinica_id__in=[c['ficha_clinica_id'] for c in validas if c['ficha_clinica_id']]
+        ).values_list('ficha_clinica_id', flat=True))
+        nuevas = []
+        for campos in validas:
+            ficha = campos['ficha_clinica_id']
+            if campos['rut_hash'] in ruts_existentes or (ficha and ficha in fichas_existentes):
+                resultado['duplicadas'] += 1
+                continue
+            ruts_existentes.add(campos['rut_hash'])
+            if ficha:
+                fichas_existentes.add(ficha)
+            nuevas.append(Madre(**campos))
+
+        with transaction.atomic():
+            Madre.objects.bulk_create(nuevas, batch_size=batch_size)
+        resultado['creadas'] = len(nuevas)
+        return resultado
+
+    @staticmethod
+    def leer_checkpoint(path, archivo, reiniciar):
+        firma = {'archivo': str(archivo.resolve()), 'tamano': archivo.stat().st_size}
+        vacio = {**firma, 'fila': 0, **dict.fromkeys(CONTADORES, 0)}
+        if reiniciar or not path.exists():
+            return vacio
+        estado = json.loads(path.read_text())
+        if any(estado.get(k) != v for k, v in firma.items()):
+            raise CommandError(f'El checkpoint {path} es de otro archivo (o cambió); use --reiniciar.')
+        return {**vacio, **estado}
+
+    @staticmethod
+    def escribir_checkpoint(path, estado):
+        tmp = path.with_name(path.name + '.tmp')
+        tmp.write_text(json.dumps(estado))
+        os.replace(tmp, path)
+
+    @staticmethod
+    def registrar_auditoria(usuario, resumen):
+        """Una sola entrada de auditoría para toda la importación (no una por fila)."""
+        entrada = LogAuditoria(usuario=usuario, accion='IMPORTAR_PACIENTES', tabla_afectada=Madre._meta.db_table)
+        entrada.set_detalles(f'Importación masiva de madres: {resumen}.')
+        entrada.save()
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-18 16:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pacientes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='madre',
+            index=models.Index(fields=['fecha_registro', 'id'], name='madre_fecha_reg_id_idx'),
+        ),
+    ]
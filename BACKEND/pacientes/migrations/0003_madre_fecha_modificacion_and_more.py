@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pacientes', '0002_madre_madre_fecha_reg_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='madre',
+            name='fecha_modificacion',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='madre',
+            index=models.Index(fields=['fecha_modificacion', 'id'], name='madre_fecha_mod_id_idx'),
+        ),
+    ]
@@ -19,6 +19,7 @@ class Madre(models.Model):
     pertenece_pueblo_originario = models.BooleanField(default=False)
     prevision = models.CharField(max_length=50, choices=[('FONASA', 'FONASA'), ('ISAPRE', 'ISAPRE'), ('PARTICULAR', 'PARTICULAR'), ('NINGUNA', 'NINGUNA')], blank=True, null=True)
     fecha_registro = models.DateTimeField(auto_now_add=True)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
     # FALTA: usuario_registro y turno_asignado (para filtro de enfermeras)
 
     _rut_plain = None
@@ -31,6 +32,12 @@ class Madre(models.Model):
         verbose_name = 'Madre'
         verbose_name_plural = 'Madres'
         ordering = ['-fecha_registro']
+        indexes = [
+            # Paginación keyset (fecha_registro, id)
+            models.Index(fields=['fecha_registro', 'id'], name='madre_fecha_reg_id_idx'),
+            # Sincronización incremental (?updated_since=)
+            models.Index(fields=['fecha_modificacion', 'id'], name='madre_fecha_mod_id_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         # Usar valores planos si se proporcionaron
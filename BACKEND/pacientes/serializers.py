@@ -1,12 +1,13 @@
 # pacientes/serializers.py
 from rest_framework import serializers
 from .models import Madre
+from core.serializers import EncryptedField, BatchDecryptListSerializer
 
 class MadreSerializer(serializers.ModelSerializer):
-    rut = serializers.CharField(source='rut', read_only=True)
-    nombre = serializers.CharField(source='nombre', read_only=True)
-    telefono = serializers.CharField(source='telefono', read_only=True, allow_null=True)
-    antecedentes_medicos = serializers.CharField(source='antecedentes', read_only=True, allow_null=True)
+    rut = EncryptedField(source='rut_encrypted')
+    nombre = EncryptedField(source='nombre_encrypted')
+    telefono = EncryptedField(source='telefono_encrypted')
+    antecedentes_medicos = EncryptedField()
 
     # Campos para escritura (reciben texto plano)
     # CORREGIDO: Validación robusta
@@ -41,11 +42,12 @@ class MadreSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'ficha_clinica_id', 'rut', 'nombre', 'telefono', 'fecha_nacimiento',
             'nacionalidad', 'pertenece_pueblo_originario', 'prevision',
-            'antecedentes_medicos', 'fecha_registro',
+            'antecedentes_medicos', 'fecha_registro', 'fecha_modificacion',
             # Campos de solo escritura
             'rut_write', 'nombre_write', 'telefono_write', 'antecedentes_write'
         ]
-        read_only_fields = ['fecha_registro']
+        read_only_fields = ['fecha_registro', 'fecha_modificacion']
+        list_serializer_class = BatchDecryptListSerializer
         
     def create(self, validated_data):
         madre = Madre()
@@ -1,3 +1,13 @@
 from django.test import TestCase
 
-# Create your tests here.
+from core.pruebas import PresupuestoConsultasMixin
+from . import urls
+
+
+class PresupuestoConsultasTests(PresupuestoConsultasMixin, TestCase):
+    router = urls.router
+    presupuestos = {
+        # ruta: (máx. consultas, máx. descifrados por fila)
+        'madre-list': (1, 4),
+        'madre-detail': (1, 4),
+    }
@@ -2,10 +2,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from . import views
+from core.asincrono import rutas_lectura_async
 
 router = DefaultRouter()
 router.register(r'madres', views.MadreViewSet, basename='madre')
 
 urlpatterns = [
+    # GET de lista/detalle asíncronos (core.asincrono); el resto sigue en el router.
+    *rutas_lectura_async(r'madres', views.MadreViewSet, basename='madre'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -4,11 +4,16 @@ from . import models # <--- LÍNEA FALTANTE
 from . import serializers # <--- LÍNEA FALTANTE
 from usuarios import permissions as custom_permissions
 from auditoria.utils import log_audit
+from core.asincrono import LecturaAsyncMixin
+from core.pagination import KeysetPagination
+from core.sync import DeltaSyncMixin
 
-class MadreViewSet(viewsets.ModelViewSet):
+class MadreViewSet(DeltaSyncMixin, LecturaAsyncMixin, viewsets.ModelViewSet):
     queryset = models.Madre.objects.all().order_by('-fecha_registro')
     serializer_class = serializers.MadreSerializer
     permission_classes = [custom_permissions.CanManageMadre]
+    pagination_class = KeysetPagination
+    ordering = ('-fecha_registro', '-id')
 
     def perform_create(self, serializer):
         instance = serializer.save() 
@@ -16,7 +21,7 @@ class MadreViewSet(viewsets.ModelViewSet):
 
     def perform_update(self, serializer):
         user = self.request.user
-        if user.rol.nombre == custom_permissions.ROL_ADMINISTRATIVO:
+        if custom_permissions.nombre_rol(user) == custom_permissions.ROL_ADMINISTRATIVO:
             allowed_fields = {'rut_write', 'nombre_write', 'telefono_write', 'fecha_nacimiento', 'nacionalidad', 'pertenece_pueblo_originario', 'prevision', 'ficha_clinica_id'}
             for field in serializer.validated_data.keys():
                 if field not in allowed_fields:
@@ -2,4 +2,9 @@ from django.apps import AppConfig
 
 class PartosConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'partos'
\ No newline at end of file
+    name = 'partos'
+
+    def ready(self):
+        from . import signals  # noqa: F401 (registra los receivers de IndicadorDiario)
+        from core.sync import seguir_eliminaciones
+        seguir_eliminaciones(*(self.get_model(nombre) for nombre in ('Parto', 'RecienNacido', 'Defuncion', 'DocumentoReferencia')))
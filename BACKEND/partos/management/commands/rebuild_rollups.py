@@ -0,0 +1,28 @@
+# partos/management/commands/rebuild_rollups.py
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from partos import rollups
+
+
+class Command(BaseCommand):
+    help = 'Recalcula IndicadorDiario (rollups del dashboard) desde Parto, RecienNacido y Defuncion.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--desde', help='Primer día a recalcular (AAAA-MM-DD). Por defecto, todo.')
+        parser.add_argument('--hasta', help='Último día a recalcular (AAAA-MM-DD), inclusivo.')
+
+    def handle(self, *args, **options):
+        desde = self._fecha(options['desde'], '--desde')
+        hasta = self._fecha(options['hasta'], '--hasta')
+        filas = rollups.reconstruir(desde, hasta)
+        self.stdout.write(self.style.SUCCESS(f'IndicadorDiario recalculado: {filas} filas.'))
+
+    @staticmethod
+    def _fecha(value, option):
+        if not value:
+            return None
+        fecha = parse_date(value)
+        if fecha is None:
+            raise CommandError(f'{option}: formato de fecha inválido (use AAAA-MM-DD).')
+        return fecha
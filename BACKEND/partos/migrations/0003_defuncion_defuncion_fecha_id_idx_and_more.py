@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-18 16:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogos', '0001_initial'),
+        ('pacientes', '0002_madre_madre_fecha_reg_id_idx'),
+        ('partos', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='defuncion',
+            index=models.Index(fields=['fecha_defuncion', 'id'], name='defuncion_fecha_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='parto',
+            index=models.Index(fields=['fecha_parto', 'id'], name='parto_fecha_parto_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reciennacido',
+            index=models.Index(fields=['fecha_registro', 'id'], name='rn_fecha_reg_id_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partos', '0003_defuncion_defuncion_fecha_id_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndicadorDiario',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fecha', models.DateField()),
+                ('turno', models.CharField(max_length=20)),
+                ('indicador', models.CharField(max_length=50)),
+                ('categoria', models.CharField(max_length=100)),
+                ('total', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Indicador Diario',
+                'verbose_name_plural': 'Indicadores Diarios',
+                'db_table': 'IndicadorDiario',
+                'constraints': [models.UniqueConstraint(fields=('fecha', 'turno', 'indicador', 'categoria'), name='indicador_diario_unico')],
+            },
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogos', '0001_initial'),
+        ('pacientes', '0003_madre_fecha_modificacion_and_more'),
+        ('partos', '0004_indicadordiario'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='defuncion',
+            name='fecha_modificacion',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='documentoreferencia',
+            name='fecha_modificacion',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='parto',
+            name='fecha_modificacion',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='reciennacido',
+            name='fecha_modificacion',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='defuncion',
+            index=models.Index(fields=['fecha_modificacion', 'id'], name='defuncion_fecha_mod_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='documentoreferencia',
+            index=models.Index(fields=['fecha_modificacion', 'id'], name='docref_fecha_mod_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='parto',
+            index=models.Index(fields=['fecha_modificacion', 'id'], name='parto_fecha_mod_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reciennacido',
+            index=models.Index(fields=['fecha_modificacion', 'id'], name='rn_fecha_mod_id_idx'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogos', '0002_versioncatalogo'),
+        ('pacientes', '0003_madre_fecha_modificacion_and_more'),
+        ('partos', '0005_defuncion_fecha_modificacion_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='defuncion',
+            name='turno',
+            field=models.CharField(default='Ninguno', editable=False, max_length=20),
+        ),
+        migrations.AddField(
+            model_name='documentoreferencia',
+            name='turno',
+            field=models.CharField(default='Ninguno', editable=False, max_length=20),
+        ),
+        migrations.AddField(
+            model_name='parto',
+            name='turno',
+            field=models.CharField(default='Ninguno', editable=False, max_length=20),
+        ),
+        migrations.AddField(
+            model_name='reciennacido',
+            name='turno',
+            field=models.CharField(default='Ninguno', editable=False, max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='defuncion',
+            index=models.Index(fields=['turno', 'fecha_defuncion', 'id'], name='defuncion_turno_fecha_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='documentoreferencia',
+            index=models.Index(fields=['turno', 'fecha_generacion'], name='docref_turno_fecha_gen_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='parto',
+            index=models.Index(fields=['turno', 'fecha_parto', 'id'], name='parto_turno_fecha_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reciennacido',
+            index=models.Index(fields=['turno', 'fecha_registro', 'id'], name='rn_turno_fecha_reg_id_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Completa la columna turno (0006) en los registros existentes: Parto,
+# RecienNacido y Defuncion toman el turno actual de usuario_registro ('Ninguno'
+# si no tiene usuario o turno); DocumentoReferencia, el de su parto. Un UPDATE
+# con subconsulta por tabla, sin traer filas a Python.
+#
+# Desde aquí el turno es el del momento de la escritura: cambiar el turno de
+# un usuario ya no mueve sus registros anteriores (ni desordena IndicadorDiario).
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, NullIf
+
+TURNO_NINGUNO = 'Ninguno'
+
+
+def _turno_del_usuario(Usuario):
+    turno = Subquery(Usuario.objects.filter(pk=OuterRef('usuario_registro_id')).values('turno')[:1])
+    return Coalesce(NullIf(turno, Value('')), Value(TURNO_NINGUNO))
+
+
+def completar_turno(apps, schema_editor):
+    Usuario = apps.get_model('usuarios', 'Usuario')
+    for nombre in ('Parto', 'RecienNacido', 'Defuncion'):
+        apps.get_model('partos', nombre).objects.update(turno=_turno_del_usuario(Usuario))
+
+    Parto = apps.get_model('partos', 'Parto')
+    apps.get_model('partos', 'DocumentoReferencia').objects.update(
+        turno=Subquery(Parto.objects.filter(pk=OuterRef('parto_id')).values('turno')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partos', '0006_turno_denormalizado'),
+        ('usuarios', '0002_version_sesion'),
+    ]
+
+    operations = [
+        migrations.RunPython(completar_turno, migrations.RunPython.noop),
+    ]
@@ -7,6 +7,12 @@ from pacientes.models import Madre
 from usuarios.models import Usuario
 from catalogos.models import DiagnosticoCIE10
 
+
+def turno_de(usuario):
+    """Turno que se guarda en un registro: el del usuario al escribirlo ('Ninguno' si no tiene)."""
+    return usuario.turno if usuario is not None and usuario.turno else Usuario.TURNO_NINGUNO
+
+
 class Parto(models.Model):
     TIPO_PARTO_CHOICES = [('Eutócico', 'Eutócico'), ('Cesárea Electiva', 'Cesárea Electiva'), ('Cesárea Urgencia', 'Cesárea Urgencia'), ('Fórceps', 'Fórceps'), ('Ventosa', 'Ventosa')]
     ANESTESIA_CHOICES = [('Epidural', 'Epidural'), ('Raquídea', 'Raquídea'), ('General', 'General'), ('Otra', 'Otra'), ('Ninguna', 'Ninguna')]
@@ -20,13 +26,29 @@ class Parto(models.Model):
     partograma_data = models.JSONField(blank=True, null=True)
     epicrisis_data = models.JSONField(blank=True, null=True)
     usuario_registro = models.ForeignKey(Usuario, on_delete=models.SET_NULL, related_name='partos_registrados', null=True)
+    # Turno de usuario_registro al crear el registro (filtro de Enfermera/Matrona sin JOIN a Usuario)
+    turno = models.CharField(max_length=20, default=Usuario.TURNO_NINGUNO, editable=False)
     fecha_registro = models.DateTimeField(auto_now_add=True)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
     
     class Meta: 
         db_table = 'Parto'
         verbose_name = 'Parto'
         verbose_name_plural = 'Partos'
         ordering = ['-fecha_parto']
+        indexes = [
+            # Paginación keyset (fecha_parto, id)
+            models.Index(fields=['fecha_parto', 'id'], name='parto_fecha_parto_id_idx'),
+            models.Index(fields=['fecha_modificacion', 'id'], name='parto_fecha_mod_id_idx'),
+            # Lista por turno (Enfermera/Matrona) con el mismo orden keyset
+            models.Index(fields=['turno', 'fecha_parto', 'id'], name='parto_turno_fecha_id_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            self.turno = turno_de(self.usuario_registro)
+        super().save(*args, **kwargs)
+
     def __str__(self): return f"Parto ID: {self.id} - Madre ID: {self.madre_id}"
 
 class RecienNacido(models.Model):
@@ -45,7 +67,9 @@ class RecienNacido(models.Model):
     profilaxis_vit_k = models.BooleanField(blank=True, null=True)
     profilaxis_oftalmica = models.BooleanField(blank=True, null=True)
     usuario_registro = models.ForeignKey(Usuario, on_delete=models.SET_NULL, related_name='recien_nacidos_registrados', null=True)
+    turno = models.CharField(max_length=20, default=Usuario.TURNO_NINGUNO, editable=False)
     fecha_registro = models.DateTimeField(auto_now_add=True)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
 
     _plain_rut_provisorio = None
 
@@ -54,6 +78,12 @@ class RecienNacido(models.Model):
         verbose_name = 'Recién Nacido'
         verbose_name_plural = 'Recién Nacidos'
         ordering = ['-fecha_registro']
+        indexes = [
+            # Paginación keyset (fecha_registro, id)
+            models.Index(fields=['fecha_registro', 'id'], name='rn_fecha_reg_id_idx'),
+            models.Index(fields=['fecha_modificacion', 'id'], name='rn_fecha_mod_id_idx'),
+            models.Index(fields=['turno', 'fecha_registro', 'id'], name='rn_turno_fecha_reg_id_idx'),
+        ]
 
     def set_rut_provisorio(self, value): self._plain_rut_provisorio = value
 
@@ -61,6 +91,8 @@ class RecienNacido(models.Model):
         if self._plain_rut_provisorio:
             self.rut_provisorio = encrypt_data(str(self._plain_rut_provisorio))
             self._plain_rut_provisorio = None
+        if self._state.adding:
+            self.turno = turno_de(self.usuario_registro)
         super().save(*args, **kwargs)
 
     @property
@@ -84,14 +116,27 @@ class Defuncion(models.Model):
     fecha_defuncion = models.DateTimeField()
     causa_defuncion = models.ForeignKey(DiagnosticoCIE10, on_delete=models.PROTECT, related_name='defunciones')
     usuario_registro = models.ForeignKey(Usuario, on_delete=models.SET_NULL, related_name='defunciones_registradas', null=True)
+    turno = models.CharField(max_length=20, default=Usuario.TURNO_NINGUNO, editable=False)
     fecha_registro = models.DateTimeField(auto_now_add=True)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
     class Meta:
         db_table = 'Defuncion'
         verbose_name = 'Defunción'
         verbose_name_plural = 'Defunciones'
         ordering = ['-fecha_defuncion']
+        indexes = [
+            # Paginación keyset (fecha_defuncion, id)
+            models.Index(fields=['fecha_defuncion', 'id'], name='defuncion_fecha_id_idx'),
+            models.Index(fields=['fecha_modificacion', 'id'], name='defuncion_fecha_mod_id_idx'),
+            models.Index(fields=['turno', 'fecha_defuncion', 'id'], name='defuncion_turno_fecha_id_idx'),
+        ]
         constraints = [ models.CheckConstraint( check=(models.Q(recien_nacido__isnull=False) & models.Q(madre__isnull=True)) | (models.Q(recien_nacido__isnull=True) & models.Q(madre__isnull=False)), name='check_recien_nacido_or_madre' ) ]
 
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            self.turno = turno_de(self.usuario_registro)
+        super().save(*args, **kwargs)
+
 class DocumentoReferencia(models.Model):
     TIPO_DOCUMENTO_CHOICES = [ ('EPICRISIS_PDF', 'Epicrisis PDF'), ('REPORTE_EXCEL', 'Reporte Excel'), ('OTRO', 'Otro'), ]
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -100,7 +145,10 @@ class DocumentoReferencia(models.Model):
     nombre_archivo = models.TextField() # Cifrado
     tipo_documento = models.CharField(max_length=50, choices=TIPO_DOCUMENTO_CHOICES, db_index=True)
     usuario_generacion = models.ForeignKey(Usuario, on_delete=models.SET_NULL, related_name='documentos_generados', null=True)
+    # Turno del parto (no de quien genera el documento, normalmente un Médico sin turno)
+    turno = models.CharField(max_length=20, default=Usuario.TURNO_NINGUNO, editable=False)
     fecha_generacion = models.DateTimeField(auto_now_add=True)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
 
     _plain_nombre_archivo = None
 
@@ -109,6 +157,10 @@ class DocumentoReferencia(models.Model):
         verbose_name = 'Referencia de Documento'
         verbose_name_plural = 'Referencias de Documentos'
         ordering = ['-fecha_generacion']
+        indexes = [
+            models.Index(fields=['fecha_modificacion', 'id'], name='docref_fecha_mod_id_idx'),
+            models.Index(fields=['turno', 'fecha_generacion'], name='docref_turno_fecha_gen_idx'),
+        ]
 
     def set_nombre_archivo(self, value): self._plain_nombre_archivo = value
 
@@ -116,7 +168,32 @@ class DocumentoReferencia(models.Model):
         if self._plain_nombre_archivo:
             self.nombre_archivo = encrypt_data(str(self._plain_nombre_archivo))
             self._plain_nombre_archivo = None
+        if self._state.adding:
+            self.turno = self.parto.turno
         super().save(*args, **kwargs)
 
     @property
-    def decrypted_nombre_archivo(self): return decrypt_data(self.nombre_archivo)
\ No newline at end of file
+    def decrypted_nombre_archivo(self): return decrypt_data(self.nombre_archivo)
+
+class IndicadorDiario(models.Model):
+    """
+    Conteos por día y turno para los indicadores del dashboard
+    (ej. indicador='partos_tipo', categoria='Cesárea Urgencia').
+    Se mantiene incrementalmente desde partos/signals.py;
+    'manage.py rebuild_rollups' lo recalcula desde las tablas de origen.
+    """
+    fecha = models.DateField()
+    turno = models.CharField(max_length=20)
+    indicador = models.CharField(max_length=50)
+    categoria = models.CharField(max_length=100)
+    total = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'IndicadorDiario'
+        verbose_name = 'Indicador Diario'
+        verbose_name_plural = 'Indicadores Diarios'
+        constraints = [
+            models.UniqueConstraint(fields=['fecha', 'turno', 'indicador', 'categoria'], name='indicador_diario_unico'),
+        ]
+
+    def __str__(self): return f"{self.fecha} {self.turno} {self.indicador}={self.categoria}: {self.total}"
@@ -0,0 +1,94 @@
+# partos/reportes.py
+"""
+Agregados del reporte REM calculados en SQL (GROUP BY / COUNT ... FILTER).
+Solo devuelve conteos: ningún dato clínico individual sale del servidor.
+"""
+from django.db.models import Count, Q
+
+SIN_DATO = 'Sin dato'
+
+RANGOS_PESO = {
+    '<1000': Q(peso_gramos__lt=1000),
+    '1000-1499': Q(peso_gramos__gte=1000, peso_gramos__lt=1500),
+    '1500-2499': Q(peso_gramos__gte=1500, peso_gramos__lt=2500),
+    '2500-3999': Q(peso_gramos__gte=2500, peso_gramos__lt=4000),
+    '>=4000': Q(peso_gramos__gte=4000),
+    SIN_DATO: Q(peso_gramos__isnull=True),
+}
+
+# Semanas de gestación
+RANGOS_EDAD_GESTACIONAL = {
+    '<28': Q(edad_gestacional__lt=28),
+    '28-31': Q(edad_gestacional__gte=28, edad_gestacional__lt=32),
+    '32-36': Q(edad_gestacional__gte=32, edad_gestacional__lt=37),
+    '37-41': Q(edad_gestacional__gte=37, edad_gestacional__lt=42),
+    '>=42': Q(edad_gestacional__gte=42),
+    SIN_DATO: Q(edad_gestacional__isnull=True),
+}
+
+def _rangos_apgar(campo):
+    return {
+        '0-3': Q(**{f'{campo}__lte': 3}),
+        '4-6': Q(**{f'{campo}__gte': 4, f'{campo}__lte': 6}),
+        '7-10': Q(**{f'{campo}__gte': 7}),
+        SIN_DATO: Q(**{f'{campo}__isnull': True}),
+    }
+
+def _contar_por(queryset, campo):
+    filas = queryset.order_by().values(campo).annotate(total=Count('pk'))
+    return {(fila[campo] if fila[campo] is not None else SIN_DATO): fila['total'] for fila in filas}
+
+def _contar_rangos(queryset, rangos):
+    """Un solo SELECT con un COUNT(*) FILTER (WHERE ...) por rango."""
+    aggs = {f'r{i}': Count('pk', filter=q) for i, q in enumerate(rangos.values())}
+    totales = queryset.order_by().aggregate(**aggs)
+    return {nombre: totales[f'r{i}'] for i, nombre in enumerate(rangos)}
+
+def reporte_rem(partos, recien_nacidos, defunciones):
+    """
+    Recibe los querysets ya acotados por fecha y turno y devuelve las
+    secciones del REM como diccionarios de conteos.
+    """
+    total_rn = recien_nacidos.order_by().aggregate(
+        total=Count('pk'),
+        vivos=Count('pk', filter=Q(estado_al_nacer='Vivo')),
+        nacidos_muertos=Count('pk', filter=Q(estado_al_nacer='Nacido Muerto')),
+    )
+    total_def = defunciones.order_by().aggregate(
+        total=Count('pk'),
+        recien_nacidos=Count('pk', filter=Q(recien_nacido__isnull=False)),
+        maternas=Count('pk', filter=Q(madre__isnull=False)),
+    )
+    por_causa = (
+        defunciones.order_by()
+        .values('causa_defuncion__codigo', 'causa_defuncion__descripcion')
+        .annotate(total=Count('pk'))
+        .order_by('-total', 'causa_defuncion__codigo')
+    )
+
+    return {
+        'partos': {
+            'total': partos.order_by().count(),
+            'por_tipo_parto': _contar_por(partos, 'tipo_parto'),
+            'por_anestesia': _contar_por(partos, 'anestesia'),
+            'por_edad_gestacional': _contar_rangos(partos, RANGOS_EDAD_GESTACIONAL),
+        },
+        'recien_nacidos': {
+            **total_rn,
+            'por_sexo': _contar_por(recien_nacidos, 'sexo'),
+            'por_peso': _contar_rangos(recien_nacidos, RANGOS_PESO),
+            'apgar_1_min': _contar_rangos(recien_nacidos, _rangos_apgar('apgar_1_min')),
+            'apgar_5_min': _contar_rangos(recien_nacidos, _rangos_apgar('apgar_5_min')),
+        },
+        'defunciones': {
+            **total_def,
+            'por_causa': [
+                {
+                    'codigo': fila['causa_defuncion__codigo'],
+                    'descripcion': fila['causa_defuncion__descripcion'],
+                    'total': fila['total'],
+                }
+                for fila in por_causa
+            ],
+        },
+    }
@@ -0,0 +1,148 @@
+# partos/rollups.py
+"""
+Mantenimiento de IndicadorDiario.
+
+Cada registro (Parto, RecienNacido, Defuncion) "aporta" una unidad a un
+conjunto de claves (fecha, turno, indicador, categoria). Al guardar o borrar
+se resta lo que aportaba antes y se suma lo que aporta ahora. Las mismas
+reglas, expresadas en SQL, sirven para el recálculo completo (rebuild_rollups).
+"""
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Case, CharField, Count, F, Value, When
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from . import models
+from .reportes import RANGOS_PESO, SIN_DATO
+
+PARTOS_TIPO = 'partos_tipo'
+PARTOS_ANESTESIA = 'partos_anestesia'
+RN_ESTADO = 'rn_estado'
+RN_SEXO = 'rn_sexo'
+RN_PESO = 'rn_peso'
+DEFUNCIONES_CAUSA = 'defunciones_causa'
+
+TIPOS_CESAREA = ('Cesárea Electiva', 'Cesárea Urgencia')
+
+
+def banda_peso(gramos):
+    """Equivalente en Python de reportes.RANGOS_PESO."""
+    if gramos is None:
+        return SIN_DATO
+    if gramos < 1000:
+        return '<1000'
+    if gramos < 1500:
+        return '1000-1499'
+    if gramos < 2500:
+        return '1500-2499'
+    if gramos < 4000:
+        return '2500-3999'
+    return '>=4000'
+
+
+# --- Aportes de cada registro ---
+
+def contribuciones_parto(parto):
+    fecha = timezone.localdate(parto.fecha_parto)
+    return [
+        (fecha, parto.turno, PARTOS_TIPO, parto.tipo_parto),
+        (fecha, parto.turno, PARTOS_ANESTESIA, parto.anestesia or SIN_DATO),
+    ]
+
+
+def contribuciones_recien_nacido(rn, fecha_parto=None):
+    """El RN cuenta en el día de su parto ('fecha_parto' permite usar una fecha anterior)."""
+    fecha = timezone.localdate(fecha_parto or rn.parto.fecha_parto)
+    return [
+        (fecha, rn.turno, RN_ESTADO, rn.estado_al_nacer),
+        (fecha, rn.turno, RN_SEXO, rn.sexo or SIN_DATO),
+        (fecha, rn.turno, RN_PESO, banda_peso(rn.peso_gramos)),
+    ]
+
+
+def contribuciones_defuncion(defuncion):
+    fecha = timezone.localdate(defuncion.fecha_defuncion)
+    return [(fecha, defuncion.turno, DEFUNCIONES_CAUSA, defuncion.causa_defuncion.codigo)]
+
+
+def aplicar(restar=(), sumar=()):
+    """Aplica la diferencia entre los aportes anteriores y los actuales."""
+    delta = Counter(sumar)
+    delta.subtract(Counter(restar))
+    for clave, cantidad in delta.items():
+        if cantidad:
+            _incrementar(*clave, cantidad)
+
+
+def _incrementar(fecha, turno, indicador, categoria, cantidad):
+    clave = {'fecha': fecha, 'turno': turno, 'indicador': indicador, 'categoria': categoria}
+    if models.IndicadorDiario.objects.filter(**clave).update(total=F('total') + cantidad):
+        return
+    try:
+        with transaction.atomic():
+            models.IndicadorDiario.objects.create(total=cantidad, **clave)
+    except IntegrityError:
+        # Otra transacción creó la fila entre el UPDATE y el INSERT.
+        models.IndicadorDiario.objects.filter(**clave).update(total=F('total') + cantidad)
+
+
+# --- Recálculo completo (mismas reglas en SQL) ---
+
+def _peso_sql():
+    return Case(*[When(q, then=Value(nombre)) for nombre, q in RANGOS_PESO.items()], output_field=CharField())
+
+
+def fuentes_sql(desde=None, hasta=None):
+    """
+    [(indicador, queryset agrupable)] con columnas rollup_fecha/rollup_turno/rollup_categoria.
+    'desde'/'hasta' (date, inclusivos) acotan el día de cada registro.
+    """
+    partos = models.Parto.objects.annotate(rollup_fecha=TruncDate('fecha_parto'), rollup_turno=F('turno'))
+    rns = models.RecienNacido.objects.annotate(rollup_fecha=TruncDate('parto__fecha_parto'), rollup_turno=F('turno'))
+    defunciones = models.Defuncion.objects.annotate(rollup_fecha=TruncDate('fecha_defuncion'), rollup_turno=F('turno'))
+    if desde:
+        partos, rns, defunciones = (qs.filter(rollup_fecha__gte=desde) for qs in (partos, rns, defunciones))
+    if hasta:
+        partos, rns, defunciones = (qs.filter(rollup_fecha__lte=hasta) for qs in (partos, rns, defunciones))
+
+    return [
+        (PARTOS_TIPO, partos.annotate(rollup_categoria=F('tipo_parto'))),
+        (PARTOS_ANESTESIA, partos.annotate(rollup_categoria=Coalesce(F('anestesia'), Value(SIN_DATO)))),
+        (RN_ESTADO, rns.annotate(rollup_categoria=F('estado_al_nacer'))),
+        (RN_SEXO, rns.annotate(rollup_categoria=Coalesce(F('sexo'), Value(SIN_DATO)))),
+        (RN_PESO, rns.annotate(rollup_categoria=_peso_sql())),
+        (DEFUNCIONES_CAUSA, defunciones.annotate(rollup_categoria=F('causa_defuncion__codigo'))),
+    ]
+
+
+def reconstruir(desde=None, hasta=None, batch_size=1000):
+    """Borra y recalcula IndicadorDiario en el rango. Devuelve las filas creadas."""
+    with transaction.atomic():
+        existentes = models.IndicadorDiario.objects.all()
+        if desde:
+            existentes = existentes.filter(fecha__gte=desde)
+        if hasta:
+            existentes = existentes.filter(fecha__lte=hasta)
+        existentes.delete()
+
+        filas = []
+        for indicador, queryset in fuentes_sql(desde, hasta):
+            grupos = (
+                queryset.order_by()
+                .values('rollup_fecha', 'rollup_turno', 'rollup_categoria')
+                .annotate(total=Count('pk'))
+            )
+            filas.extend(
+                models.IndicadorDiario(
+                    fecha=grupo['rollup_fecha'],
+                    turno=grupo['rollup_turno'],
+                    indicador=indicador,
+                    categoria=grupo['rollup_categoria'],
+                    total=grupo['total'],
+                )
+                for grupo in grupos
+            )
+        models.IndicadorDiario.objects.bulk_create(filas, batch_size=batch_size)
+    return len(filas)
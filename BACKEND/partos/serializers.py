@@ -1,6 +1,7 @@
 # partos/serializers.py
 from rest_framework import serializers
 from . import models
+from core.serializers import EncryptedField, BatchDecryptListSerializer
 
 # --- Importaciones de modelos de otras apps ---
 from catalogos.models import DiagnosticoCIE10
@@ -10,13 +11,14 @@ from usuarios.models import Usuario
 
 
 class PartoSerializer(serializers.ModelSerializer):
-    madre_nombre = serializers.CharField(source='madre.nombre', read_only=True)
+    madre_nombre = EncryptedField(source='madre.nombre_encrypted')
     usuario_registro_nombre = serializers.CharField(source='usuario_registro.username', read_only=True, allow_null=True)
     tipo_parto = serializers.ChoiceField(choices=models.Parto.TIPO_PARTO_CHOICES)
 
     class Meta:
         model = models.Parto
         fields = '__all__'
+        list_serializer_class = BatchDecryptListSerializer
 
     # CORREGIDO: Añadida validación de backend
     def validate(self, data):
@@ -55,9 +57,9 @@ class PartoSerializer(serializers.ModelSerializer):
 class RecienNacidoSerializer(serializers.ModelSerializer):
     parto_fecha = serializers.DateTimeField(source='parto.fecha_parto', read_only=True)
     madre_id = serializers.UUIDField(source='parto.madre_id', read_only=True)
-    madre_nombre = serializers.CharField(source='parto.madre.nombre', read_only=True)
+    madre_nombre = EncryptedField(source='parto.madre.nombre_encrypted')
     usuario_registro_nombre = serializers.CharField(source='usuario_registro.username', read_only=True, allow_null=True)
-    rut_provisorio = serializers.CharField(source='decrypted_rut_provisorio', read_only=True, allow_null=True)
+    rut_provisorio = EncryptedField()
     
     # CORREGIDO: Validación
     rut_provisorio_write = serializers.CharField(
@@ -71,9 +73,7 @@ class RecienNacidoSerializer(serializers.ModelSerializer):
     class Meta:
         model = models.RecienNacido
         fields = '__all__'
-        extra_kwargs = {
-            'rut_provisorio': {'source': 'decrypted_rut_provisorio'},
-        }
+        list_serializer_class = BatchDecryptListSerializer
 
     def create(self, validated_data):
         rut_prov_plain = validated_data.pop('rut_provisorio_write', None)
@@ -99,8 +99,8 @@ class PartoDiagnosticoSerializer(serializers.ModelSerializer):
         fields = ['parto', 'diagnostico_id', 'diagnostico_codigo', 'diagnostico_descripcion']
 
 class DefuncionSerializer(serializers.ModelSerializer):
-    madre_nombre = serializers.CharField(source='madre.nombre', read_only=True, allow_null=True)
-    recien_nacido_rut_provisorio = serializers.CharField(source='recien_nacido.decrypted_rut_provisorio', read_only=True, allow_null=True)
+    madre_nombre = EncryptedField(source='madre.nombre_encrypted')
+    recien_nacido_rut_provisorio = EncryptedField(source='recien_nacido.rut_provisorio')
     causa_defuncion_display = serializers.CharField(source='causa_defuncion.descripcion', read_only=True)
     usuario_registro_nombre = serializers.CharField(source='usuario_registro.username', read_only=True, allow_null=True)
     madre = serializers.PrimaryKeyRelatedField(queryset=Madre.objects.all(), allow_null=True, required=False)
@@ -109,6 +109,7 @@ class DefuncionSerializer(serializers.ModelSerializer):
     class Meta: 
         model = models.Defuncion
         fields = '__all__'
+        list_serializer_class = BatchDecryptListSerializer
     def validate(self, data):
         if not data.get('madre') and not data.get('recien_nacido'): raise serializers.ValidationError("Se debe asociar una madre O un recién nacido.")
         if data.get('madre') and data.get('recien_nacido'): raise serializers.ValidationError("No se puede asociar una madre Y un recién nacido a la vez.")
@@ -117,15 +118,13 @@ class DefuncionSerializer(serializers.ModelSerializer):
 class DocumentoReferenciaSerializer(serializers.ModelSerializer):
     parto_fecha = serializers.DateTimeField(source='parto.fecha_parto', read_only=True)
     usuario_generacion_nombre = serializers.CharField(source='usuario_generacion.username', read_only=True, allow_null=True)
-    nombre_archivo = serializers.CharField(source='decrypted_nombre_archivo', read_only=True)
+    nombre_archivo = EncryptedField()
     nombre_archivo_write = serializers.CharField(write_only=True, required=False, allow_null=True)
 
     class Meta:
         model = models.DocumentoReferencia
         fields = '__all__'
-        extra_kwargs = {
-            'nombre_archivo': {'source': 'decrypted_nombre_archivo'},
-        }
+        list_serializer_class = BatchDecryptListSerializer
 
     def create(self, validated_data):
         nombre_plain = validated_data.pop('nombre_archivo_write', None)
@@ -0,0 +1,92 @@
+# partos/signals.py
+"""
+Mantiene IndicadorDiario en el mismo camino de escritura (y la misma
+transacción) que Parto, RecienNacido y Defuncion.
+"""
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import models, rollups
+
+
+def _guardar_aportes_anteriores(sender, instance, contribuciones, select_related):
+    instance._rollup_anterior = None
+    if instance._state.adding:
+        return
+    anterior = sender.objects.select_related(*select_related).filter(pk=instance.pk).first()
+    if anterior is not None:
+        instance._rollup_anterior = anterior
+        instance._rollup_aportes = contribuciones(anterior)
+
+
+@receiver(pre_save, sender=models.Parto)
+def parto_pre_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _guardar_aportes_anteriores(sender, instance, rollups.contribuciones_parto, [])
+
+
+@receiver(post_save, sender=models.Parto)
+def parto_post_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    anterior = getattr(instance, '_rollup_anterior', None)
+    rollups.aplicar(
+        restar=instance._rollup_aportes if anterior else [],
+        sumar=rollups.contribuciones_parto(instance),
+    )
+    # Los RN cuentan en el día del parto: si la fecha cambió, se mueven.
+    if anterior and anterior.fecha_parto != instance.fecha_parto:
+        for rn in instance.recien_nacidos.all():
+            rollups.aplicar(
+                restar=rollups.contribuciones_recien_nacido(rn, anterior.fecha_parto),
+                sumar=rollups.contribuciones_recien_nacido(rn, instance.fecha_parto),
+            )
+
+
+@receiver(pre_save, sender=models.RecienNacido)
+def recien_nacido_pre_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _guardar_aportes_anteriores(sender, instance, rollups.contribuciones_recien_nacido, ['parto'])
+
+
+@receiver(post_save, sender=models.RecienNacido)
+def recien_nacido_post_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    anterior = getattr(instance, '_rollup_anterior', None)
+    rollups.aplicar(
+        restar=instance._rollup_aportes if anterior else [],
+        sumar=rollups.contribuciones_recien_nacido(instance),
+    )
+
+
+@receiver(pre_save, sender=models.Defuncion)
+def defuncion_pre_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _guardar_aportes_anteriores(sender, instance, rollups.contribuciones_defuncion, ['causa_defuncion'])
+
+
+@receiver(post_save, sender=models.Defuncion)
+def defuncion_post_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    anterior = getattr(instance, '_rollup_anterior', None)
+    rollups.aplicar(
+        restar=instance._rollup_aportes if anterior else [],
+        sumar=rollups.contribuciones_defuncion(instance),
+    )
+
+
+@receiver(post_delete, sender=models.Parto)
+def parto_post_delete(sender, instance, **kwargs):
+    rollups.aplicar(restar=rollups.contribuciones_parto(instance))
+
+
+@receiver(post_delete, sender=models.RecienNacido)
+def recien_nacido_post_delete(sender, instance, **kwargs):
+    rollups.aplicar(restar=rollups.contribuciones_recien_nacido(instance))
+
+
+@receiver(post_delete, sender=models.Defuncion)
+def defuncion_post_delete(sender, instance, **kwargs):
+    rollups.aplicar(restar=rollups.contribuciones_defuncion(instance))
@@ -1,3 +1,44 @@
 from django.test import TestCase
+from django.utils import timezone
 
-# Create your tests here.
+from core.pruebas import PresupuestoConsultasMixin, crear_usuarios
+from pacientes.models import Madre
+from usuarios.models import Usuario
+from . import urls
+from .models import Parto
+
+
+class PresupuestoConsultasTests(PresupuestoConsultasMixin, TestCase):
+    router = urls.router
+    presupuestos = {
+        # ruta: (máx. consultas, máx. descifrados por fila)
+        'parto-list': (1, 1),
+        'parto-detail': (1, 1),
+        'reciennacido-list': (1, 2),
+        'reciennacido-detail': (1, 2),
+        'partodiagnostico-list': (1, 0),
+        'partodiagnostico-detail': (1, 0),
+        'defuncion-list': (1, 1),
+        'defuncion-detail': (1, 1),
+        'documentoreferencia-list': (1, 1),
+        'documentoreferencia-detail': (1, 1),
+        # Agregados: una consulta por sección del REM, sin datos individuales.
+        'reporte-indicadores': (2, 0),
+        'reporte-rem': (11, 0),
+    }
+
+
+class TurnoDenormalizadoTests(TestCase):
+    def test_turno_se_fija_al_escribir(self):
+        usuarios = crear_usuarios()
+        matrona = usuarios['matrona']
+        parto = Parto.objects.create(madre=Madre.objects.create(ficha_clinica_id='T-1'), tipo_parto='Eutócico',
+                                     fecha_parto=timezone.now(), usuario_registro=matrona)
+        self.assertEqual(parto.turno, matrona.turno)
+
+        matrona.turno = Usuario.TURNO_TARDE
+        matrona.save()
+        parto.save()
+        parto.refresh_from_db()
+        self.assertNotEqual(parto.turno, Usuario.TURNO_TARDE)
+        self.assertEqual(Parto.objects.filter(turno=Usuario.TURNO_TARDE).count(), 0)
@@ -2,6 +2,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from . import views
+from core.asincrono import rutas_lectura_async
 
 router = DefaultRouter()
 router.register(r'partos', views.PartoViewSet, basename='parto')
@@ -9,7 +10,11 @@ router.register(r'recien-nacidos', views.RecienNacidoViewSet, basename='recienna
 router.register(r'parto-diagnosticos', views.PartoDiagnosticoViewSet, basename='partodiagnostico')
 router.register(r'defunciones', views.DefuncionViewSet, basename='defuncion')
 router.register(r'documentos', views.DocumentoReferenciaViewSet, basename='documentoreferencia')
+router.register(r'reportes', views.ReporteViewSet, basename='reporte')
 
 urlpatterns = [
+    # GET de lista/detalle asíncronos (core.asincrono); el resto sigue en el router.
+    *rutas_lectura_async(r'partos', views.PartoViewSet, basename='parto'),
+    *rutas_lectura_async(r'recien-nacidos', views.RecienNacidoViewSet, basename='reciennacido'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -2,20 +2,35 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from django.db.models import Sum
 from django.utils import timezone
 from datetime import timedelta
 from . import models # <--- LÍNEA FALTANTE
 from . import serializers # <--- LÍNEA FALTANTE
+from .reportes import reporte_rem
+from . import rollups
 from usuarios import permissions as custom_permissions
 from usuarios.models import Usuario as CustomUserModel 
 from auditoria.utils import log_audit
+from core.asincrono import LecturaAsyncMixin
+from core.pagination import KeysetPagination
+from core.sync import DeltaSyncMixin
+from core.utils.query_params import parse_fecha_param
 
 VENTANA_EDICION_HORAS = 2
 
-class PartoViewSet(viewsets.ModelViewSet):
+def turno_restringido(user):
+    """Turno al que se limita la vista del usuario (Enfermera/Matrona con turno), o None."""
+    if custom_permissions.nombre_rol(user) in [custom_permissions.ROL_ENFERMERA, custom_permissions.ROL_MATRONA] and user.turno and user.turno != CustomUserModel.TURNO_NINGUNO:
+        return user.turno
+    return None
+
+class PartoViewSet(DeltaSyncMixin, LecturaAsyncMixin, viewsets.ModelViewSet):
     queryset = models.Parto.objects.select_related('madre', 'usuario_registro').order_by('-fecha_parto')
     serializer_class = serializers.PartoSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    ordering = ('-fecha_parto', '-id')
 
     def get_permissions(self):
         if self.action in ['update', 'partial_update']:
@@ -27,10 +42,10 @@ class PartoViewSet(viewsets.ModelViewSet):
         return [custom_permissions.CanReadClinicalData()]
 
     def get_queryset(self):
-        user = self.request.user
         queryset = super().get_queryset()
-        if user.rol.nombre in [custom_permissions.ROL_ENFERMERA, custom_permissions.ROL_MATRONA] and user.turno and user.turno != CustomUserModel.TURNO_NINGUNO:
-            return queryset.filter(usuario_registro__turno=user.turno)
+        turno = turno_restringido(self.request.user)
+        if turno:
+            return queryset.filter(turno=turno)
         return queryset
 
     def perform_create(self, serializer):
@@ -44,15 +59,16 @@ class PartoViewSet(viewsets.ModelViewSet):
         if not custom_permissions.IsAssignedToTurnoOrAdmin().has_object_permission(request, self, instance):
              raise permissions.PermissionDenied(custom_permissions.IsAssignedToTurnoOrAdmin.message)
 
-        if user.rol.nombre == custom_permissions.ROL_MATRONA:
+        if custom_permissions.nombre_rol(user) == custom_permissions.ROL_MATRONA:
             tiempo_limite = instance.fecha_registro + timedelta(hours=VENTANA_EDICION_HORAS)
             if timezone.now() > tiempo_limite:
                 return Response(
                     {"detail": f"La ventana de edición de {VENTANA_EDICION_HORAS} horas ha expirado. Use 'Anexar Corrección' (Médico)."},
                     status=status.HTTP_403_FORBIDDEN
                 )
+            response = super().update(request, *args, **kwargs)
             log_audit(user, request, "EDITAR_PARTO", instance, f"Parto ID {instance.id} editado (dentro de ventana).")
-            return super().update(request, *args, **kwargs)
+            return response
 
         return Response(
             {"detail": "Solo Matronas pueden editar directamente un parto."},
@@ -78,10 +94,12 @@ class PartoViewSet(viewsets.ModelViewSet):
         return Response({"status": "corrección anexada"}, status=status.HTTP_200_OK)
 
 
-class RecienNacidoViewSet(viewsets.ModelViewSet):
+class RecienNacidoViewSet(DeltaSyncMixin, LecturaAsyncMixin, viewsets.ModelViewSet):
     queryset = models.RecienNacido.objects.select_related('parto__madre', 'usuario_registro').order_by('-fecha_registro')
     serializer_class = serializers.RecienNacidoSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    ordering = ('-fecha_registro', '-id')
 
     def get_permissions(self):
         if self.action in ['update', 'partial_update']:
@@ -91,10 +109,10 @@ class RecienNacidoViewSet(viewsets.ModelViewSet):
         return [custom_permissions.CanReadClinicalData()]
 
     def get_queryset(self):
-        user = self.request.user
         queryset = super().get_queryset()
-        if user.rol.nombre in [custom_permissions.ROL_ENFERMERA, custom_permissions.ROL_MATRONA] and user.turno and user.turno != CustomUserModel.TURNO_NINGUNO:
-            return queryset.filter(usuario_registro__turno=user.turno)
+        turno = turno_restringido(self.request.user)
+        if turno:
+            return queryset.filter(turno=turno)
         return queryset
 
     def perform_create(self, serializer):
@@ -113,20 +131,23 @@ class RecienNacidoViewSet(viewsets.ModelViewSet):
                 {"detail": f"La ventana de edición de {VENTANA_EDICION_HORAS} horas ha expirado."},
                 status=status.HTTP_403_FORBIDDEN
             )
+        response = super().update(request, *args, **kwargs)
         log_audit(user, request, "EDITAR_RECIENNACIDO", instance, f"RN ID {instance.id} actualizado.")
-        return super().update(request, *args, **kwargs)
+        return response
 
 
 class PartoDiagnosticoViewSet(viewsets.ModelViewSet):
     queryset = models.PartoDiagnostico.objects.select_related('parto', 'diagnostico').all()
     serializer_class = serializers.PartoDiagnosticoSerializer
-    permission_classes = [custom_permissions.IsMatrona | custom_permissions.IsMedico]
+    permission_classes = [custom_permissions.IsMatronaOrMedico]
 
 
-class DefuncionViewSet(viewsets.ModelViewSet):
+class DefuncionViewSet(DeltaSyncMixin, viewsets.ModelViewSet):
     queryset = models.Defuncion.objects.select_related('recien_nacido', 'madre', 'causa_defuncion', 'usuario_registro').order_by('-fecha_defuncion')
     serializer_class = serializers.DefuncionSerializer
     permission_classes = [custom_permissions.CanManageEpicrisisOrDefuncion]
+    pagination_class = KeysetPagination
+    ordering = ('-fecha_defuncion', '-id')
 
     def perform_create(self, serializer):
         instance = serializer.save(usuario_registro=self.request.user)
@@ -138,7 +159,7 @@ class DefuncionViewSet(viewsets.ModelViewSet):
         log_audit(self.request.user, self.request, "EDITAR_DEFUNCION", instance, f"Registro Defunción ID {instance.id} actualizado.")
 
 
-class DocumentoReferenciaViewSet(viewsets.ModelViewSet):
+class DocumentoReferenciaViewSet(DeltaSyncMixin, viewsets.ModelViewSet):
     queryset = models.DocumentoReferencia.objects.select_related('parto', 'usuario_generacion').order_by('-fecha_generacion')
     serializer_class = serializers.DocumentoReferenciaSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -151,12 +172,81 @@ class DocumentoReferenciaViewSet(viewsets.ModelViewSet):
          return [custom_permissions.CanReadClinicalData()]
 
     def get_queryset(self):
-        user = self.request.user
         queryset = super().get_queryset()
-        if user.rol.nombre in [custom_permissions.ROL_ENFERMERA, custom_permissions.ROL_MATRONA] and user.turno and user.turno != CustomUserModel.TURNO_NINGUNO:
-            return queryset.filter(parto__usuario_registro__turno=user.turno)
+        turno = turno_restringido(self.request.user)
+        if turno:
+            return queryset.filter(turno=turno)
         return queryset
 
     def perform_create(self, serializer):
         instance = serializer.save(usuario_generacion=self.request.user)
-        log_audit(self.request.user, self.request, "CREAR_DOC_REF", instance, f"Referencia '{instance.decrypted_nombre_archivo}' creada.")
\ No newline at end of file
+        log_audit(self.request.user, self.request, "CREAR_DOC_REF", instance, f"Referencia '{instance.decrypted_nombre_archivo}' creada.")
+
+class ReporteViewSet(viewsets.ViewSet):
+    """
+    Reportes estadísticos calculados en el servidor (solo agregados).
+    """
+    permission_classes = [custom_permissions.CanReadClinicalData]
+
+    @action(detail=False, methods=['get'])
+    def rem(self, request):
+        """
+        GET /api/partos/reportes/rem/?desde=AAAA-MM-DD&hasta=AAAA-MM-DD
+        Sin rango, usa el mes en curso. Aplica el mismo filtro por turno que PartoViewSet.
+        """
+        hoy = timezone.localdate()
+        desde = parse_fecha_param(request.query_params.get('desde') or hoy.replace(day=1).isoformat(), 'desde')
+        hasta = parse_fecha_param(request.query_params.get('hasta') or hoy.isoformat(), 'hasta', end=True)
+
+        partos = models.Parto.objects.filter(fecha_parto__gte=desde, fecha_parto__lt=hasta)
+        recien_nacidos = models.RecienNacido.objects.filter(parto__fecha_parto__gte=desde, parto__fecha_parto__lt=hasta)
+        defunciones = models.Defuncion.objects.filter(fecha_defuncion__gte=desde, fecha_defuncion__lt=hasta)
+
+        turno = turno_restringido(request.user)
+        if turno:
+            partos = partos.filter(turno=turno)
+            recien_nacidos = recien_nacidos.filter(turno=turno)
+            defunciones = defunciones.filter(turno=turno)
+
+        return Response({
+            'desde': desde,
+            'hasta': hasta,
+            **reporte_rem(partos, recien_nacidos, defunciones),
+        })
+
+    @action(detail=False, methods=['get'])
+    def indicadores(self, request):
+        """
+        GET /api/partos/reportes/indicadores/?desde=&hasta=
+        Indicadores del dashboard leídos de IndicadorDiario: el costo depende de
+        los días del rango, no de la cantidad de registros. Sin rango, últimos 30 días.
+        """
+        hoy = timezone.localdate()
+        desde = parse_fecha_param(request.query_params.get('desde') or (hoy - timedelta(days=29)).isoformat(), 'desde').date()
+        hasta = parse_fecha_param(request.query_params.get('hasta') or hoy.isoformat(), 'hasta', end=True).date()
+
+        filas = models.IndicadorDiario.objects.filter(fecha__gte=desde, fecha__lt=hasta)
+        turno = turno_restringido(request.user)
+        if turno:
+            filas = filas.filter(turno=turno)
+
+        totales = {}
+        for fila in filas.values('indicador', 'categoria').annotate(total=Sum('total')).order_by():
+            totales.setdefault(fila['indicador'], {})[fila['categoria']] = fila['total']
+
+        por_tipo = totales.get(rollups.PARTOS_TIPO, {})
+        total_partos = sum(por_tipo.values())
+        cesareas = sum(por_tipo.get(tipo, 0) for tipo in rollups.TIPOS_CESAREA)
+        serie = (
+            filas.filter(indicador=rollups.PARTOS_TIPO)
+            .values('fecha').annotate(partos=Sum('total')).order_by('fecha')
+        )
+        return Response({
+            'desde': desde,
+            'hasta': hasta - timedelta(days=1),
+            'totales': totales,
+            'cesareas': cesareas,
+            'total_partos': total_partos,
+            'tasa_cesarea': round(cesareas / total_partos, 4) if total_partos else None,
+            'partos_por_dia': list(serie),
+        })
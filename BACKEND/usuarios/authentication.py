@@ -0,0 +1,98 @@
+# usuarios/authentication.py
+"""
+Autenticación JWT sin consultas a la base de datos.
+
+El token de acceso lleva los datos que usan los permisos y las vistas
+(usuario, rol, turno, estado) y la versión de sesión del usuario. Con eso se
+arma un Usuario "liviano": una instancia real del modelo (se puede asignar a
+una FK o pasar a log_audit) con solo esos campos cargados; cualquier otro
+campo se carga de la base al accederlo, como un .only().
+
+La revocación (desactivación, cambio de rol o turno, eliminación) se
+controla con usuarios.sesiones, cacheada en proceso.
+"""
+import uuid
+
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication as BaseJWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .models import Usuario
+from .roles import nombre_rol
+from .sesiones import versiones_sesion
+
+CLAIM_VERSION = 'ver'
+
+
+def claims_usuario(user):
+    """
+    Claims que se agregan a los tokens emitidos para 'user'. La versión se
+    lee de la base (login y refresh ya la consultan), no de la caché.
+    """
+    return {
+        'username': user.username,
+        'rol': nombre_rol(user),
+        'rol_id': str(user.rol_id) if user.rol_id else None,
+        'turno': user.turno,
+        'is_active': user.is_active,
+        CLAIM_VERSION: versiones_sesion.vigente(user.pk),
+    }
+
+
+def usuario_desde_claims(token):
+    valores = {
+        'id': uuid.UUID(str(token[api_settings.USER_ID_CLAIM])),
+        'username': token['username'],
+        'rol_id': uuid.UUID(token['rol_id']) if token['rol_id'] else None,
+        'turno': token['turno'],
+        'is_active': token['is_active'],
+    }
+    campos = [f.attname for f in Usuario._meta.concrete_fields if f.attname in valores]
+    user = Usuario.from_db(DEFAULT_DB_ALIAS, campos, [valores[campo] for campo in campos])
+    user.rol_nombre = token['rol']
+    return user
+
+
+class JWTAuthentication(BaseJWTAuthentication):
+    """
+    Construye request.user desde los claims del token. Los tokens emitidos
+    antes de agregar los claims se validan como en simplejwt (consultando
+    Usuario, con su Rol en la misma consulta).
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        if CLAIM_VERSION not in validated_token or api_settings.CHECK_REVOKE_TOKEN:
+            return self._get_user_db(user_id, validated_token)
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not validated_token['is_active']:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if validated_token[CLAIM_VERSION] < versiones_sesion.version(user_id):
+            raise AuthenticationFailed("La sesión fue revocada. Inicie sesión nuevamente.", code="token_revoked")
+
+        try:
+            return usuario_desde_claims(validated_token)
+        except (KeyError, ValueError) as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+    def _get_user_db(self, user_id, validated_token):
+        try:
+            user = self.user_model.objects.select_related('rol').get(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
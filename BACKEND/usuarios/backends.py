@@ -1,28 +1,15 @@
 # usuarios/backends.py
-from django.contrib.auth.backends import BaseBackend
-from .models import Usuario
-from core.utils.security_utils import check_password # <- Ruta actualizada
+from django.contrib.auth.backends import ModelBackend
+from .login import autenticar
 
-class CustomUserModelBackend(BaseBackend):
+class CustomUserModelBackend(ModelBackend):
     """
     Backend de autenticación para el modelo Usuario personalizado.
-    Verifica las credenciales contra el campo 'password_hash'.
+    Solo reemplaza authenticate(); los permisos de modelo (has_perm,
+    get_all_permissions, usados por el admin de Django) y get_user son los
+    de ModelBackend.
     """
 
     def authenticate(self, request, username=None, password=None, **kwargs):
-        try:
-            user = Usuario.objects.get(username=username)
-            if user.is_active and check_password(password, user.password): # Cambiado 'activo' a 'is_active' y 'password_hash' a 'password'
-                return user
-        except Usuario.DoesNotExist:
-            return None
-        except Exception as e:
-            print(f"Error en CustomUserModelBackend: {e}")
-            return None
-        return None
-
-    def get_user(self, user_id):
-        try:
-            return Usuario.objects.get(pk=user_id)
-        except Usuario.DoesNotExist:
-            return None
\ No newline at end of file
+        # Misma verificación que el login de la API (con rehash de parámetros).
+        return autenticar(username, password)
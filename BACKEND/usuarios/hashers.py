@@ -0,0 +1,15 @@
+# usuarios/hashers.py
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher as BaseArgon2PasswordHasher
+
+
+class Argon2PasswordHasher(BaseArgon2PasswordHasher):
+    """
+    Argon2 con parámetros configurables (ARGON2_*). Mantiene el algoritmo
+    'argon2': los hashes existentes siguen verificándose y, si sus parámetros
+    difieren de los configurados, se recalculan en el siguiente login
+    (usuarios.login).
+    """
+    time_cost = settings.ARGON2_TIME_COST
+    memory_cost = settings.ARGON2_MEMORY_COST
+    parallelism = settings.ARGON2_PARALLELISM
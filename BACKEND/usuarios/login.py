@@ -0,0 +1,134 @@
+# usuarios/login.py
+"""
+Verificación de credenciales para el login.
+
+Argon2 es deliberadamente caro (decenas de ms de CPU y ~100 MB de memoria
+por verificación). La vista asíncrona de token (usuarios.views) lo ejecuta
+en un pool de hilos acotado (LOGIN_HASH_WORKERS): con muchos logins
+simultáneos (cambio de turno) las verificaciones esperan su turno en el pool
+en vez de bloquear a los workers que atienden el resto de la API. argon2-cffi
+libera el GIL, así que los hilos verifican en paralelo.
+
+Si el hash guardado usa parámetros distintos de los configurados (ARGON2_* o
+un hasher preferido distinto), se recalcula con la contraseña recién
+verificada.
+"""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.hashers import make_password, verify_password
+
+from .models import Usuario
+
+logger = logging.getLogger(__name__)
+
+
+class CostoVerificacion:
+    """Tiempos de las verificaciones de contraseña de este proceso."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = 0
+        self.segundos = 0.0
+        self.maximo = 0.0
+        self.ultimo = 0.0
+        self.rehashes = 0
+
+    def registrar(self, segundos):
+        with self._lock:
+            self.total += 1
+            self.segundos += segundos
+            self.maximo = max(self.maximo, segundos)
+            self.ultimo = segundos
+
+    def registrar_rehash(self):
+        with self._lock:
+            self.rehashes += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'verificaciones': self.total,
+                'promedio_ms': (self.segundos / self.total * 1000) if self.total else 0.0,
+                'maximo_ms': self.maximo * 1000,
+                'ultimo_ms': self.ultimo * 1000,
+                'rehashes': self.rehashes,
+            }
+
+
+costo_verificacion = CostoVerificacion()
+
+_hash_executor = None
+_hash_executor_lock = threading.Lock()
+
+def _get_hash_executor():
+    global _hash_executor
+    if _hash_executor is None:
+        with _hash_executor_lock:
+            if _hash_executor is None:
+                _hash_executor = ThreadPoolExecutor(
+                    max_workers=settings.LOGIN_HASH_WORKERS,
+                    thread_name_prefix='login-hash',
+                )
+    return _hash_executor
+
+
+def verificar_hash(password, encoded):
+    """
+    Verifica 'password' contra el hash guardado ('encoded' None = usuario
+    inexistente). Devuelve (correcta, hash_nuevo): hash_nuevo solo si hay que
+    reemplazar el guardado.
+    """
+    inicio = time.perf_counter()
+    if encoded is None:
+        # Mismo costo que una verificación real: no revela si el usuario existe.
+        make_password(password)
+        correcta, actualizar = False, False
+    else:
+        correcta, actualizar = verify_password(password, encoded)
+    costo_verificacion.registrar(time.perf_counter() - inicio)
+    if correcta and actualizar:
+        return True, make_password(password)
+    return correcta, None
+
+
+def _buscar_usuario(username):
+    return Usuario.objects.select_related('rol').filter(username=username).first()
+
+
+def _guardar_rehash(user, encoded):
+    user.password = encoded
+    Usuario.objects.filter(pk=user.pk).update(password=encoded)
+    costo_verificacion.registrar_rehash()
+    logger.info("Hash de contraseña de '%s' actualizado a los parámetros vigentes.", user.username)
+
+
+def _resultado(user, correcta):
+    if not correcta or not user.is_active:
+        return None
+    return user
+
+
+def autenticar(username, password):
+    """Versión síncrona (backend de autenticación, admin de Django)."""
+    user = _buscar_usuario(username) if username else None
+    correcta, nuevo = verificar_hash(password, user.password if user else None)
+    if nuevo:
+        _guardar_rehash(user, nuevo)
+    return _resultado(user, correcta)
+
+
+async def autenticar_async(username, password):
+    """Igual que autenticar(), con la verificación en el pool de hilos de login."""
+    user = await sync_to_async(_buscar_usuario)(username) if username else None
+    executor = _get_hash_executor()
+    loop = asyncio.get_running_loop()
+    correcta, nuevo = await loop.run_in_executor(executor, verificar_hash, password, user.password if user else None)
+    if nuevo:
+        await sync_to_async(_guardar_rehash)(user, nuevo)
+    return _resultado(user, correcta)
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:47
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('usuarios', '0002_version_sesion'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='versionsesion',
+            name='usuario',
+            field=models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='version_sesion', serialize=False, to=settings.AUTH_USER_MODEL),
+        ),
+    ]
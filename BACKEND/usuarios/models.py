@@ -136,4 +136,25 @@ class Usuario(AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         if self.rol:
             return f"{self.username} ({self.rol.nombre})"
-        return f"{self.username} (Sin rol)"
\ No newline at end of file
+        return f"{self.username} (Sin rol)"
+
+class VersionSesion(models.Model):
+    """
+    Versión de las sesiones de un usuario. Los tokens llevan la versión
+    vigente al emitirse; al subirla (desactivación, cambio de rol o turno,
+    eliminación) los tokens anteriores dejan de ser aceptados. Ver
+    usuarios/sesiones.py.
+
+    La fila sobrevive al usuario (sin CASCADE ni FK en la base): si se
+    borrara con él, la versión volvería a 0 y sus tokens seguirían vigentes.
+    """
+    usuario = models.OneToOneField(
+        Usuario, on_delete=models.DO_NOTHING, db_constraint=False, primary_key=True, related_name='version_sesion',
+    )
+    version = models.PositiveIntegerField(default=0)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'VersionSesion'
+        verbose_name = 'Versión de Sesión'
+        verbose_name_plural = 'Versiones de Sesión'
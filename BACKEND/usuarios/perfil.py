@@ -0,0 +1,31 @@
+# usuarios/perfil.py
+"""
+Perfil del usuario autenticado (/api/auth/user/me/).
+
+La versión del perfil es (fecha_modificacion, nombre del rol): con ella se
+arma el ETag y la clave de la caché del perfil ya descifrado, así que la SPA
+revalida con 304 y el perfil se descifra una vez por cada versión.
+"""
+import hashlib
+
+from django.conf import settings
+
+from core.utils.decrypt_cache import DecryptCache
+from .roles import nombre_rol
+
+# Mismas garantías que la caché de descifrado: solo memoria del proceso, LRU + TTL.
+perfil_cache = DecryptCache(
+    max_entries=settings.PERFIL_CACHE_MAX_ENTRIES,
+    max_bytes=settings.DECRYPT_CACHE_MAX_BYTES,
+    ttl=settings.DECRYPT_CACHE_TTL,
+)
+
+
+def version_perfil(user):
+    """Sin consultas si 'user' viene de la base; una por PK si viene del token."""
+    return (user.fecha_modificacion.isoformat(), nombre_rol(user))
+
+
+def etag_perfil(user, version):
+    digest = hashlib.blake2b(repr((str(user.pk), version)).encode('utf-8'), digest_size=8).hexdigest()
+    return f'"perfil-{digest}"'
@@ -1,6 +1,7 @@
 # usuarios/permissions.py
 from rest_framework import permissions
 from . import models # <- Import local
+from .roles import nombre_rol
 
 # --- Roles Definidos ---
 ROL_ADMINISTRATIVO = 'Administrativo'
@@ -13,38 +14,42 @@ class DenyAll(permissions.BasePermission):
     def has_permission(self, request, view):
         return False
 
-class IsAdminSistema(permissions.BasePermission):
-    message = 'Solo el Administrador del Sistema (TI) puede realizar esta acción.'
+class RolPermission(permissions.BasePermission):
+    """
+    Permite el acceso si el rol del usuario está en 'roles'. El rol se
+    resuelve con la caché de usuarios.roles: ningún chequeo consulta la base.
+    """
+    roles = frozenset()
     def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and hasattr(request, 'user') and hasattr(request.user, 'rol') and request.user.rol.nombre == ROL_ADMIN_SISTEMA
+        return nombre_rol(getattr(request, 'user', None)) in self.roles
 
-class IsPersonalClinico(permissions.BasePermission):
+class IsAdminSistema(RolPermission):
+    message = 'Solo el Administrador del Sistema (TI) puede realizar esta acción.'
+    roles = frozenset({ROL_ADMIN_SISTEMA})
+
+class IsPersonalClinico(RolPermission):
     message = 'Solo el personal clínico (Matrona, Médico, Enfermera) puede acceder.'
-    def has_permission(self, request, view):
-        allowed_roles = [ROL_MATRONA, ROL_MEDICO, ROL_ENFERMERA]
-        return request.user and request.user.is_authenticated and hasattr(request, 'user') and hasattr(request.user, 'rol') and request.user.rol.nombre in allowed_roles
+    roles = frozenset({ROL_MATRONA, ROL_MEDICO, ROL_ENFERMERA})
 
-class IsMedico(permissions.BasePermission):
+class IsMedico(RolPermission):
     message = 'Solo Médicos pueden realizar esta acción.'
-    def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and hasattr(request, 'user') and hasattr(request.user, 'rol') and request.user.rol.nombre == ROL_MEDICO
+    roles = frozenset({ROL_MEDICO})
 
-class IsMatrona(permissions.BasePermission):
+class IsMatrona(RolPermission):
     message = 'Solo Matronas pueden realizar esta acción.'
-    def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and hasattr(request, 'user') and hasattr(request.user, 'rol') and request.user.rol.nombre == ROL_MATRONA
+    roles = frozenset({ROL_MATRONA})
 
-class IsEnfermera(permissions.BasePermission):
+class IsEnfermera(RolPermission):
     message = 'Solo Enfermeras pueden realizar esta acción.'
-    def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and hasattr(request, 'user') and hasattr(request.user, 'rol') and request.user.rol.nombre == ROL_ENFERMERA
+    roles = frozenset({ROL_ENFERMERA})
 
-class IsAdministrativo(permissions.BasePermission):
+class IsAdministrativo(RolPermission):
     message = 'Solo personal Administrativo puede realizar esta acción.'
-    def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and hasattr(request, 'user') and hasattr(request.user, 'rol') and request.user.rol.nombre == ROL_ADMINISTRATIVO
+    roles = frozenset({ROL_ADMINISTRATIVO})
 
 # --- Permisos Combinados ---
+# Precompilados como un solo conjunto de roles (en vez de IsA | IsB), así un
+# chequeo no instancia permisos anidados.
 
 class CanManageUsers(IsAdminSistema):
     message = 'Solo el Administrador del Sistema tiene permisos para gestionar usuarios.'
@@ -58,12 +63,13 @@ class CanWritePartoOrRN(IsMatrona):
 class CanManageEpicrisisOrDefuncion(IsMedico):
      message = 'Solo Médicos pueden gestionar epicrisis o registros de defunción.'
 
-class CanManageAdmision(permissions.BasePermission):
+class CanManageAdmision(RolPermission):
     message = 'Solo personal Administrativo o Matronas pueden gestionar admisiones.'
-    def has_permission(self, request, view):
-        is_admin = IsAdministrativo().has_permission(request, view)
-        is_matrona = IsMatrona().has_permission(request, view)
-        return is_admin or is_matrona
+    roles = frozenset({ROL_ADMINISTRATIVO, ROL_MATRONA})
+
+class IsMatronaOrMedico(RolPermission):
+    message = 'Solo Matronas o Médicos pueden realizar esta acción.'
+    roles = frozenset({ROL_MATRONA, ROL_MEDICO})
 
 class CanReadLogs(IsAdminSistema):
     message = 'Solo el Administrador del Sistema puede ver los logs de auditoría.'
@@ -72,7 +78,14 @@ class IsAuthenticatedReadOnly(permissions.BasePermission):
     def has_permission(self, request, view):
         return request.user and request.user.is_authenticated and request.method in permissions.SAFE_METHODS
 
-CanManageMadre = CanManageAdmision | (IsPersonalClinico & IsAuthenticatedReadOnly)
+class CanManageMadre(RolPermission):
+    """Equivale a CanManageAdmision | (IsPersonalClinico & IsAuthenticatedReadOnly)."""
+    message = CanManageAdmision.message
+    roles = CanManageAdmision.roles
+    roles_lectura = IsPersonalClinico.roles
+    def has_permission(self, request, view):
+        rol = nombre_rol(getattr(request, 'user', None))
+        return rol in self.roles or (request.method in permissions.SAFE_METHODS and rol in self.roles_lectura)
 
 class IsAssignedToTurnoOrAdmin(permissions.BasePermission):
     """
@@ -82,60 +95,34 @@ class IsAssignedToTurnoOrAdmin(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj):
         user = request.user
-        if not user or not user.is_authenticated or not hasattr(user, 'rol'):
+        rol = nombre_rol(user)
+        if rol is None:
             return False
 
         roles_sin_restriccion = [ROL_MEDICO, ROL_ADMIN_SISTEMA, ROL_ADMINISTRATIVO]
-        if user.rol.nombre in roles_sin_restriccion:
+        if rol in roles_sin_restriccion:
             return True
 
         roles_con_turno = [ROL_ENFERMERA, ROL_MATRONA]
-        if user.rol.nombre not in roles_con_turno:
+        if rol not in roles_con_turno:
             return False
 
         turno_usuario = user.turno
         if not turno_usuario or turno_usuario == models.Usuario.TURNO_NINGUNO:
             return False
 
-        # Lógica para encontrar el turno del objeto
-        # (Esta lógica es compleja y depende del modelo, 
-        #  es mejor implementarla en get_queryset de la vista)
-        # Aquí solo ponemos un placeholder.
-        
-        # Lógica real movida a las Vistas (get_queryset)
-        # Aquí solo validamos que tiene permiso si los roles coinciden
-        # (La lógica de get_queryset es la que filtra la lista)
-        # Para un objeto específico, la lógica es más compleja:
-        
-        usuario_registro_objeto = None
-        try:
-            # Importar modelos de otras apps
-            from pacientes.models import Madre
-            from partos.models import Parto, RecienNacido, Defuncion, DocumentoReferencia
-
-            if isinstance(obj, Madre):
-                 # REVISAR LÓGICA: ¿Cómo se asigna una madre a un turno?
-                 # Asumiremos que si un parto existe, usamos ese turno.
-                 parto_asociado = obj.partos.first()
-                 if parto_asociado:
-                     usuario_registro_objeto = parto_asociado.usuario_registro
-                 else:
-                     # Si no hay parto, ¿quizás un campo en la madre?
-                     # Por ahora, permitimos ver madres sin parto
-                     return True 
-            elif isinstance(obj, Parto):
-                usuario_registro_objeto = obj.usuario_registro
-            elif isinstance(obj, RecienNacido):
-                usuario_registro_objeto = obj.usuario_registro
-            elif isinstance(obj, Defuncion):
-                 usuario_registro_objeto = obj.usuario_registro
-            elif isinstance(obj, DocumentoReferencia):
-                 usuario_registro_objeto = obj.usuario_generacion
-            
-            if usuario_registro_objeto and hasattr(usuario_registro_objeto, 'turno'):
-                turno_objeto = usuario_registro_objeto.turno
-                return turno_usuario == turno_objeto or turno_objeto == models.Usuario.TURNO_NINGUNO
-            else:
-                return False # No se pudo determinar el turno del objeto
-        except AttributeError:
-            return False
\ No newline at end of file
+        # El turno de cada registro clínico se guarda al escribirlo (partos.models),
+        # así que decidir no requiere cargar usuario_registro ni el parto.
+        from pacientes.models import Madre
+
+        if isinstance(obj, Madre):
+            # Una madre toma el turno de su primer parto; sin parto, es visible.
+            turno_objeto = obj.partos.values_list('turno', flat=True).first()
+            if turno_objeto is None:
+                return True
+        else:
+            turno_objeto = getattr(obj, 'turno', None)
+            if not turno_objeto:
+                return False  # No se pudo determinar el turno del objeto
+
+        return turno_usuario == turno_objeto or turno_objeto == models.Usuario.TURNO_NINGUNO
\ No newline at end of file
@@ -0,0 +1,57 @@
+# usuarios/roles.py
+"""
+Caché en proceso de los roles (id -> nombre). Los roles son pocos y casi
+nunca cambian: se cargan todos en una consulta y los permisos resuelven el
+rol del usuario con su rol_id, sin tocar la base de datos.
+
+usuarios/signals.py la vacía al escribir un Rol en este proceso; los demás
+procesos la recargan al vencer ROL_CACHE_TTL.
+"""
+import threading
+import time
+
+from django.conf import settings
+
+
+class RolCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._roles = None
+        self._cargados_en = 0.0
+
+    def _cargar(self):
+        from .models import Rol
+        with self._lock:
+            self._roles = dict(Rol.objects.values_list('id', 'nombre'))
+            self._cargados_en = time.monotonic()
+        return self._roles
+
+    def nombre(self, rol_id):
+        if rol_id is None:
+            return None
+        roles = self._roles
+        if roles is None or time.monotonic() - self._cargados_en > settings.ROL_CACHE_TTL:
+            roles = self._cargar()
+        nombre = roles.get(rol_id)
+        if nombre is None:
+            # Rol creado en otro proceso después de la última carga.
+            nombre = self._cargar().get(rol_id)
+        return nombre
+
+    def clear(self):
+        with self._lock:
+            self._roles = None
+
+
+rol_cache = RolCache()
+
+
+def nombre_rol(user):
+    """Nombre del rol del usuario autenticado (None si no hay usuario o rol), sin consultas."""
+    if not user or not user.is_authenticated:
+        return None
+    # Usuario construido desde los claims del token (usuarios.authentication).
+    rol = getattr(user, 'rol_nombre', None)
+    if rol is not None:
+        return rol
+    return rol_cache.nombre(getattr(user, 'rol_id', None))
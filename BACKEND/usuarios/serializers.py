@@ -1,8 +1,15 @@
 # back/usuarios/serializers.py
 from rest_framework import serializers
 from .models import Usuario, Rol
-# Importamos la utilidad de descifrado para usarla de forma segura
-from core.utils.security_utils import decrypt_data
+# Campos cifrados: se descifran por lote al listar usuarios
+from core.serializers import EncryptedField, BatchDecryptListSerializer
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer as BaseTokenObtainPairSerializer,
+    TokenRefreshSerializer as BaseTokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from .authentication import claims_usuario
 
 class RolSerializer(serializers.ModelSerializer):
     """
@@ -23,15 +30,11 @@ class UserSerializer(serializers.ModelSerializer):
     # Esta es la corrección de un error anterior (sigue siendo correcta)
     rol_nombre = serializers.CharField(source='rol.nombre', read_only=True)
     
-    # --- INICIO DE LA CORRECCIÓN PARA EL ERROR 500 ---
-    # Usamos SerializerMethodField para manejar de forma segura los
-    # valores que pueden ser nulos (None) ANTES de descifrarlos.
-    
-    nombre_completo = serializers.SerializerMethodField()
-    email = serializers.SerializerMethodField()
-    rut = serializers.SerializerMethodField()
-    
-    # --- FIN DE LA CORRECCIÓN ---
+    # EncryptedField devuelve None si el valor cifrado es nulo (evita el error 500)
+    # y, al listar, descifra todos los usuarios de la página en un solo lote.
+    nombre_completo = EncryptedField()
+    email = EncryptedField()
+    rut = EncryptedField()
 
 
     # --- CAMPOS DE ESCRITURA (Para recibir desde el Frontend) ---
@@ -71,6 +74,7 @@ class UserSerializer(serializers.ModelSerializer):
             # Campos de escritura
             'password', 'rut_plain', 'nombre_plain', 'email_plain'
         ]
+        list_serializer_class = BatchDecryptListSerializer
         
         extra_kwargs = {
             'rut_plain': {'required': False},
@@ -78,33 +82,6 @@ class UserSerializer(serializers.ModelSerializer):
             'email_plain': {'required': False},
         }
 
-    # --- MÉTODOS PARA LOS SerializerMethodField ---
-
-    def get_nombre_completo(self, obj):
-        # obj es la instancia del Usuario
-        if obj.nombre_completo:
-            try:
-                return decrypt_data(obj.nombre_completo)
-            except Exception:
-                return "Error al descifrar nombre"
-        return None
-
-    def get_email(self, obj):
-        if obj.email:
-            try:
-                return decrypt_data(obj.email)
-            except Exception:
-                return "Error al descifrar email"
-        return None
-
-    def get_rut(self, obj):
-        if obj.rut:
-            try:
-                return decrypt_data(obj.rut)
-            except Exception:
-                return "Error al descifrar RUT"
-        return None
-
     # --- MÉTODOS CREATE Y UPDATE (Sin cambios) ---
 
     def create(self, validated_data):
@@ -149,4 +126,53 @@ class UserSerializer(serializers.ModelSerializer):
             instance.set_password(password)
         
         instance.save()
-        return instance
\ No newline at end of file
+        return instance
+
+class TokenObtainPairSerializer(BaseTokenObtainPairSerializer):
+    """
+    Agrega a los tokens los claims de usuarios.authentication.claims_usuario,
+    con los que se autentica cada petición sin consultar la base.
+    """
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        for claim, valor in claims_usuario(user).items():
+            token[claim] = valor
+        return token
+
+
+class TokenRefreshSerializer(BaseTokenRefreshSerializer):
+    """
+    Mismo flujo que el refresh de simplejwt, con una sola carga del Usuario:
+    con ella se verifica que siga activo y se toman los claims vigentes
+    (rol, turno, versión) para los tokens nuevos. Un usuario eliminado
+    recibe 401 como uno inactivo.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        if user_id:
+            user = Usuario.objects.select_related('rol').filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+            if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+                raise AuthenticationFailed(self.error_messages['no_active_account'], 'no_active_account')
+            for claim, valor in claims_usuario(user).items():
+                refresh[claim] = valor
+
+        data = {'access': str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                try:
+                    refresh.blacklist()
+                except AttributeError:
+                    # Sin la app token_blacklist no existe blacklist().
+                    pass
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+            data['refresh'] = str(refresh)
+
+        return data
@@ -0,0 +1,71 @@
+# usuarios/sesiones.py
+"""
+Revocación de tokens JWT por versión de sesión.
+
+Los tokens de acceso se validan sin consultar Usuario (ver
+usuarios.authentication), así que desactivar a un usuario, cambiarle el rol
+o el turno o eliminarlo no bastaría para cortar sus tokens vigentes. Cada token lleva la
+versión de sesión del usuario al emitirse ('ver'); revocar() la sube y los
+tokens con una versión menor se rechazan.
+
+La tabla VersionSesion es pequeña (una fila por usuario alguna vez revocado)
+y se mantiene completa en memoria para validar tokens: se recarga al vencer
+SESION_VERSION_TTL, o en este proceso apenas se confirma una revocación. Al
+emitir tokens (login, refresh) la versión se lee de la base con vigente():
+la caché de otro proceso puede no ver aún una revocación reciente, y un token
+emitido con la versión anterior quedaría revocado al recargarla.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+
+class VersionesSesion:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versiones = None
+        self._cargadas_en = 0.0
+
+    def _cargar(self):
+        from .models import VersionSesion
+        with self._lock:
+            self._versiones = {
+                str(usuario_id): version
+                for usuario_id, version in VersionSesion.objects.values_list('usuario_id', 'version')
+            }
+            self._cargadas_en = time.monotonic()
+        return self._versiones
+
+    def version(self, usuario_id):
+        versiones = self._versiones
+        if versiones is None or time.monotonic() - self._cargadas_en > settings.SESION_VERSION_TTL:
+            versiones = self._cargar()
+        return versiones.get(str(usuario_id), 0)
+
+    def vigente(self, usuario_id):
+        """Versión actual según la base, sin pasar por la caché."""
+        from .models import VersionSesion
+        return VersionSesion.objects.filter(usuario_id=usuario_id).values_list('version', flat=True).first() or 0
+
+    def revocar(self, usuario_id):
+        """Invalida todos los tokens emitidos hasta ahora para el usuario."""
+        from .models import VersionSesion
+        filtro = VersionSesion.objects.filter(usuario_id=usuario_id)
+        if not filtro.update(version=F('version') + 1):
+            try:
+                with transaction.atomic():
+                    VersionSesion.objects.create(usuario_id=usuario_id, version=1)
+            except IntegrityError:
+                # Otra transacción creó la fila entre el UPDATE y el INSERT.
+                filtro.update(version=F('version') + 1)
+        transaction.on_commit(self.clear)
+
+    def clear(self):
+        with self._lock:
+            self._versiones = None
+
+
+versiones_sesion = VersionesSesion()
@@ -0,0 +1,43 @@
+# usuarios/signals.py
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .models import Rol, Usuario
+from .roles import rol_cache
+from .sesiones import versiones_sesion
+
+# Campos que viajan en el token: si cambian, los tokens vigentes se revocan.
+CAMPOS_SESION = ('rol_id', 'turno', 'is_active')
+_CAMPOS_SESION_UPDATE = {'rol', 'rol_id', 'turno', 'is_active'}
+
+
+@receiver(post_save, sender=Rol)
+@receiver(post_delete, sender=Rol)
+def rol_modificado(sender, **kwargs):
+    rol_cache.clear()
+
+
+@receiver(pre_save, sender=Usuario)
+def usuario_por_guardar(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._revocar_sesiones = False
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not _CAMPOS_SESION_UPDATE.intersection(update_fields):
+        return
+    anterior = Usuario.objects.filter(pk=instance.pk).values_list(*CAMPOS_SESION).first()
+    if anterior is not None:
+        instance._revocar_sesiones = anterior != tuple(getattr(instance, campo) for campo in CAMPOS_SESION)
+
+
+@receiver(post_save, sender=Usuario)
+def usuario_guardado(sender, instance, **kwargs):
+    if getattr(instance, '_revocar_sesiones', False):
+        instance._revocar_sesiones = False
+        versiones_sesion.revocar(instance.pk)
+
+
+@receiver(pre_delete, sender=Usuario)
+def usuario_por_eliminar(sender, instance, **kwargs):
+    # Los tokens se validan sin consultar Usuario: sin revocar, un usuario
+    # eliminado seguiría autenticado hasta que venza su token de acceso.
+    versiones_sesion.revocar(instance.pk)
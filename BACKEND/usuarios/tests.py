@@ -1,3 +1,111 @@
+from django.contrib.auth.models import Permission
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
 
-# Create your tests here.
+from auditoria.models import LogAuditoria
+from core.pruebas import PresupuestoConsultasMixin, crear_usuarios
+from . import urls
+from .models import Usuario, VersionSesion
+from .serializers import TokenObtainPairSerializer
+from .sesiones import versiones_sesion
+
+
+class PresupuestoConsultasTests(PresupuestoConsultasMixin, TestCase):
+    router = urls.router
+    presupuestos = {
+        # ruta: (máx. consultas, máx. descifrados por fila)
+        'rol-list': (1, 0),
+        'rol-detail': (1, 0),
+        'usuario-list': (1, 3),
+        'usuario-detail': (1, 3),
+    }
+
+
+class RevocacionSesionTests(TestCase):
+    def setUp(self):
+        self.usuarios = crear_usuarios()
+        self.usuario = self.usuarios['matrona']
+        versiones_sesion.clear()
+
+    @staticmethod
+    def cliente(token):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        return client
+
+    def test_eliminar_usuario_revoca_sus_tokens(self):
+        client = self.cliente(TokenObtainPairSerializer.get_token(self.usuario).access_token)
+        self.assertEqual(client.get(reverse('current_user')).status_code, 200)
+
+        usuario_id = self.usuario.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            self.usuario.delete()
+
+        self.assertEqual(client.get(reverse('current_user')).status_code, 401)
+        self.assertEqual(VersionSesion.objects.get(usuario_id=usuario_id).version, 1)
+
+    def test_auditoria_de_gestion_de_usuarios_es_sincrona(self):
+        # En TestCase on_commit no se ejecuta: una entrada encolada no llegaría a la base.
+        admin = self.usuarios['admin_ti']
+        response = self.cliente(TokenObtainPairSerializer.get_token(admin).access_token).delete(
+            reverse('usuario-detail', kwargs={'pk': self.usuario.pk})
+        )
+        self.assertEqual(response.status_code, 204)
+        self.assertTrue(LogAuditoria.objects.filter(accion='DESACTIVAR_USUARIO', registro_id_uuid=self.usuario.pk).exists())
+
+    def test_perfil_de_usuario_eliminado_en_otro_proceso(self):
+        # La caché de versiones de este proceso aún no ve la revocación: el
+        # token pasa y la vista debe responder 404, no fallar al leer el perfil.
+        client = self.cliente(TokenObtainPairSerializer.get_token(self.usuario).access_token)
+        self.assertEqual(client.get(reverse('current_user')).status_code, 200)
+        self.usuario.delete()
+        self.assertEqual(client.get(reverse('current_user')).status_code, 404)
+
+    def test_cambio_de_turno_revoca_y_el_refresh_emite_claims_vigentes(self):
+        refresh = TokenObtainPairSerializer.get_token(self.usuario)
+        client = self.cliente(refresh.access_token)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.usuario.turno = Usuario.TURNO_TARDE
+            self.usuario.save()
+        self.assertEqual(client.get(reverse('current_user')).status_code, 401)
+
+        response = APIClient().post(reverse('token_refresh'), {'refresh': str(refresh)}, format='json')
+        self.assertEqual(response.status_code, 200)
+        nuevo = AccessToken(response.data['access'])
+        self.assertEqual((nuevo['turno'], nuevo['ver']), (Usuario.TURNO_TARDE, 1))
+        self.assertEqual(self.cliente(nuevo).get(reverse('current_user')).status_code, 200)
+
+    def test_refresh_de_usuario_eliminado(self):
+        refresh = TokenObtainPairSerializer.get_token(self.usuario)
+        self.usuario.delete()
+        response = APIClient().post(reverse('token_refresh'), {'refresh': str(refresh)}, format='json')
+        self.assertEqual(response.status_code, 401)
+
+    def test_token_emitido_con_cache_desactualizada(self):
+        # Revocación hecha por otro proceso: la caché de este aún no la ve.
+        versiones_sesion.version(self.usuario.pk)
+        VersionSesion.objects.create(usuario=self.usuario, version=1)
+
+        token = TokenObtainPairSerializer.get_token(self.usuario).access_token
+        self.assertEqual(token['ver'], 1)
+        versiones_sesion.clear()
+        self.assertEqual(self.cliente(token).get(reverse('current_user')).status_code, 200)
+
+
+class LoginTests(TestCase):
+    def test_cuerpo_json_que_no_es_objeto(self):
+        for cuerpo in ('[]', '"x"', '1'):
+            response = self.client.post(reverse('token_obtain_pair'), data=cuerpo, content_type='application/json')
+            self.assertEqual(response.status_code, 400, cuerpo)
+
+    def test_permisos_de_modelo_del_admin(self):
+        usuario = crear_usuarios()['administrativo']
+        usuario.is_staff = True
+        usuario.save()
+        usuario.user_permissions.add(Permission.objects.get(codename='view_rol'))
+        usuario = Usuario.objects.get(pk=usuario.pk)
+        self.assertTrue(usuario.has_perm('usuarios.view_rol'))
+        self.assertFalse(usuario.has_perm('usuarios.change_rol'))
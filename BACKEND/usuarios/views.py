@@ -1,11 +1,24 @@
 # usuarios/views.py
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import update_last_login
+from django.http import JsonResponse, QueryDict
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework import viewsets, permissions, status
+from rest_framework_simplejwt.serializers import TokenObtainSerializer
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from . import models # <--- LÍNEA FALTANTE
 from . import serializers # <--- LÍNEA FALTANTE
 from . import permissions as custom_permissions
 from auditoria.utils import log_audit 
+from core.utils.http import etag_coincide
+from .login import autenticar_async
+from .perfil import etag_perfil, perfil_cache, version_perfil
 
 class RolViewSet(viewsets.ModelViewSet):
     queryset = models.Rol.objects.all().order_by('nombre')
@@ -23,7 +36,8 @@ class UsuarioViewSet(viewsets.ModelViewSet):
             self.request.user, self.request,
             "CREAR_USUARIO",
             instance,
-            f"Usuario '{instance.username}' ({instance.rol.nombre}) creado."
+            f"Usuario '{instance.username}' ({instance.rol.nombre}) creado.",
+            durable=True,
         )
 
     def perform_update(self, serializer):
@@ -32,43 +46,103 @@ class UsuarioViewSet(viewsets.ModelViewSet):
             self.request.user, self.request,
             "MODIFICAR_USUARIO",
             instance,
-            f"Usuario '{instance.username}' actualizado."
+            f"Usuario '{instance.username}' actualizado.",
+            durable=True,
         )
 
     def perform_destroy(self, instance):
         # --- INICIO DE CORRECCIÓN ---
         if instance.is_active:
             instance.is_active = False # Cambiado 'activo' a 'is_active'
+            # usuarios.signals sube su versión de sesión: sus tokens vigentes
+            # se rechazan en todos los procesos dentro de SESION_VERSION_TTL.
             instance.save()
             log_audit(
         # --- FIN DE CORRECCIÓN ---
                 self.request.user, self.request,
                 "DESACTIVAR_USUARIO",
                 instance,
-                f"Usuario '{instance.username}' desactivado."
+                f"Usuario '{instance.username}' desactivado.",
+                durable=True,
             )
 
 class CurrentUserView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
+        """
+        Perfil del usuario autenticado, servido desde request.user. Con
+        If-None-Match del ETag vigente responde 304; si no, usa el perfil ya
+        descifrado de esta versión o lo serializa una vez (con el Rol unido).
+        """
+        user = request.user
         try:
-            # Solución 1: Buscamos el 'Usuario' personalizado (de models.py) 
-            # usando el 'username' del 'User' de Django (request.user).
-            usuario_custom = models.Usuario.objects.get(username=request.user.username)
-            
-            # Solución 2: Usamos 'UserSerializer' (como se define en serializers.py)
-            serializer = serializers.UserSerializer(usuario_custom, context={'request': request})
-            return Response(serializer.data)
-        
+            # Desde el token, fecha_modificacion se lee de la base: el usuario puede ya no existir.
+            version = version_perfil(user)
         except models.Usuario.DoesNotExist:
-            return Response(
-                {"detail": "El usuario autenticado no existe en el sistema."},
-                status=status.HTTP_404_NOT_FOUND
+            return self.usuario_inexistente()
+        etag = etag_perfil(user, version)
+        if etag_coincide(request.headers.get('If-None-Match'), etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            data = perfil_cache.get((user.pk, version))
+            if data is None:
+                if user.get_deferred_fields():
+                    # Usuario construido desde el token: faltan los campos cifrados.
+                    try:
+                        user = models.Usuario.objects.select_related('rol').get(pk=user.pk)
+                    except models.Usuario.DoesNotExist:
+                        return self.usuario_inexistente()
+                    version = version_perfil(user)
+                    etag = etag_perfil(user, version)
+                data = dict(serializers.UserSerializer(user, context={'request': request}).data)
+                perfil_cache.set((user.pk, version), data)
+            response = Response(data)
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        response['Vary'] = 'Authorization'
+        return response
+
+    @staticmethod
+    def usuario_inexistente():
+        return Response(
+            {"detail": "El usuario autenticado no existe en el sistema."},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+
+def _emitir_tokens(user):
+    refresh = serializers.TokenObtainPairSerializer.get_token(user)
+    if api_settings.UPDATE_LAST_LOGIN:
+        update_last_login(None, user)
+    return {'refresh': str(refresh), 'access': str(refresh.access_token)}
+
+@method_decorator(csrf_exempt, name='dispatch')
+class TokenObtainView(View):
+    """
+    POST /api/auth/token/ {username, password} -> {refresh, access}.
+
+    Misma respuesta que TokenObtainPairView de simplejwt, pero asíncrona: la
+    verificación Argon2 corre en el pool de usuarios.login y el worker queda
+    libre mientras tanto (bajo ASGI).
+    """
+    http_method_names = ['post', 'options']
+
+    async def post(self, request):
+        try:
+            datos = json.loads(request.body or b'{}') if request.content_type == 'application/json' else request.POST
+        except ValueError:
+            return JsonResponse({'detail': 'JSON inválido.'}, status=400)
+        if not isinstance(datos, (dict, QueryDict)):
+            return JsonResponse({'detail': 'Se esperaba un objeto con username y password.'}, status=400)
+        faltantes = {campo: ['Este campo es requerido.'] for campo in ('username', 'password') if not datos.get(campo)}
+        if faltantes:
+            return JsonResponse(faltantes, status=400)
+
+        user = await autenticar_async(datos['username'], datos['password'])
+        if user is None:
+            return JsonResponse(
+                {'detail': str(TokenObtainSerializer.default_error_messages['no_active_account']), 'code': 'no_active_account'},
+                status=401,
             )
-        except Exception as e:
-            # Captura de error genérica
-            return Response(
-                {"detail": f"Error interno al obtener datos del usuario: {e}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+        return JsonResponse(await sync_to_async(_emitir_tokens)(user))
@@ -0,0 +1,147 @@
+// src/components/ReporteREM.js
+import React, { useState } from 'react';
+
+// El reporte llega ya agregado desde /api/partos/reportes/rem/ (solo conteos):
+// ningún dato individual de madres o partos pasa por el navegador.
+
+function filasCSV(reporte) {
+  const { partos, recien_nacidos: rn, defunciones } = reporte;
+  const secciones = [
+    ['Partos por tipo', partos.por_tipo_parto],
+    ['Partos por anestesia', partos.por_anestesia],
+    ['Partos por edad gestacional', partos.por_edad_gestacional],
+    ['RN por sexo', rn.por_sexo],
+    ['RN por peso (g)', rn.por_peso],
+    ['RN APGAR 1 min', rn.apgar_1_min],
+    ['RN APGAR 5 min', rn.apgar_5_min],
+  ];
+  return [
+    ['Sección', 'Categoría', 'Total'],
+    ['Partos', 'Total', partos.total],
+    ['Recién nacidos', 'Total', rn.total],
+    ['Recién nacidos', 'Vivos', rn.vivos],
+    ['Recién nacidos', 'Nacidos muertos', rn.nacidos_muertos],
+    ['Defunciones', 'Total', defunciones.total],
+    ['Defunciones', 'Recién nacidos', defunciones.recien_nacidos],
+    ['Defunciones', 'Maternas', defunciones.maternas],
+    ...secciones.flatMap(([seccion, conteos]) =>
+      Object.entries(conteos).map(([categoria, total]) => [seccion, categoria, total])
+    ),
+    ...defunciones.por_causa.map(c => ['Defunciones por causa', `${c.codigo} ${c.descripcion}`, c.total]),
+  ];
+}
+
+function exportarCSV(reporte, filename = 'reporte-rem.csv') {
+  const csvContent = filasCSV(reporte)
+    .map(fila => fila.map(valor => `"${String(valor).replace(/"/g, '""')}"`).join(","))
+    .join("\n");
+  const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
+  const link = document.createElement("a");
+  link.href = URL.createObjectURL(blob);
+  link.setAttribute("download", filename);
+  document.body.appendChild(link);
+  link.click();
+  document.body.removeChild(link);
+}
+
+const TablaConteos = ({ titulo, conteos }) => (
+  <div className="mb-4">
+    <h4 className="font-semibold mb-2">{titulo}</h4>
+    <table className="tabla">
+      <thead>
+        <tr>
+          <th>Categoría</th>
+          <th>Total</th>
+        </tr>
+      </thead>
+      <tbody>
+        {Object.entries(conteos).map(([categoria, total]) => (
+          <tr key={categoria}>
+            <td>{categoria}</td>
+            <td>{total}</td>
+          </tr>
+        ))}
+      </tbody>
+    </table>
+  </div>
+);
+
+const ReporteREM = ({ reporte, isLoading = false, error = null, onGenerar }) => {
+  const [rango, setRango] = useState({ inicio: '', fin: '' });
+
+  return (
+    <div className="tarjeta p-6 contenedor mt-4">
+      <h2 className="texto-2xl font-bold mb-4">Generar Reporte REM Neonatal</h2>
+      <div className="flex gap-4 mb-4 items-center">
+        <label className="etiqueta">
+          Fecha Inicio:
+          <input
+            className="input ml-2"
+            type="date"
+            value={rango.inicio}
+            onChange={e => setRango({ ...rango, inicio: e.target.value })}
+          />
+        </label>
+        <label className="etiqueta">
+          Fecha Fin:
+          <input
+            className="input ml-2"
+            type="date"
+            value={rango.fin}
+            onChange={e => setRango({ ...rango, fin: e.target.value })}
+          />
+        </label>
+        <button
+          className="boton boton-primario"
+          onClick={() => onGenerar(rango.inicio, rango.fin)}
+          disabled={isLoading}
+        >
+          Generar
+        </button>
+      </div>
+
+      {error && <p className="texto-sm mb-4" style={{ color: '#991b1b' }}>{error}</p>}
+      {isLoading && <div className="texto-centro">Generando reporte...</div>}
+
+      {!isLoading && reporte && (
+        <div>
+          <h3 className="texto-xl font-semibold mb-2">
+            {/* 'hasta' es el límite exclusivo que aplicó el servidor */}
+            Resultados (desde {String(reporte.desde).slice(0, 10)}, hasta antes de {String(reporte.hasta).slice(0, 10)})
+          </h3>
+          <div className="sombra redondeado overflow-auto mb-4 p-4">
+            <h3 className="texto-xl font-semibold mb-2">Partos: {reporte.partos.total}</h3>
+            <TablaConteos titulo="Por tipo de parto" conteos={reporte.partos.por_tipo_parto} />
+            <TablaConteos titulo="Por anestesia" conteos={reporte.partos.por_anestesia} />
+            <TablaConteos titulo="Por edad gestacional (semanas)" conteos={reporte.partos.por_edad_gestacional} />
+
+            <h3 className="texto-xl font-semibold mb-2">
+              Recién nacidos: {reporte.recien_nacidos.total} (vivos {reporte.recien_nacidos.vivos},
+              nacidos muertos {reporte.recien_nacidos.nacidos_muertos})
+            </h3>
+            <TablaConteos titulo="Por sexo" conteos={reporte.recien_nacidos.por_sexo} />
+            <TablaConteos titulo="Por peso (g)" conteos={reporte.recien_nacidos.por_peso} />
+            <TablaConteos titulo="APGAR 1 min" conteos={reporte.recien_nacidos.apgar_1_min} />
+            <TablaConteos titulo="APGAR 5 min" conteos={reporte.recien_nacidos.apgar_5_min} />
+
+            <h3 className="texto-xl font-semibold mb-2">
+              Defunciones: {reporte.defunciones.total} (recién nacidos {reporte.defunciones.recien_nacidos},
+              maternas {reporte.defunciones.maternas})
+            </h3>
+            <TablaConteos
+              titulo="Por causa (CIE-10)"
+              conteos={Object.fromEntries(
+                reporte.defunciones.por_causa.map(c => [`${c.codigo} ${c.descripcion}`, c.total])
+              )}
+            />
+          </div>
+          <button className="boton boton-secundario" onClick={() => exportarCSV(reporte)}>
+            Exportar a Excel (CSV)
+          </button>
+        </div>
+      )}
+    </div>
+  );
+};
+
+export default ReporteREM;
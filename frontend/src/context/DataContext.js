@@ -1,5 +1,5 @@
 // src/context/DataContext.js
-import React, { createContext, useReducer, useCallback } from 'react';
+import React, { createContext, useReducer, useCallback, useRef } from 'react';
 import * as api from '../services/api';
 
 const DataContext = createContext(null);
@@ -32,6 +32,22 @@ const reducer = (state, action) => {
           error: null 
         },
       };
+    case 'SYNC_SUCCESS': {
+      // Delta de ?updated_since=: reemplaza/agrega 'cambios' y quita 'eliminados'.
+      const { cambios, eliminados } = payload;
+      // Se arma en orden cronológico (el estado guarda los más recientes primero).
+      const porId = new Map([...state[resource].data].reverse().map((item) => [item.id, item]));
+      cambios.forEach((item) => {
+        porId.delete(item.id);
+        porId.set(item.id, item);
+      });
+      eliminados.forEach((id) => porId.delete(id));
+      const data = Array.from(porId.values()).reverse();
+      return {
+        ...state,
+        [resource]: { data, total: data.length, isLoading: false, error: null },
+      };
+    }
     case 'FETCH_ERROR':
       return {
         ...state,
@@ -63,16 +79,41 @@ export const DataProvider = ({ children }) => {
   const [state, dispatch] = useReducer(reducer, initialState);
 
   // --- Funciones Genéricas ---
+  // Marca de sincronización por recurso; vive en un ref para que las funciones sync* sean estables.
+  const marcas = useRef({});
+
   const fetchData = useCallback(async (resource, apiFunc, params) => {
     dispatch({ type: 'FETCH_START', resource });
     try {
       const data = await apiFunc(params);
+      delete marcas.current[resource]; // La lista se reemplazó: la próxima sincronización parte de cero
       dispatch({ type: 'FETCH_SUCCESS', resource, payload: data });
     } catch (error) {
       dispatch({ type: 'FETCH_ERROR', resource, payload: error.message });
     }
   }, []);
 
+  // Sincronización incremental: solo pide lo cambiado desde la última marca del servidor.
+  const syncData = useCallback(async (resource, apiFunc) => {
+    dispatch({ type: 'FETCH_START', resource });
+    try {
+      let marca = marcas.current[resource] || '1970-01-01';
+      const cambios = [];
+      const eliminados = [];
+      let respuesta;
+      do {
+        respuesta = await apiFunc({ updated_since: marca });
+        cambios.push(...respuesta.cambios);
+        eliminados.push(...respuesta.eliminados);
+        marca = respuesta.marca;
+      } while (respuesta.hay_mas);
+      marcas.current[resource] = marca;
+      dispatch({ type: 'SYNC_SUCCESS', resource, payload: { cambios, eliminados } });
+    } catch (error) {
+      dispatch({ type: 'FETCH_ERROR', resource, payload: error.message });
+    }
+  }, []);
+
   const executeAction = useCallback(async (resource, apiFunc, ...args) => {
     dispatch({ type: 'ACTION_START', resource });
     try {
@@ -89,6 +130,10 @@ export const DataProvider = ({ children }) => {
   const fetchMadres = useCallback((params) => 
     fetchData('madres', api.apiGetMadres, params), 
   [fetchData]);
+
+  const syncMadres = useCallback(() => 
+    syncData('madres', api.apiGetMadres), 
+  [syncData]);
   
   const addMadre = useCallback((data) => 
     executeAction('madres', api.apiCreateMadre, data), 
@@ -101,6 +146,10 @@ export const DataProvider = ({ children }) => {
   const fetchPartos = useCallback((params) => 
     fetchData('partos', api.apiGetPartos, params), 
   [fetchData]);
+
+  const syncPartos = useCallback(() => 
+    syncData('partos', api.apiGetPartos), 
+  [syncData]);
   
   const addParto = useCallback((data) => 
     executeAction('partos', api.apiCreateParto, data), 
@@ -143,9 +192,11 @@ export const DataProvider = ({ children }) => {
   const value = React.useMemo(() => ({
     state,
     fetchMadres,
+    syncMadres,
     addMadre,
     updateMadre,
     fetchPartos,
+    syncPartos,
     addParto,
     updateParto,
     anexarCorreccion,
@@ -156,7 +207,7 @@ export const DataProvider = ({ children }) => {
     fetchDiagnosticos,
     fetchRoles,
   }), [
-    state, fetchMadres, addMadre, updateMadre, fetchPartos, addParto,
+    state, fetchMadres, syncMadres, addMadre, updateMadre, fetchPartos, syncPartos, addParto,
     updateParto, anexarCorreccion, fetchUsuarios, updateUsuario,
     deleteUsuario, fetchLogs, fetchDiagnosticos, fetchRoles
   ]);
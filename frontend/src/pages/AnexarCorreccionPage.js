@@ -2,36 +2,29 @@
 import React, { useEffect, useState } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { useData } from '../hooks/useData';
-import { apiGetPartoById } from '../services/api';
+import { apiGetMadreById, apiGetPartoById } from '../services/api';
 import AnexarCorreccion from '../components/AnexarCorreccion'; // Tu componente
 
 const AnexarCorreccionPage = () => {
   const { partoId } = useParams();
   const navigate = useNavigate();
-  const { state: dataState, fetchMadres, anexarCorreccion } = useData();
+  const { anexarCorreccion } = useData();
   
   const [parto, setParto] = useState(null);
   const [madre, setMadre] = useState(null);
   const [isLoading, setIsLoading] = useState(true);
 
   useEffect(() => {
+    // Parto y madre por ID: la lista de madres del estado global es solo una página.
     apiGetPartoById(partoId)
       .then(partoData => {
         setParto(partoData);
-        if (dataState.madres.data.length === 0) {
-          fetchMadres();
-        }
+        return apiGetMadreById(partoData.madre);
       })
+      .then(setMadre)
       .catch(err => console.error(err))
       .finally(() => setIsLoading(false));
-  }, [partoId, dataState.madres.data.length, fetchMadres]);
-
-  useEffect(() => {
-    if (parto && dataState.madres.data.length > 0) {
-      const madreEncontrada = dataState.madres.data.find(m => m.id === parto.madre);
-      setMadre(madreEncontrada);
-    }
-  }, [parto, dataState.madres.data]);
+  }, [partoId]);
 
   const handleGuardar = async (datosCorreccion) => {
     try {
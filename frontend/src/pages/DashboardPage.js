@@ -9,17 +9,17 @@ import { VENTANA_EDICION_PARTO } from '../services/constants';
 import { generarBrazaletePDF } from '../utils/generarPDF'; 
 
 const DashboardPage = () => {
-  const { state: dataState, fetchMadres, fetchPartos } = useData();
+  const { state: dataState, syncMadres, syncPartos } = useData();
   const { usuario, permisos, checkPermiso } = useAuthRBAC();
   const navigate = useNavigate();
 
   const [busqueda, setBusqueda] = useState('');
 
-  // Cargar datos al montar
+  // Cargar datos al montar (incremental: al volver al dashboard solo llegan los cambios)
   useEffect(() => {
-    fetchMadres();
-    fetchPartos();
-  }, [fetchMadres, fetchPartos]);
+    syncMadres();
+    syncPartos();
+  }, [syncMadres, syncPartos]);
 
   const { data: madres, isLoading: loadingMadres } = dataState.madres;
   const { data: partos, isLoading: loadingPartos } = dataState.partos;
@@ -2,39 +2,30 @@
 import React, { useEffect, useState } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { useData } from '../hooks/useData';
-import { apiGetPartoById } from '../services/api'; // Usamos la API directo para 1 solo item
+import { apiGetMadreById, apiGetPartoById } from '../services/api'; // Usamos la API directo para 1 solo item
 import EditarParto from '../components/EditarParto'; // Tu componente
 
 const EditarPartoPage = () => {
   const { partoId } = useParams();
   const navigate = useNavigate();
-  const { state: dataState, fetchMadres, updateParto } = useData();
+  const { updateParto } = useData();
   
   const [parto, setParto] = useState(null);
   const [madre, setMadre] = useState(null);
   const [isLoading, setIsLoading] = useState(true);
 
   useEffect(() => {
-    // Cargar el parto específico
+    // Cargar el parto específico y su madre por ID (la lista de madres del
+    // estado global es solo una página y puede no incluirla)
     apiGetPartoById(partoId)
       .then(partoData => {
         setParto(partoData);
-        // Asegurarse que las madres están cargadas para encontrar la correcta
-        if (dataState.madres.data.length === 0) {
-          fetchMadres();
-        }
+        return apiGetMadreById(partoData.madre); // La API devuelve `parto.madre` como ID
       })
+      .then(setMadre)
       .catch(err => console.error(err))
       .finally(() => setIsLoading(false));
-  }, [partoId, dataState.madres.data.length, fetchMadres]);
-
-  // Encontrar la madre cuando los datos estén listos
-  useEffect(() => {
-    if (parto && dataState.madres.data.length > 0) {
-      const madreEncontrada = dataState.madres.data.find(m => m.id === parto.madre); // Asumiendo que la API devuelve `parto.madre` como ID
-      setMadre(madreEncontrada);
-    }
-  }, [parto, dataState.madres.data]);
+  }, [partoId]);
 
   const handleGuardar = async (datosActualizados) => {
     try {
@@ -1,33 +1,26 @@
 // src/pages/EpicrisisPage.js
 import React, { useEffect, useState } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
-import { useData } from '../hooks/useData';
-import { apiGetPartoById } from '../services/api';
+import { apiGetMadreById, apiGetPartoById } from '../services/api';
 import EpicrisisMedica from '../components/EpicrisisMedica';
 // import { apiCreateEpicrisis } from '../services/api'; // Asumir que existe
 
 const EpicrisisPage = () => {
   const { partoId } = useParams();
   const navigate = useNavigate();
-  const { state, fetchMadres } = useData();
-  
   const [parto, setParto] = useState(null);
   const [madre, setMadre] = useState(null);
 
   useEffect(() => {
+    // Parto y madre por ID: la lista de madres del estado global es solo una página.
     apiGetPartoById(partoId)
       .then(partoData => {
         setParto(partoData);
-        if (state.madres.data.length === 0) fetchMadres();
+        return apiGetMadreById(partoData.madre);
       })
+      .then(setMadre)
       .catch(err => console.error(err));
-  }, [partoId, state.madres.data.length, fetchMadres]);
-
-  useEffect(() => {
-    if (parto && state.madres.data.length > 0) {
-      setMadre(state.madres.data.find(m => m.id === parto.madre));
-    }
-  }, [parto, state.madres.data]);
+  }, [partoId]);
 
   const handleGuardar = async (datosEpicrisis) => {
     try {
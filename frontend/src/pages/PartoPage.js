@@ -2,6 +2,7 @@
 import React, { useEffect, useState } from 'react';
 import { useData } from '../hooks/useData';
 import { useParams, useNavigate } from 'react-router-dom';
+import { apiGetMadreById } from '../services/api'; // Usamos la API directo para 1 solo item
 
 // Asumimos que el formulario de parto está en un componente reutilizable
 // import FormularioParto from '../components/FormularioParto'; 
@@ -9,26 +10,18 @@ import { useParams, useNavigate } from 'react-router-dom';
 
 const PartoPage = () => {
   const { madreId } = useParams();
-  const { state, fetchMadres, addParto } = useData();
+  const { addParto } = useData();
   const navigate = useNavigate();
   
   const [madre, setMadre] = useState(null);
   
-  // Buscar la madre en el estado global, o fetchearla si no existe
+  // Cargar la madre por ID: la lista del estado global es solo una página
+  // (las más recientes) y puede no incluirla.
   useEffect(() => {
-    const madreExistente = state.madres.data.find(m => m.id === madreId);
-    if (madreExistente) {
-      setMadre(madreExistente);
-    } else {
-      // Opcional: fetchear madre por ID si no está en el contexto
-      // apiGetMadreById(madreId).then(setMadre);
-    }
-    
-    // Asegurarse de que las madres estén cargadas
-    if (state.madres.data.length === 0) {
-      fetchMadres();
-    }
-  }, [madreId, state.madres.data, fetchMadres]);
+    apiGetMadreById(madreId)
+      .then(setMadre)
+      .catch(err => console.error(err));
+  }, [madreId]);
   
   const handleGuardarParto = async (datosParto) => {
     try {
@@ -2,7 +2,7 @@
 import React, { useEffect, useState } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { useData } from '../hooks/useData';
-import { apiGetMadreById } from '../services/api'; // Asumiendo que existe
+import { apiGetMadreById } from '../services/api';
 import Partograma from '../components/Partograma';
 // Asumimos que la API tiene un endpoint para guardar partogramas
 // import { apiCreatePartograma } from '../services/api';
@@ -10,20 +10,17 @@ import Partograma from '../components/Partograma';
 const PartogramaPage = () => {
   const { madreId } = useParams();
   const navigate = useNavigate();
-  const { state, fetchMadres } = useData();
+  const { state } = useData();
   
   const [madre, setMadre] = useState(null);
 
+  // Cargar la madre por ID: la lista del estado global es solo una página
+  // (las más recientes) y puede no incluirla.
   useEffect(() => {
-    const madreExistente = state.madres.data.find(m => m.id === madreId);
-    if (madreExistente) {
-      setMadre(madreExistente);
-    } else {
-      // apiGetMadreById(madreId).then(setMadre);
-      // Por ahora, solo buscamos en el estado
-      if(state.madres.data.length === 0) fetchMadres();
-    }
-  }, [madreId, state.madres.data, fetchMadres]);
+    apiGetMadreById(madreId)
+      .then(setMadre)
+      .catch(err => console.error(err));
+  }, [madreId]);
 
   const handleGuardar = async (datosPartograma) => {
     try {
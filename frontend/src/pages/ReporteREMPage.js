@@ -1,21 +1,30 @@
 // src/pages/ReporteREMPage.js
-import React, { useEffect } from 'react';
-import { useData } from '../hooks/useData';
+import React, { useCallback, useEffect, useState } from 'react';
 import ReporteREM from '../components/ReporteREM'; // Tu componente
-import { useAuthRBAC } from '../hooks/useAuthRBAC';
+import { apiGetReporteREM } from '../services/api';
 
 const ReporteREMPage = () => {
-  const { state, fetchMadres, fetchPartos } = useData();
-  const { usuario } = useAuthRBAC();
+  const [reporte, setReporte] = useState(null);
+  const [isLoading, setIsLoading] = useState(false);
+  const [error, setError] = useState(null);
 
-  useEffect(() => {
-    // Los reportes necesitan todos los datos, así que los cargamos
-    fetchMadres();
-    fetchPartos();
-    // Aquí podrías registrar en auditoría que se accedió a la página de reportes
-  }, [fetchMadres, fetchPartos, usuario]);
+  // El servidor calcula los agregados (con el filtro por turno del usuario);
+  // sin rango, el mes en curso.
+  const generarReporte = useCallback(async (desde, hasta) => {
+    setIsLoading(true);
+    setError(null);
+    try {
+      setReporte(await apiGetReporteREM(desde, hasta));
+    } catch (err) {
+      setError(err.message);
+    } finally {
+      setIsLoading(false);
+    }
+  }, []);
 
-  const isLoading = state.madres.isLoading || state.partos.isLoading;
+  useEffect(() => {
+    generarReporte();
+  }, [generarReporte]);
 
   return (
     <div className="animacion-entrada">
@@ -32,16 +41,14 @@ const ReporteREMPage = () => {
           </p>
         </div>
 
-      {isLoading ? (
-        <div className="tarjeta texto-centro">Cargando datos para el reporte...</div>
-      ) : (
-        <ReporteREM 
-          partos={state.partos.data} 
-          madres={state.madres.data} 
-        />
-      )}
+      <ReporteREM
+        reporte={reporte}
+        isLoading={isLoading}
+        error={error}
+        onGenerar={generarReporte}
+      />
     </div>
   );
 };
 
-export default ReporteREMPage;
\ No newline at end of file
+export default ReporteREMPage;
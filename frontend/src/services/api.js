@@ -205,6 +205,15 @@ export const apiCreateParto = (data) => request('/api/partos/partos/', { method:
 export const apiUpdateParto = (id, data) => request(`/api/partos/partos/${id}/`, { method: 'PATCH', body: JSON.stringify(data) }); // CORREGIDO
 export const apiAnexarCorreccion = (id, data) => request(`/api/partos/partos/${id}/anexar_correccion/`, { method: 'POST', body: JSON.stringify(data) }); // CORREGIDO
 
+// Reporte REM: agregados calculados en el servidor (desde/hasta en AAAA-MM-DD; sin rango, el mes en curso)
+export const apiGetReporteREM = (desde, hasta) => {
+  const params = {};
+  if (desde) params.desde = desde;
+  if (hasta) params.hasta = hasta;
+  const query = new URLSearchParams(params).toString();
+  return request(`/api/partos/reportes/rem/?${query}`);
+};
+
 // 4. Recién Nacidos (Prefijo: /api/partos/)
 export const apiGetRecienNacidos = (params = {}) => {
   const query = new URLSearchParams(params).toString();